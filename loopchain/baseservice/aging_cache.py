@@ -13,44 +13,34 @@
 # limitations under the License.
 """Custom Dictionary type that has limit size by timestamp"""
 
+import sys
 import threading
 import time
 
-from collections import OrderedDict, MutableMapping
+from collections import OrderedDict, MutableMapping, defaultdict
+from typing import Any, DefaultDict
 
 
 class AgingCacheItem:
-    def __init__(self, value, timestamp_seconds, status):
-        self.__value = value
-        self.__timestamp_seconds = timestamp_seconds
-        self.__status = status
+    __slots__ = ("value", "timestamp_seconds", "status", "monotonic_seconds")
 
-    @property
-    def value(self):
-        return self.__value
-
-    @value.setter
-    def value(self, value):
-        self.__value = value
-
-    @property
-    def timestamp_seconds(self):
-        return self.__timestamp_seconds
-
-    @timestamp_seconds.setter
-    def timestamp_seconds(self, timestamp_seconds):
-        self.__timestamp_seconds = timestamp_seconds
+    def __init__(self, value, timestamp_seconds, status, monotonic_seconds=0):
+        self.value = value
+        self.timestamp_seconds = timestamp_seconds
+        self.status = status
+        self.monotonic_seconds = monotonic_seconds
 
-    @property
-    def status(self):
-        return self.__status
 
-    @status.setter
-    def status(self, status):
-        self.__status = status
+class AgingCache(MutableMapping):
+    """Dictionary whose items are removed after `max_age_seconds`.
 
+    Keys are also indexed by the status of items in order, so the first item in a status is found in O(1).
+    An item goes to the end of the order in its status when its status is changed or it is accessed.
 
-class AgingCache(MutableMapping):
+    Items are kept in the order they are set, not accessed, so aged items are always the leading ones
+    and they are evicted at once by the monotonic clock when a new key is set.
+    The status index is the only container besides the items, see `get_memory_status`.
+    """
     DEFAULT_ITEM_STATUS = 1  # recommend replace this with custom Enum Type
 
     def __init__(self, max_age_seconds, items=None, default_item_status=DEFAULT_ITEM_STATUS):
@@ -58,80 +48,134 @@ class AgingCache(MutableMapping):
         self._max_age_seconds = max_age_seconds
         self._lock = threading.Lock()
 
-        now_timestamp_seconds = int(time.time())
         self.d = OrderedDict()
+        self.__status_keys: DefaultDict[Any, OrderedDict] = defaultdict(OrderedDict)  # {status: {key: None}}
         if items:
             for k, v in items:
-                self[k] = AgingCacheItem(v, now_timestamp_seconds, self.__default_item_status)
+                self[k] = v
 
     @property
     def max_age_seconds(self):
         return self._max_age_seconds
 
     def pop_item(self):
-        return self.d.popitem(last=False)[1].value
+        with self._lock:
+            key, item = self.d.popitem(last=False)
+            self.__unindex(key, item.status)
+            return item.value
 
     def pop_item_in_status(self, status=DEFAULT_ITEM_STATUS):
         with self._lock:
-            operator = (key for key, value in self.d.items() if value.status == status)
-            key = next(operator, None)
+            key = self.__first_key_in_status(status)
+            if key is None:
+                return None
 
-            return None if key is None else self.d.pop(key)
+            item = self.d.pop(key)
+            self.__unindex(key, status)
+            return item
 
     def get_item_in_status(self, get_status, set_status):
         with self._lock:
-            operator = (value for value in self.d.values() if value.status == get_status)
-            item = next(operator, None)
+            key = self.__first_key_in_status(get_status)
+            if key is None:
+                return None
 
-            if item:
-                item.status = set_status
-                return item.value
-
-            return None
+            item = self.d[key]
+            if get_status != set_status:
+                self.__set_status(key, item, set_status)
+            return item.value
 
     def get_item_status(self, key):
         return self.d[key].status
 
     def set_item_status(self, key, status):
-        self.d[key].status = status
+        with self._lock:
+            self.__set_status(key, self.d[key], status)
 
     def set_item_status_by_time(self, timestamp_seconds, status):
         with self._lock:
-            for value in self.d.values():
+            for key, value in self.d.items():
                 if value.timestamp_seconds < timestamp_seconds:
-                    value.status = status
+                    self.__set_status(key, value, status)
                 else:
                     break
 
     def is_empty_in_status(self, status):
-        return not self.get_item_in_status(status, status)
+        with self._lock:
+            return self.__first_key_in_status(status) is None
 
-    def __first_item(self):
-        return next(iter(self.d.items()))[1]
+    def count_in_status(self, status):
+        with self._lock:
+            return len(self.__status_keys.get(status, ()))
+
+    def clear(self):
+        with self._lock:
+            self.d.clear()
+            self.__status_keys.clear()
+
+    def get_memory_status(self) -> dict:
+        """Get sizes of the containers of this cache. Sizes of keys and values are not included."""
+        with self._lock:
+            items_bytes = sys.getsizeof(self.d) + sys.getsizeof(AgingCacheItem(None, 0, None)) * len(self.d)
+            status_index_bytes = sys.getsizeof(self.__status_keys) + sum(
+                sys.getsizeof(keys) for keys in self.__status_keys.values())
+            return {
+                "items": len(self.d),
+                "statuses": len(self.__status_keys),
+                "items_bytes": items_bytes,
+                "status_index_bytes": status_index_bytes,
+                "overhead_bytes": items_bytes + status_index_bytes
+            }
+
+    def __first_key_in_status(self, status):
+        keys = self.__status_keys.get(status)
+        return next(iter(keys), None) if keys else None
+
+    def __set_status(self, key, item: AgingCacheItem, status):
+        self.__unindex(key, item.status)
+        item.status = status
+        self.__status_keys[status][key] = None
+
+    def __unindex(self, key, status):
+        keys = self.__status_keys[status]
+        del keys[key]
+        if not keys:
+            del self.__status_keys[status]
+
+    def __expire(self, now_monotonic_seconds: int):
+        while self.d:
+            key, item = next(iter(self.d.items()))
+            if item.monotonic_seconds + self._max_age_seconds > now_monotonic_seconds:
+                break
+
+            self.d.popitem(last=False)
+            self.__unindex(key, item.status)
 
     def __getitem__(self, key):
         with self._lock:
-            self.d.move_to_end(key)
-            return self.d[key].value
+            item = self.d[key]
+            self.__status_keys[item.status].move_to_end(key)
+            return item.value
 
     def __setitem__(self, key, value):
         now_timestamp_seconds = int(time.time())
+        now_monotonic_seconds = int(time.monotonic())
 
         with self._lock:
             if key in self.d:
                 self.d.move_to_end(key)
+                self.__unindex(key, self.d[key].status)
             else:
-                try:
-                    while self.__first_item().timestamp_seconds + self._max_age_seconds <= now_timestamp_seconds:
-                        self.d.popitem(last=False)
-                except StopIteration:
-                    # self.d is empty
-                    pass
+                self.__expire(now_monotonic_seconds)
 
-            self.d[key] = AgingCacheItem(value, int(time.time()), self.__default_item_status)
+            self.d[key] = AgingCacheItem(value, now_timestamp_seconds, self.__default_item_status,
+                                         now_monotonic_seconds)
+            self.__status_keys[self.__default_item_status][key] = None
 
     def __delitem__(self, key):
-        del self.d[key]
+        with self._lock:
+            item = self.d.pop(key)
+            self.__unindex(key, item.status)
 
     def __iter__(self):
         return iter(self.d)
@@ -14,6 +14,8 @@
 """gRPC broadcast thread"""
 
 import abc
+import heapq
+import itertools
 import logging
 import multiprocessing as mp
 import os
@@ -29,8 +31,9 @@ import grpc
 from grpc._channel import _Rendezvous
 
 from loopchain import configure as conf, utils as util
-from loopchain.baseservice import StubManager, ObjectManager, CommonThread, BroadcastCommand, \
+from loopchain.baseservice import StubManager, PeerHealth, ObjectManager, CommonThread, BroadcastCommand, \
     TimerService, Timer
+from loopchain.baseservice.timer_service import OffType
 from loopchain.baseservice.module_process import ModuleProcess, ModuleProcessProperties
 from loopchain.baseservice.tx_item_helper import TxItem
 from loopchain.protos import loopchain_pb2_grpc, loopchain_pb2
@@ -41,10 +44,41 @@ class PeerThreadStatus(Enum):
     leader_complained = 1
 
 
+class _BroadcastRequest:
+    """A broadcast message to a target. It is retried until its retry times or deadline run out."""
+
+    def __init__(self, method_name, method_param, priority: int, retry_times: int, timeout):
+        self.method_name = method_name
+        self.method_param = method_param
+        self.priority = priority
+        self.retry_times = retry_times
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout * (retry_times + 1)
+        self.is_stub_reuse = True
+
+    def remain_time(self) -> float:
+        return self.deadline - time.monotonic()
+
+
 class _Broadcaster:
-    """broadcast class for each channel"""
+    """broadcast class for each channel
+
+    In async broadcast, requests to each target wait in a priority queue of the target,
+    and at most `conf.MAX_BROADCAST_IN_FLIGHT_PER_TARGET` requests of a target are in flight.
+    """
     THREAD_VARIABLE_PEER_STATUS = "peer_status"
 
+    # Lower is sent first, so votes and blocks are not delayed by tx relays to the same target.
+    BROADCAST_PRIORITIES = {
+        "AnnounceUnconfirmedBlock": 0,
+        "VoteUnconfirmedBlock": 0,
+        "BroadcastVote": 0,
+        "ComplainLeader": 0,
+        "AddTx": 10,
+        "AddTxList": 10
+    }
+    DEFAULT_BROADCAST_PRIORITY = 5
+
     def __init__(self, channel: str, self_target: str=None):
         self.__channel = channel
         self.__self_target = self_target
@@ -71,7 +105,18 @@ class _Broadcaster:
             "BroadcastVote"
         }
 
+        self.__pending_requests = {}  # {peer_target: [(priority, sequence, request), ...]} heap
+        self.__in_flight_counts = {}  # {peer_target: count of requests in flight}
+        self.__request_sequence = itertools.count()
+        self.__requests_lock = threading.Lock()
+
         self.stored_tx = queue.Queue()
+        self.__overflowed_tx_item: TxItem = None  # tx item which did not fit the last tx list. It is sent first.
+        self.__tx_list_lock = threading.Lock()
+
+        # EWMA of intervals between txs, which decides how long txs wait to be sent together
+        self.__tx_interval = conf.SEND_TX_LIST_DURATION
+        self.__last_tx_time = None
 
         self.__timer_service = TimerService()
 
@@ -96,57 +141,111 @@ class _Broadcaster:
                and result.code() in (grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.UNAVAILABLE) \
                and stub_manager.elapsed_last_succeed_time() < timeout
 
-    def __broadcast_retry_async(self, peer_target, method_name, method_param, retry_times, timeout, stub, result):
-        if isinstance(result, _Rendezvous) and result.code() == grpc.StatusCode.OK:
-            return
-        if isinstance(result, futures.Future) and not result.exception():
-            return
+    @staticmethod
+    def __is_succeeded(result):
+        if isinstance(result, _Rendezvous):
+            return result.code() == grpc.StatusCode.OK
+        if isinstance(result, futures.Future):
+            return not result.exception()
+        return False
+
+    def __put_request(self, peer_target, request: _BroadcastRequest):
+        with self.__requests_lock:
+            requests = self.__pending_requests.setdefault(peer_target, [])
+            heapq.heappush(requests, (request.priority, next(self.__request_sequence), request))
+        self.__send_pending_requests(peer_target)
+
+    def __pop_request_to_send(self, peer_target):
+        """Pop the most urgent request which can be sent in the in-flight window of the target.
+
+        Requests other than the most urgent ones, whose priority is 0, leave a slot of the window for them.
+        Expired requests are dropped instead of being sent.
+        """
+        max_in_flight = max(conf.MAX_BROADCAST_IN_FLIGHT_PER_TARGET, 2)
+        with self.__requests_lock:
+            requests = self.__pending_requests.get(peer_target)
+            while requests:
+                priority, _, request = requests[0]
+                in_flight_count = self.__in_flight_counts.get(peer_target, 0)
+                limit = max_in_flight if priority == 0 else max_in_flight - 1
+                if in_flight_count >= limit:
+                    return None
+
+                heapq.heappop(requests)
+                if request.remain_time() <= 0:
+                    logging.debug(f"broadcast_thread:__pop_request_to_send drop expired request "
+                                  f"method_name({request.method_name}) peer_target({peer_target})")
+                    continue
 
-        logging.debug(f"try retry to : peer_target({peer_target})\n")
-        if retry_times > 0:
-            try:
-                stub_manager: StubManager = self.__audience[peer_target]
-                if stub_manager is None:
-                    logging.warning(f"broadcast_thread:__broadcast_retry_async Failed to connect to ({peer_target}).")
-                    return
-                retry_times -= 1
-                is_stub_reuse = stub_manager.stub != stub or self.__keep_grpc_connection(result, timeout, stub_manager)
-                self.__call_async_to_target(peer_target, method_name, method_param, is_stub_reuse, retry_times, timeout)
-            except KeyError as e:
-                logging.debug(f"broadcast_thread:__broadcast_retry_async ({peer_target}) not in audience. ({e})")
-        else:
-            if isinstance(result, _Rendezvous):
-                exception = result.details()
-            elif isinstance(result, futures.Future):
-                exception = result.exception()
-
-            logging.warning(f"__broadcast_run_async fail({result})\n"
-                            f"cause by: {exception}\n"
-                            f"peer_target({peer_target})\n"
-                            f"method_name({method_name})\n"
-                            f"retry_remains({retry_times})\n"
-                            f"timeout({timeout})")
-
-    def __call_async_to_target(self, peer_target, method_name, method_param, is_stub_reuse, retry_times, timeout):
-        try:
-            stub_manager: StubManager = self.__audience[peer_target]
-            if stub_manager is None:
-                logging.debug(f"broadcast_thread:__call_async_to_target Failed to connect to ({peer_target}).")
+                self.__in_flight_counts[peer_target] = in_flight_count + 1
+                return request
+            return None
+
+    def __release_in_flight(self, peer_target):
+        with self.__requests_lock:
+            in_flight_count = self.__in_flight_counts.get(peer_target, 0) - 1
+            if in_flight_count > 0:
+                self.__in_flight_counts[peer_target] = in_flight_count
+            else:
+                self.__in_flight_counts.pop(peer_target, None)
+
+    def __send_pending_requests(self, peer_target):
+        while True:
+            request = self.__pop_request_to_send(peer_target)
+            if request is None:
                 return
-            call_back_partial = partial(self.__broadcast_retry_async,
-                                        peer_target,
-                                        method_name,
-                                        method_param,
-                                        retry_times,
-                                        timeout,
-                                        stub_manager.stub)
-            stub_manager.call_async(method_name=method_name,
-                                    message=method_param,
-                                    is_stub_reuse=is_stub_reuse,
-                                    call_back=call_back_partial,
-                                    timeout=timeout)
-        except KeyError as e:
-            logging.debug(f"broadcast_thread:__call_async_to_target ({peer_target}) not in audience. ({e})")
+            if not self.__call_async_to_target(peer_target, request):
+                self.__release_in_flight(peer_target)
+
+    def __broadcast_done_async(self, peer_target, request: _BroadcastRequest, stub, result):
+        self.__release_in_flight(peer_target)
+        if not self.__is_succeeded(result):
+            self.__retry_async(peer_target, request, stub, result)
+        self.__send_pending_requests(peer_target)
+
+    def __retry_async(self, peer_target, request: _BroadcastRequest, stub, result):
+        stub_manager: StubManager = self.__audience.get(peer_target)
+        if request.retry_times > 0 and request.remain_time() > 0 and stub_manager is not None:
+            logging.debug(f"try retry to : peer_target({peer_target})\n")
+            request.retry_times -= 1
+            request.is_stub_reuse = \
+                stub_manager.stub != stub or self.__keep_grpc_connection(result, request.timeout, stub_manager)
+            self.__put_request(peer_target, request)
+            return
+
+        exception = None
+        if isinstance(result, _Rendezvous):
+            exception = result.details()
+        elif isinstance(result, futures.Future):
+            exception = result.exception()
+
+        logging.warning(f"__broadcast_run_async fail({result})\n"
+                        f"cause by: {exception}\n"
+                        f"peer_target({peer_target})\n"
+                        f"method_name({request.method_name})\n"
+                        f"retry_remains({request.retry_times})\n"
+                        f"remain_time({request.remain_time()})")
+
+    def __call_async_to_target(self, peer_target, request: _BroadcastRequest) -> bool:
+        """Call the request to the target. The timeout of the call is limited by the deadline of the request.
+
+        :return: False if the call is not made and its callback will not be called
+        """
+        stub_manager: StubManager = self.__audience.get(peer_target)
+        if stub_manager is None:
+            logging.debug(f"broadcast_thread:__call_async_to_target ({peer_target}) not in audience.")
+            return False
+
+        call_back_partial = partial(self.__broadcast_done_async,
+                                    peer_target,
+                                    request,
+                                    stub_manager.stub)
+        future = stub_manager.call_async(method_name=request.method_name,
+                                         message=request.method_param,
+                                         is_stub_reuse=request.is_stub_reuse,
+                                         call_back=call_back_partial,
+                                         timeout=min(request.timeout, request.remain_time()))
+        return future is not None
 
     def __broadcast_run_async(self, method_name, method_param, retry_times=None, timeout=None):
         """call gRPC interface of audience
@@ -159,11 +258,13 @@ class _Broadcaster:
             timeout = conf.GRPC_TIMEOUT_BROADCAST_RETRY
 
         retry_times = conf.BROADCAST_RETRY_TIMES if retry_times is None else retry_times
+        priority = self.BROADCAST_PRIORITIES.get(method_name, self.DEFAULT_BROADCAST_PRIORITY)
         # logging.debug(f"broadcast({method_name}) async... ({len(self.__audience)})")
 
         for target in self.__get_broadcast_targets(method_name):
             # util.logger.debug(f"method_name({method_name}), peer_target({target})")
-            self.__call_async_to_target(target, method_name, method_param, True, retry_times, timeout)
+            request = _BroadcastRequest(method_name, method_param, priority, retry_times, timeout)
+            self.__put_request(target, request)
 
     def __broadcast_run_sync(self, method_name, method_param, retry_times=None, timeout=None):
         """call gRPC interface of audience
@@ -199,7 +300,9 @@ class _Broadcaster:
         method_name = param[0]
         method_param = param[1]
         target = param[2]
-        self.__call_async_to_target(target, method_name, method_param, True, 0, conf.GRPC_TIMEOUT_BROADCAST_RETRY)
+        priority = self.BROADCAST_PRIORITIES.get(method_name, self.DEFAULT_BROADCAST_PRIORITY)
+        request = _BroadcastRequest(method_name, method_param, priority, 0, conf.GRPC_TIMEOUT_BROADCAST_RETRY)
+        self.__put_request(target, request)
 
     def __add_audience(self, audience_target):
         util.logger.debug(f"audience_target({audience_target})")
@@ -219,6 +322,9 @@ class _Broadcaster:
 
         for old_audience_target in old_audience:
             old_stubmanager: StubManager = self.__audience.pop(old_audience_target, None)
+            with self.__requests_lock:
+                self.__pending_requests.pop(old_audience_target, None)
+            PeerHealth.remove([old_audience_target])
             # TODO If necessary, close grpc with old_stubmanager. If not necessary just remove this comment.
 
     def __handler_broadcast(self, broadcast_param):
@@ -231,24 +337,33 @@ class _Broadcaster:
         self.__broadcast_run(broadcast_method_name, broadcast_method_param, **broadcast_method_kwparam)
 
     def __make_tx_list_message(self):
+        """Pack stored txs into a TxSendList by their encoded sizes.
+
+        :return: whether txs remain in the queue, and the message
+        """
         tx_list = []
-        tx_list_size = 0
-        tx_list_count = 0
-        remains = False
-        while not self.stored_tx.empty():
-            stored_tx_item = self.stored_tx.get()
-            tx_list_size += len(stored_tx_item)
-            tx_list_count += 1
-            if tx_list_size >= conf.MAX_TX_SIZE_IN_BLOCK or tx_list_count >= conf.MAX_TX_COUNT_IN_ADDTX_LIST:
-                self.stored_tx.put(stored_tx_item)
-                remains = True
+        tx_list_size = 2 + len(self.__channel.encode())
+        while len(tx_list) < conf.MAX_TX_COUNT_IN_ADDTX_LIST:
+            if self.__overflowed_tx_item is not None:
+                stored_tx_item, self.__overflowed_tx_item = self.__overflowed_tx_item, None
+            else:
+                try:
+                    stored_tx_item = self.stored_tx.get_nowait()
+                except queue.Empty:
+                    break
+
+            if tx_list and tx_list_size + len(stored_tx_item) > conf.MAX_TX_SIZE_IN_BLOCK:
+                self.__overflowed_tx_item = stored_tx_item
                 break
+            tx_list_size += len(stored_tx_item)
             tx_list.append(stored_tx_item.get_tx_message())
+
         message = loopchain_pb2.TxSendList(
             channel=self.__channel,
             tx_list=tx_list
         )
 
+        remains = self.__overflowed_tx_item is not None or not self.stored_tx.empty()
         return remains, message
 
     def __send_tx_by_timer(self, **kwargs):
@@ -262,8 +377,10 @@ class _Broadcaster:
             # self.__broadcast_run("AddTx", stored_tx_item.get_tx_message())
 
             # Send multiple tx
-            remains, message = self.__make_tx_list_message()
-            self.__broadcast_run("AddTxList", message)
+            with self.__tx_list_lock:
+                remains, message = self.__make_tx_list_message()
+            if message.tx_list:
+                self.__broadcast_run("AddTxList", message)
             if remains:
                 self.__send_tx_in_timer()
 
@@ -272,7 +389,7 @@ class _Broadcaster:
         duration = 0
         if tx_item:
             self.stored_tx.put(tx_item)
-            duration = conf.SEND_TX_LIST_DURATION
+            duration = self.__get_send_tx_duration()
 
         if TimerService.TIMER_KEY_ADD_TX not in self.__timer_service.timer_list:
             self.__timer_service.add_timer(
@@ -284,8 +401,28 @@ class _Broadcaster:
                     callback_kwargs={}
                 )
             )
-        else:
-            pass
+        elif self.stored_tx.qsize() >= conf.MAX_TX_COUNT_IN_ADDTX_LIST:
+            # A full tx list does not need to wait for the timer.
+            self.__timer_service.stop_timer(TimerService.TIMER_KEY_ADD_TX, OffType.time_out)
+
+    def __get_send_tx_duration(self) -> float:
+        """Return how long stored txs wait to be sent together.
+
+        Txs are sent almost immediately when they arrive sparsely, because waiting does not gather more txs.
+        Otherwise they wait until a tx list is expected to be full, but not longer than `SEND_TX_LIST_DURATION`.
+        """
+        now = time.monotonic()
+        if self.__last_tx_time is not None:
+            interval = min(now - self.__last_tx_time, conf.SEND_TX_LIST_DURATION)
+            self.__tx_interval += conf.SEND_TX_LIST_INTERVAL_WEIGHT * (interval - self.__tx_interval)
+        self.__last_tx_time = now
+
+        if self.__tx_interval * 2 > conf.SEND_TX_LIST_DURATION:
+            return conf.SEND_TX_LIST_MIN_DURATION
+
+        remain_count = max(conf.MAX_TX_COUNT_IN_ADDTX_LIST - self.stored_tx.qsize(), 0)
+        return max(min(remain_count * self.__tx_interval, conf.SEND_TX_LIST_DURATION),
+                   conf.SEND_TX_LIST_MIN_DURATION)
 
     def __handler_create_tx(self, create_tx_param):
         # logging.debug(f"Broadcast create_tx....")
@@ -300,8 +437,8 @@ class _Broadcaster:
         self.__send_tx_in_timer(tx_item)
 
     def __get_broadcast_targets(self, method_name):
-
-        peer_targets = list(self.__audience)
+        """Return the targets from the healthiest, so slow peers do not delay the others in sync broadcast."""
+        peer_targets = PeerHealth.sort_targets(self.__audience)
         if self.__self_target is not None and method_name not in self.__broadcast_with_self_target_methods:
             peer_targets.remove(self.__self_target)
         return peer_targets
@@ -31,7 +31,8 @@ from loopchain import utils
 from loopchain.baseservice import ObjectManager, TimerService, Timer
 from loopchain.blockchain import AnnounceNewBlockError
 from loopchain.blockchain.blocks import BlockSerializer, BlockVerifier
-from loopchain.blockchain.votes import Votes
+from loopchain.blockchain.transactions import TransactionVerifier
+from loopchain.blockchain.votes import Vote, Votes
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.protos import message_code
 
@@ -53,6 +54,11 @@ class UnregisteredException(Exception):
     pass
 
 
+class SubscribeRejectedException(UnregisteredException):
+    """The rs target answered the subscribe request with a JSON-RPC error. e.g. it does not know a param."""
+    pass
+
+
 def convert_response_to_dict(response: bytes) -> dict:
     response_dict: dict = json.loads(response)
     response_dict = _check_error_in_response(response_dict)
@@ -61,6 +67,10 @@ def convert_response_to_dict(response: bytes) -> dict:
 
 
 def _check_error_in_response(response_dict: dict) -> dict:
+    if 'error' in response_dict:
+        # Only the subscribe request is sent to the rs target, so an error response is the answer to it.
+        raise SubscribeRejectedException(f"Subscribe request is rejected by rs target: {response_dict['error']}")
+
     params = response_dict.get('params')
     if params and 'error' in params:
         error_msg = params.get('error') or f"Error sent from rs target: {params}"
@@ -80,9 +90,12 @@ class NodeSubscriber:
         self._exception = None
         self._websocket: WebSocketClientProtocol = None
         self._subscribe_event: Event = None
+        # Subscribe with catchUp until the rs target rejects it. Targets of earlier releases do not know it.
+        self._catch_up = True
 
         ws_methods.add(self.node_ws_PublishHeartbeat)
         ws_methods.add(self.node_ws_PublishNewBlock)
+        ws_methods.add(self.node_ws_PublishNewBlocks)
 
         logging.debug(f"websocket target uri : {self._target_uri}")
 
@@ -102,7 +115,15 @@ class NodeSubscriber:
     async def start(self, event, block_height):
         self._subscribe_event = event
         await self._prepare_connection()
-        await self._handshake(block_height)
+        try:
+            await self._handshake(block_height)
+        except SubscribeRejectedException as e:
+            if not self._catch_up:
+                raise
+            logging.info(f"Subscribe again without catchUp, because the request is rejected: {e}")
+            self._catch_up = False
+            await self._prepare_connection()
+            await self._handshake(block_height)
         await self._run()
 
     async def _prepare_connection(self):
@@ -127,11 +148,10 @@ class NodeSubscriber:
             self._subscribe_event.set()
 
     async def _subscribe_request(self, block_height):
-        request = Request(
-            method="node_ws_Subscribe",
-            height=block_height,
-            peer_id=ChannelProperty().peer_id
-        )
+        params = dict(height=block_height, peer_id=ChannelProperty().peer_id)
+        if self._catch_up:
+            params["catchUp"] = True  # This citizen accepts consecutive blocks at once by node_ws_PublishNewBlocks.
+        request = Request(method="node_ws_Subscribe", **params)
         await self._websocket.send(json.dumps(request))
 
     async def _recv_until_timeout(self):
@@ -163,6 +183,50 @@ class NodeSubscriber:
 
     async def node_ws_PublishNewBlock(self, **kwargs):
         block_dict, votes_dumped = kwargs.get('block'), kwargs.get('confirm_info', '')
+        try:
+            confirmed_block, vote = self._deserialize_new_block(block_dict, votes_dumped)
+            self._add_new_block(confirmed_block, vote, votes_dumped)
+        finally:
+            ObjectManager().channel_service.reset_block_monitoring_timer()
+
+    async def node_ws_PublishNewBlocks(self, **kwargs):
+        """Add consecutive blocks which are announced at once to catch up a lagging citizen.
+
+        Blocks are deserialized and their signatures are verified in the executor in advance,
+        while previous blocks are being verified and added in height order.
+
+        :param kwargs: blocks=[{"block": block_dict, "confirm_info": votes_dumped}, ...]
+        """
+        loop = asyncio.get_event_loop()
+        futures = [loop.run_in_executor(None, self._prepare_new_block,
+                                        new_block.get('block'), new_block.get('confirm_info', ''))
+                   for new_block in kwargs.get('blocks') or []]
+        try:
+            for future in futures:
+                try:
+                    confirmed_block, vote, votes_dumped = await future
+                except Exception as e:
+                    self._exception = AnnounceNewBlockError(f"error: {type(e)}, message: {str(e)}")
+                    break
+                if not self._add_new_block(confirmed_block, vote, votes_dumped):
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            ObjectManager().channel_service.reset_block_monitoring_timer()
+
+    def _prepare_new_block(self, block_dict: dict, votes_dumped):
+        confirmed_block, vote = self._deserialize_new_block(block_dict, votes_dumped)
+        if confirmed_block is not None:
+            blockchain = ObjectManager().channel_service.block_manager.blockchain
+            TransactionVerifier.verify_signatures(confirmed_block.body.transactions.values(),
+                                                  blockchain.tx_versioner)
+            if isinstance(vote, list):
+                Vote.verify_many(vote)
+        return confirmed_block, vote, votes_dumped
+
+    @staticmethod
+    def _deserialize_new_block(block_dict: dict, votes_dumped):
         try:
             votes_serialized = json.loads(votes_dumped)
             vote = Votes.get_block_votes_class(block_dict["version"]).deserialize_votes(votes_serialized)
@@ -174,26 +238,40 @@ class NodeSubscriber:
         if new_block_height > blockchain.block_height:
             block_version = blockchain.block_versioner.get_version(new_block_height)
             block_serializer = BlockSerializer.new(block_version, blockchain.tx_versioner)
-            confirmed_block = block_serializer.deserialize(block_dict)
-
-            block_verifier = BlockVerifier.new(block_version, blockchain.tx_versioner)
-            block_verifier.invoke_func = blockchain.score_invoke
-            reps_getter = blockchain.find_preps_addresses_by_roothash
-            try:
-                block_verifier.verify(confirmed_block,
-                                      blockchain.last_block,
-                                      blockchain,
-                                      generator=blockchain.get_expected_generator(confirmed_block),
-                                      reps_getter=reps_getter)
-            except Exception as e:
-                self._exception = AnnounceNewBlockError(f"error: {type(e)}, message: {str(e)}")
-            else:
-                logging.debug(f"add_confirmed_block height({confirmed_block.header.height}), "
-                              f"hash({confirmed_block.header.hash.hex()}), votes_dumped({votes_dumped})")
-                ObjectManager().channel_service.block_manager.add_confirmed_block(confirmed_block=confirmed_block,
-                                                                                  confirm_info=vote)
-            finally:
-                ObjectManager().channel_service.reset_block_monitoring_timer()
+            return block_serializer.deserialize(block_dict), vote
+        return None, vote
+
+    def _add_new_block(self, confirmed_block, vote, votes_dumped) -> bool:
+        """Verify the block and add it to the blockchain.
+
+        :return: False if the block is invalid. The error is raised in the subscribe loop.
+        """
+        if confirmed_block is None:
+            return True
+
+        blockchain = ObjectManager().channel_service.block_manager.blockchain
+        if confirmed_block.header.height <= blockchain.block_height:
+            return True
+
+        block_version = blockchain.block_versioner.get_version(confirmed_block.header.height)
+        block_verifier = BlockVerifier.new(block_version, blockchain.tx_versioner)
+        block_verifier.invoke_func = blockchain.score_invoke
+        reps_getter = blockchain.find_preps_addresses_by_roothash
+        try:
+            block_verifier.verify(confirmed_block,
+                                  blockchain.last_block,
+                                  blockchain,
+                                  generator=blockchain.get_expected_generator(confirmed_block),
+                                  reps_getter=reps_getter)
+        except Exception as e:
+            self._exception = AnnounceNewBlockError(f"error: {type(e)}, message: {str(e)}")
+            return False
+        else:
+            logging.debug(f"add_confirmed_block height({confirmed_block.header.height}), "
+                          f"hash({confirmed_block.header.hash.hex()}), votes_dumped({votes_dumped})")
+            ObjectManager().channel_service.block_manager.add_confirmed_block(confirmed_block=confirmed_block,
+                                                                              confirm_info=vote)
+            return True
 
     async def node_ws_PublishHeartbeat(self, **kwargs):
         def _callback(exception):
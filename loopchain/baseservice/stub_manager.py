@@ -2,9 +2,12 @@
 This object has own channel information and support re-generation of gRPC stub."""
 
 import datetime
+import itertools
 import logging
+import threading
 import time
 import timeit
+from typing import Dict, Optional
 
 import grpc
 from grpc._channel import _Rendezvous
@@ -13,14 +16,75 @@ import loopchain.utils as util
 from loopchain import configure as conf
 
 
+class PeerHealth:
+    """EWMA of the latency and the failure rate of gRPC calls to a peer.
+
+    Health is shared by target in a process only. Stub managers of the broadcast scheduler feed the one
+    in the broadcast process if it runs as a process, and block height sync feeds its own in the channel process.
+    Remove health of targets which are no longer called, so that the registry does not grow over terms.
+    """
+    _peers: Dict[str, 'PeerHealth'] = {}
+    _peers_lock = threading.Lock()
+
+    def __init__(self, target: str):
+        self.target = target
+        self.latency: Optional[float] = None  # seconds
+        self.failure_rate = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, target: str) -> 'PeerHealth':
+        health = cls._peers.get(target)
+        if health is None:
+            with cls._peers_lock:
+                health = cls._peers.setdefault(target, cls(target))
+        return health
+
+    @classmethod
+    def remove(cls, targets):
+        with cls._peers_lock:
+            for target in targets:
+                cls._peers.pop(target, None)
+
+    @classmethod
+    def sort_targets(cls, targets):
+        """Sort targets from the healthiest. Targets which have not been called come first."""
+        return sorted(targets, key=lambda target: cls.of(target).score)
+
+    def record_success(self, latency: float):
+        weight = conf.PEER_HEALTH_EWMA_WEIGHT
+        with self._lock:
+            self.latency = latency if self.latency is None else self.latency + weight * (latency - self.latency)
+            self.failure_rate -= weight * self.failure_rate
+
+    def record_failure(self):
+        weight = conf.PEER_HEALTH_EWMA_WEIGHT
+        with self._lock:
+            self.failure_rate += weight * (1 - self.failure_rate)
+
+    @property
+    def score(self) -> float:
+        """Expected seconds of a call. A failed call is regarded to take `conf.GRPC_TIMEOUT`. Lower is better."""
+        return (self.latency or 0) + self.failure_rate * conf.GRPC_TIMEOUT
+
+    def __repr__(self):
+        return f"PeerHealth({self.target}, latency({self.latency}), failure_rate({self.failure_rate:.4f}))"
+
+
 class StubManager:
+    """gRPC stubs to a target over a pool of channels.
 
-    def __init__(self, target, stub_type, ssl_auth_type=conf.SSLAuthType.none):
+    Calls are distributed to the channels in round robin, so a slow call does not stall the following ones.
+    """
+
+    def __init__(self, target, stub_type, ssl_auth_type=conf.SSLAuthType.none, channel_count: int = None):
         self.__target = target
         self.__stub_type = stub_type
         self.__ssl_auth_type = ssl_auth_type
-        self.__stub = None
-        self.__channel = None
+        self.__channel_count = max(channel_count or conf.GRPC_CHANNEL_COUNT_PER_PEER, 1)
+        self.__stubs = []
+        self.__channels = []
+        self.__stub_index = itertools.count()
         self.__stub_update_time = datetime.datetime.now()
         self.__last_succeed_time = time.monotonic()
 
@@ -28,31 +92,49 @@ class StubManager:
 
     def __make_stub(self, is_stub_reuse=True):
         if util.datetime_diff_in_mins(self.__stub_update_time) >= conf.STUB_REUSE_TIMEOUT or \
-                not is_stub_reuse or self.__stub is None:
-            util.logger.spam(f"StubManager:__make_stub is_stub_reuse({is_stub_reuse}) self.__stub({self.__stub})")
-
-            self.__stub, self.__channel = util.get_stub_to_server(
-                self.__target, self.__stub_type, ssl_auth_type=self.__ssl_auth_type)
+                not is_stub_reuse or not self.__stubs:
+            util.logger.spam(f"StubManager:__make_stub is_stub_reuse({is_stub_reuse}) self.__stubs({self.__stubs})")
+
+            # Channels with the same arguments share a connection. Each channel of a pool needs its own one.
+            options = [("grpc.use_local_subchannel_pool", 1)] if self.__channel_count > 1 else None
+            stubs, channels = [], []
+            for _ in range(self.__channel_count):
+                stub, channel = util.get_stub_to_server(
+                    self.__target, self.__stub_type, ssl_auth_type=self.__ssl_auth_type, options=options)
+                if stub:
+                    stubs.append(stub)
+                    channels.append(channel)
+
+            self.__stubs, self.__channels = stubs, channels
             self.__stub_update_time = datetime.datetime.now()
-            if self.__stub:
+            if self.__stubs:
                 self.__update_last_succeed_time()
         else:
             pass
 
+    def __next_stub(self):
+        stubs = self.__stubs
+        return stubs[next(self.__stub_index) % len(stubs)] if stubs else None
+
     @property
     def stub(self, is_stub_reuse=True):
+        """The first stub of the pool. It changes only when the stubs are made again."""
         self.__make_stub(is_stub_reuse)
 
-        return self.__stub
+        return self.__stubs[0] if self.__stubs else None
 
     @stub.setter
     def stub(self, value):
-        self.__stub = value
+        self.__stubs = [value] if value else []
 
     @property
     def target(self):
         return self.__target
 
+    @property
+    def health(self) -> PeerHealth:
+        return PeerHealth.of(self.__target)
+
     def elapsed_last_succeed_time(self):
         return time.monotonic() - self.__last_succeed_time
 
@@ -65,8 +147,7 @@ class StubManager:
         self.__make_stub(is_stub_reuse)
 
         try:
-            stub_method = getattr(self.__stub, method_name)
-            ret = stub_method(message, timeout)
+            ret = self.__call_with_health(method_name, message, timeout)
             self.__update_last_succeed_time()
             return ret
         except Exception as e:
@@ -88,14 +169,18 @@ class StubManager:
         if call_back is None:
             call_back = self.print_broadcast_fail
         self.__make_stub(is_stub_reuse)
+        start_time = time.monotonic()
 
         def done_callback(result: _Rendezvous):
             if result.code() == grpc.StatusCode.OK:
+                self.health.record_success(time.monotonic() - start_time)
                 self.__update_last_succeed_time()
+            else:
+                self.health.record_failure()
             call_back(result)
 
         try:
-            stub_method = getattr(self.__stub, method_name)
+            stub_method = getattr(self.__next_stub(), method_name)
             feature_future = stub_method.future(message, timeout)
             feature_future.add_done_callback(done_callback)
             return feature_future
@@ -116,14 +201,12 @@ class StubManager:
             time_out_seconds = conf.CONNECTION_RETRY_TIMEOUT
         self.__make_stub(is_stub_reuse)
 
-        stub_method = getattr(self.__stub, method_name)
-
         start_time = timeit.default_timer()
         duration = timeit.default_timer() - start_time
 
         while duration < time_out_seconds:
             try:
-                return stub_method(message, conf.GRPC_TIMEOUT)
+                return self.__call_with_health(method_name, message, conf.GRPC_TIMEOUT)
             except Exception as e:
                 # logging.debug(f"retry request_server_in_time({method_name}): {e}")
                 logging.debug("duration(" + str(duration)
@@ -153,11 +236,10 @@ class StubManager:
         retry_times = conf.BROADCAST_RETRY_TIMES if retry_times is None else retry_times
 
         self.__make_stub(is_stub_reuse)
-        stub_method = getattr(self.__stub, method_name)
 
         while retry_times > 0:
             try:
-                return stub_method(message, timeout)
+                return self.__call_with_health(method_name, message, timeout)
             except Exception as e:
                 logging.debug(f"retry request_server_in_times({method_name}): {e}")
 
@@ -166,3 +248,15 @@ class StubManager:
             retry_times -= 1
 
         return None
+
+    def __call_with_health(self, method_name, message, timeout):
+        stub_method = getattr(self.__next_stub(), method_name)
+        start_time = time.monotonic()
+        try:
+            ret = stub_method(message, timeout)
+        except Exception:
+            self.health.record_failure()
+            raise
+        else:
+            self.health.record_success(time.monotonic() - start_time)
+            return ret
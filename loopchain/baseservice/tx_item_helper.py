@@ -14,28 +14,34 @@
 """helper class for TxItem"""
 
 import json
-import sys
 
 from loopchain.blockchain.transactions import Transaction, TransactionVersioner, TransactionSerializer
 from loopchain.protos import loopchain_pb2
 
 
+def _varint_size(value: int) -> int:
+    return max(1, (value.bit_length() + 6) // 7)
+
+
 class TxItem:
     tx_serializers = {}
 
     def __init__(self, tx_json: str, channel: str):
         self.channel = channel
-        self.__tx_json = tx_json
-        self.__len = sys.getsizeof(tx_json) + sys.getsizeof(channel)
+        self.__tx_message = loopchain_pb2.TxSend(
+            tx_json=tx_json,
+            channel=channel)
+
+        # The encoded size of the message as an item of `TxSendList.tx_list` (tag, length and message)
+        message_size = self.__tx_message.ByteSize()
+        self.__len = 1 + _varint_size(message_size) + message_size
 
     def __len__(self):
         return self.__len
 
     def get_tx_message(self):
-        message = loopchain_pb2.TxSend(
-            tx_json=self.__tx_json,
-            channel=self.channel)
-        return message
+        """Return the message which is made once. Do not modify it."""
+        return self.__tx_message
 
     @classmethod
     def create_tx_item(cls, tx_param: tuple, channel: str):
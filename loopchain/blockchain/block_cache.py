@@ -0,0 +1,105 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of decoded blocks"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from loopchain.blockchain.blocks import Block
+
+__all__ = ("BlockCache", )
+
+
+class BlockCache:
+    """Thread-safe LRU cache of decoded blocks indexed by both block hash and height.
+
+    Only blocks written in the block store must be put, so a height indicates exactly one block.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._blocks: Dict[str, Block] = OrderedDict()  # {block hash hex: block}
+        self._hashes: Dict[int, str] = {}  # {block height: block hash hex}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def get_by_hash(self, block_hash: str) -> Optional[Block]:
+        with self._lock:
+            block = self._blocks.get(block_hash)
+            self._count(block)
+            if block is not None:
+                self._blocks.move_to_end(block_hash)
+            return block
+
+    def get_by_height(self, height: int) -> Optional[Block]:
+        with self._lock:
+            block_hash = self._hashes.get(height)
+            block = self._blocks.get(block_hash) if block_hash else None
+            self._count(block)
+            if block is not None:
+                self._blocks.move_to_end(block_hash)
+            return block
+
+    def put(self, block: Block):
+        if self.max_size <= 0:
+            return
+
+        block_hash = block.header.hash.hex()
+        with self._lock:
+            self._remove_height(block.header.height)
+            self._blocks[block_hash] = block
+            self._blocks.move_to_end(block_hash)
+            self._hashes[block.header.height] = block_hash
+
+            while len(self._blocks) > self.max_size:
+                _, old_block = self._blocks.popitem(last=False)
+                self._hashes.pop(old_block.header.height, None)
+
+    def remove_from_height(self, height: int):
+        """Remove blocks of the height and above. Call it when blocks are removed from the block store."""
+        with self._lock:
+            for block_height in [block_height for block_height in self._hashes if block_height >= height]:
+                self._remove_height(block_height)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._hashes.clear()
+
+    def get_status(self) -> dict:
+        request_count = self.hit_count + self.miss_count
+        return {
+            "size": len(self._blocks),
+            "max_size": self.max_size,
+            "hit": self.hit_count,
+            "miss": self.miss_count,
+            "hit_rate": round(self.hit_count / request_count, 4) if request_count else 0
+        }
+
+    def _remove_height(self, height: int):
+        block_hash = self._hashes.pop(height, None)
+        if block_hash:
+            self._blocks.pop(block_hash, None)
+
+    def _count(self, block: Optional[Block]):
+        if block is None:
+            self.miss_count += 1
+        else:
+            self.hit_count += 1
@@ -0,0 +1,63 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compact record of a block header for the header index of the block store"""
+
+import struct
+from typing import NamedTuple
+
+from loopchain.blockchain.blocks import Block
+from loopchain.blockchain.types import Hash32, ExternalAddress
+
+__all__ = ("BlockHeaderRecord", )
+
+# hash, prev_hash, timestamp, peer_id, tx_count
+_record_struct = struct.Struct(">32s32sQ20sI")
+
+
+class BlockHeaderRecord(NamedTuple):
+    """Metadata of a block header which is stored as a fixed-size record keyed by its height.
+
+    The empty prev_hash and peer_id of the genesis block are stored as zero bytes.
+    """
+    hash: Hash32
+    prev_hash: Hash32
+    height: int
+    timestamp: int
+    peer_id: ExternalAddress
+    tx_count: int
+
+    size = _record_struct.size
+
+    @classmethod
+    def from_block(cls, block: Block) -> 'BlockHeaderRecord':
+        header = block.header
+        return cls(hash=header.hash,
+                   prev_hash=header.prev_hash or Hash32.empty(),
+                   height=header.height,
+                   timestamp=header.timestamp,
+                   peer_id=header.peer_id or ExternalAddress.empty(),
+                   tx_count=len(block.body.transactions))
+
+    def dumps(self) -> bytes:
+        return _record_struct.pack(self.hash, self.prev_hash, self.timestamp, self.peer_id, self.tx_count)
+
+    @classmethod
+    def loads(cls, height: int, record_dumped: bytes) -> 'BlockHeaderRecord':
+        hash_, prev_hash, timestamp, peer_id, tx_count = _record_struct.unpack(record_dumped)
+        return cls(hash=Hash32(hash_),
+                   prev_hash=Hash32(prev_hash),
+                   height=height,
+                   timestamp=timestamp,
+                   peer_id=ExternalAddress(peer_id),
+                   tx_count=tx_count)
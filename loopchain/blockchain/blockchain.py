@@ -1,14 +1,11 @@
 """Block chain class with authorized blocks only"""
 
 import json
-import pickle
 import threading
-from collections import Counter
+from collections import Counter, OrderedDict
 from enum import Enum
-from functools import lru_cache
 from os import linesep
-from types import MappingProxyType
-from typing import Union, List, cast, Optional, Tuple, Sequence, Mapping
+from typing import Union, Dict, List, cast, Optional, Tuple, Sequence, Mapping
 
 import zlib
 from pkg_resources import parse_version
@@ -18,7 +15,10 @@ from loopchain import utils
 from loopchain.baseservice import ScoreResponse, ObjectManager
 from loopchain.baseservice.aging_cache import AgingCache
 from loopchain.baseservice.lru_cache import lru_cache as valued_only_lru_cache
-from loopchain.blockchain.blocks import Block, BlockBuilder, BlockSerializer, BlockHeader, v0_1a
+from loopchain.blockchain.block_cache import BlockCache
+from loopchain.blockchain.block_header_record import BlockHeaderRecord
+from loopchain.blockchain.preps_cache import Preps, PrepsCache
+from loopchain.blockchain.blocks import Block, LazyBlock, BlockBuilder, BlockSerializer, BlockHeader, v0_1a
 from loopchain.blockchain.blocks import BlockProver, BlockProverType, BlockVersioner, NextRepsChangeReason
 from loopchain.blockchain.exception import *
 from loopchain.blockchain.score_base import *
@@ -28,6 +28,7 @@ from loopchain.blockchain.types import Hash32, ExternalAddress, TransactionStatu
 from loopchain.blockchain.votes import Votes
 from loopchain.blockchain.votes.v0_1a import BlockVotes
 from loopchain.channel.channel_property import ChannelProperty
+from loopchain.store import binary_codec
 from loopchain.store.key_value_store import KeyValueStore, KeyValueStoreWriteBatch
 from loopchain.utils.icon_service import convert_params, ParamType, response_to_json_query
 from loopchain.utils.message_queue import StubCollection
@@ -55,14 +56,23 @@ class BlockChain:
     NID_KEY = b'NID_KEY'
     PRECOMMIT_BLOCK_KEY = b'PRECOMMIT_BLOCK'
     TRANSACTION_COUNT_KEY = b'TRANSACTION_COUNT'
+    # made block count of the leader of the last block, {"blockHash": str, "peerId": str, "count": int}
+    MADE_BLOCK_COUNT_KEY = b'made_block_count_key'
     LAST_BLOCK_KEY = b'last_block_key'
     BLOCK_HEIGHT_KEY = b'block_height_key'
 
+    # Compact records of block headers are indexed by `block height` keys. See BlockHeaderRecord.
+    BLOCK_HEADER_KEY = b'block_header_key'
+
     # Additional information of the block is generated when the add_block phase of the consensus is reached.
     CONFIRM_INFO_KEY = b'confirm_info_key'
     PREPS_KEY = b'preps_key'
     INVOKE_RESULT_BLOCK_HEIGHT_KEY = b'invoke_result_block_height_key'
 
+    # Tx hashes by address are indexed in the order of `address || block height || tx index` keys.
+    TX_BY_ADDRESS_KEY = b'tx_by_address_key'
+    TX_INDEX_BYTES_LEN = 4
+
     def __init__(self, channel_name=None, store_id=None, block_manager=None):
         if channel_name is None:
             channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL
@@ -80,6 +90,16 @@ class BlockChain:
         store_id = f"{store_id}_{channel_name}"
         self._blockchain_store, self._blockchain_store_path = utils.init_default_key_value_store(store_id)
 
+        # decoded blocks in the store, which are requested repeatedly by consensus, sync and REST.
+        self.__block_cache = BlockCache(max_size=conf.MAX_BLOCK_CACHE_SIZE)
+
+        # decoded preps by roothash, which are requested by every vote, block and status.
+        self.__preps_cache = PrepsCache(max_size=conf.MAX_PREPS_CACHE_SIZE)
+
+        # dumped merkle trees of recently proved blocks, {(BlockProverType, block hash hex): tree dumped}
+        self.__proof_trees: Dict[Tuple[BlockProverType, str], bytes] = OrderedDict()
+        self.__proof_trees_lock = threading.Lock()
+
         # tx receipts and next prep after invoke, {Hash32: (receipts, next_prep)}
         self.__invoke_results: AgingCache = AgingCache(max_age_seconds=conf.INVOKE_RESULT_AGING_SECONDS)
 
@@ -120,14 +140,19 @@ class BlockChain:
         :param block:
         :return:
         """
-        if block.header.height == 0:
+        self.__increase_made_block_count_by_header(block.header)
+
+    def __increase_made_block_count_by_header(self, block_header: BlockHeader) -> None:
+        if block_header.height == 0:
             return
 
-        if (self.__last_block.header.peer_id != block.header.peer_id or
+        self.__made_block_counter[block_header.peer_id] = self.__next_made_block_count(block_header)
+
+    def __next_made_block_count(self, block_header: BlockHeader) -> int:
+        if (self.__last_block.header.peer_id != block_header.peer_id or
                 self.__last_block.header.prep_changed_reason is NextRepsChangeReason.TermEnd):
-            self.__made_block_counter[block.header.peer_id] = 1
-        else:
-            self.__made_block_counter[block.header.peer_id] += 1
+            return 1
+        return self.__made_block_counter[block_header.peer_id] + 1
 
     def _keep_order_in_penalty(self) -> bool:
         keep_order = (self.last_block and
@@ -218,6 +243,9 @@ class BlockChain:
     def tx_versioner(self):
         return self.__tx_versioner
 
+    def get_block_cache_status(self) -> dict:
+        return self.__block_cache.get_status()
+
     def get_blockchain_store(self):
         return self._blockchain_store
 
@@ -274,7 +302,17 @@ class BlockChain:
                 for index, tx in enumerate(block_to_be_removed.body.transactions.values()):
                     tx_hash = tx.hash.hex()
                     self._blockchain_store.delete(tx_hash.encode(encoding=conf.HASH_KEY_ENCODING))
+                    if tx.type() != "base":
+                        self._blockchain_store.delete(self.get_tx_by_address_key(
+                            tx.from_address.hex_hx(), block_to_be_removed.header.height, index))
+
+                self._blockchain_store.delete(self.get_block_header_key(block_to_be_removed.header.height))
 
+                with self.__proof_trees_lock:
+                    for type_ in (BlockProverType.Transaction, BlockProverType.Receipt):
+                        self.__proof_trees.pop((type_, block_to_be_removed.header.hash.hex()), None)
+
+                self.__block_cache.remove_from_height(block_to_be_removed.header.height)
                 self.__last_block = new_last_block
                 self.__total_tx = next_total_tx
 
@@ -291,30 +329,70 @@ class BlockChain:
     def rebuild_made_block_count(self):
         """rebuild leader's made block count
 
+        The count persisted with the last block is used. Blocks are read only if there is no count of the last block
+        or conf.VERIFY_BLOCKCHAIN_CHECKPOINTS is True.
+
         :return:
         """
         self.reset_leader_made_block_count()
 
-        block_hash = self.__last_block.header.hash.hex()
-        block_height = self.__last_block.header.height
+        made_block_count = self.__find_made_block_count()
+        if made_block_count is not None and not conf.VERIFY_BLOCKCHAIN_CHECKPOINTS:
+            self.__made_block_counter[self.__last_block.header.peer_id] = made_block_count
+            return
 
-        while block_hash != "":
-            if block_height <= 0:
-                return
+        self.__rebuild_made_block_count_from_blocks()
+        rebuilt_count = self.__made_block_counter[self.__last_block.header.peer_id]
+        if made_block_count is not None and made_block_count != rebuilt_count:
+            logging.warning(f"Persisted made block count({made_block_count}) is different from "
+                            f"the count rebuilt from blocks({rebuilt_count}).")
 
-            block_dump = self._blockchain_store.get(block_hash.encode(encoding='UTF-8'))
-            block_version = self.__block_versioner.get_version(block_height)
-            block_serializer = BlockSerializer.new(block_version, self.__tx_versioner)
-            block = block_serializer.deserialize(json.loads(block_dump))
+    def __rebuild_made_block_count_from_blocks(self):
+        last_block_header = self.__last_block.header
+        for block_header in self.__iter_block_headers_reversed(last_block_header.hash, last_block_header.height):
+            if block_header.height <= 0:
+                return
 
-            if self.__last_block.header.peer_id != block.header.peer_id:
+            if last_block_header.peer_id != block_header.peer_id:
                 break
 
-            self._increase_made_block_count(block)
+            self.__increase_made_block_count_by_header(block_header)
 
-            # next loop
-            block_height = block.header.height - 1
-            block_hash = block.header.prev_hash.hex()
+    def __find_made_block_count(self) -> Optional[int]:
+        """find the made block count persisted with the last block.
+
+        :return: None if there is no count or it is persisted with another block. e.g. after roll back
+        """
+        try:
+            made_block_count = binary_codec.loads(self._blockchain_store.get(BlockChain.MADE_BLOCK_COUNT_KEY))
+        except KeyError:
+            return None
+
+        last_block_header = self.__last_block.header
+        if (made_block_count["blockHash"] != last_block_header.hash.hex_0x() or
+                made_block_count["peerId"] != last_block_header.peer_id.hex_hx()):
+            return None
+        return made_block_count["count"]
+
+    def __iter_block_headers_reversed(self, block_hash: Hash32, block_height: int):
+        """Iterate headers from the block to the genesis block.
+
+        Records of the header index are used while they are linked by prev_hash.
+        Headers of the blocks are read instead for the blocks stored before the index.
+
+        :return: iterator of BlockHeaderRecord or BlockHeader
+        """
+        for record in self.iter_block_header_records(0, block_height, reverse=True):
+            if record.height != block_height or record.hash != block_hash:
+                break
+            yield record
+            block_hash, block_height = record.prev_hash, block_height - 1
+
+        while block_height >= 0:
+            block_dump = self._blockchain_store.get(block_hash.hex().encode(encoding='UTF-8'))
+            block_header = self.stored_block_header_loads(block_dump)
+            yield block_header
+            block_hash, block_height = block_header.prev_hash, block_header.height - 1
 
     def rebuild_transaction_count(self):
         if self.__last_block is not None:
@@ -330,6 +408,13 @@ class BlockChain:
                     logging.warning(f"Exception raised on getting 'TRANSACTION_COUNT' from DB. Rebuild tx count,"
                                     f"Exception : {type(e)}, {e}")
                 self.__total_tx = self._rebuild_transaction_count_from_blocks()
+            else:
+                if conf.VERIFY_BLOCKCHAIN_CHECKPOINTS:
+                    rebuilt_total_tx = self._rebuild_transaction_count_from_blocks()
+                    if rebuilt_total_tx != self.__total_tx:
+                        logging.warning(f"Persisted tx count({self.__total_tx}) is different from "
+                                        f"the count rebuilt from blocks({rebuilt_total_tx}).")
+                        self.__total_tx = rebuilt_total_tx
 
             logging.info(f"rebuilt blocks, total_tx: {self.__total_tx}")
             logging.info(
@@ -342,22 +427,17 @@ class BlockChain:
 
     def _rebuild_transaction_count_from_blocks(self):
         total_tx = 0
-        block_hash = self.__last_block.header.hash.hex()
-        block_height = self.__last_block.header.height
-
-        while block_hash != "":
-            block_dump = self._blockchain_store.get(block_hash.encode(encoding='UTF-8'))
-            block_version = self.__block_versioner.get_version(block_height)
-            block_serializer = BlockSerializer.new(block_version, self.__tx_versioner)
-            block = block_serializer.deserialize(json.loads(block_dump))
-
+        last_block_header = self.__last_block.header
+        for block_header in self.__iter_block_headers_reversed(last_block_header.hash, last_block_header.height):
             # Count only normal block`s tx count, not genesis block`s
-            if block.header.height > 0:
-                total_tx += len(block.body.transactions)
+            if block_header.height <= 0:
+                break
 
-            # next loop
-            block_height = block.header.height - 1
-            block_hash = block.header.prev_hash.hex()
+            if isinstance(block_header, BlockHeaderRecord):
+                total_tx += block_header.tx_count
+            else:
+                block = self.__find_block_by_key(block_header.hash.hex().encode(encoding='UTF-8'))
+                total_tx += len(block.body.transactions)
         return total_tx
 
     def _rebuild_transaction_count_from_cached(self):
@@ -367,15 +447,21 @@ class BlockChain:
     def __find_block_by_key(self, key):
         try:
             block_bytes = self._blockchain_store.get(key)
-            block_dumped = json.loads(block_bytes)
-            block_height = self.__block_versioner.get_height(block_dumped)
-            block_version = self.__block_versioner.get_version(block_height)
-            return BlockSerializer.new(block_version, self.__tx_versioner).deserialize(block_dumped)
+            return self.__stored_block_loads_lazy(block_bytes)
         except KeyError as e:
             logging.debug(f"__find_block_by_key::KeyError block_hash({key}) error({e})")
 
         return None
 
+    def __find_block_header_by_key(self, key) -> Optional[BlockHeader]:
+        try:
+            block_bytes = self._blockchain_store.get(key)
+        except KeyError as e:
+            logging.debug(f"__find_block_header_by_key::KeyError block_hash({key}) error({e})")
+            return None
+
+        return self.stored_block_header_loads(block_bytes)
+
     def get_prev_block(self, block: Block) -> Block:
         """get prev block by given block
 
@@ -395,6 +481,14 @@ class BlockChain:
 
         return prev_block
 
+    def __find_block_by_hash_hex(self, block_hash: str, cache_block=True):
+        block = self.__block_cache.get_by_hash(block_hash)
+        if block is None:
+            block = self.__find_block_by_key(block_hash.encode(encoding='UTF-8'))
+            if block is not None and cache_block:
+                self.__block_cache.put(block)
+        return block
+
     def find_block_by_hash(self, block_hash: Union[str, Hash32]):
         """find block in DB by block hash.
 
@@ -404,7 +498,7 @@ class BlockChain:
         """
         if isinstance(block_hash, Hash32):
             block_hash = block_hash.hex()
-        return self.__find_block_by_key(block_hash.encode(encoding='UTF-8'))
+        return self.__find_block_by_hash_hex(block_hash)
 
     def find_block_by_hash_str(self, block_hash: str):
         """find block in DB by block hash.
@@ -412,7 +506,7 @@ class BlockChain:
         :param block_hash: plain string,
         :return: None or Block
         """
-        return self.__find_block_by_key(block_hash.encode(encoding='UTF-8'))
+        return self.__find_block_by_hash_hex(block_hash)
 
     def find_block_by_hash32(self, block_hash: Hash32):
         """find block in DB by block hash.
@@ -420,18 +514,23 @@ class BlockChain:
         :param block_hash: Hash32
         :return: None or Block
         """
-        return self.__find_block_by_key(block_hash.hex().encode(encoding='UTF-8'))
+        return self.__find_block_by_hash_hex(block_hash.hex())
 
-    def find_block_by_height(self, block_height):
+    def find_block_by_height(self, block_height, cache_block=True):
         """find block in DB by its height
 
         :param block_height: int,
         it convert to key of blockchain db in this method so don't try already converted key.
+        :param cache_block: False not to put the block read from DB into the block cache. e.g. old blocks in bulk
         :return None or Block
         """
         if block_height == -1:
             return self.__last_block
 
+        block = self.__block_cache.get_by_height(block_height)
+        if block is not None:
+            return block
+
         try:
             key = self._blockchain_store.get(BlockChain.BLOCK_HEIGHT_KEY +
                                              block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
@@ -441,7 +540,91 @@ class BlockChain:
                     return self.last_unconfirmed_block
             return None
 
-        return self.__find_block_by_key(key)
+        return self.__find_block_by_hash_hex(bytes(key).decode(encoding='UTF-8'), cache_block)
+
+    def find_block_header_by_hash(self, block_hash: Union[str, Hash32]) -> Optional[BlockHeader]:
+        """find block header in DB by block hash. The body of the block is not decoded.
+
+        :param block_hash: plain string or Hash32
+        :return: None or BlockHeader
+        """
+        if isinstance(block_hash, Hash32):
+            block_hash = block_hash.hex()
+
+        block = self.__block_cache.get_by_hash(block_hash)
+        if block is not None:
+            return block.header
+        return self.__find_block_header_by_key(block_hash.encode(encoding='UTF-8'))
+
+    def find_block_header_by_height(self, block_height: int) -> Optional[BlockHeader]:
+        """find block header in DB by its height. The body of the block is not decoded.
+
+        :param block_height: int
+        :return: None or BlockHeader
+        """
+        if block_height == -1:
+            return self.__last_block and self.__last_block.header
+
+        block = self.__block_cache.get_by_height(block_height)
+        if block is not None:
+            return block.header
+
+        try:
+            key = self._blockchain_store.get(BlockChain.BLOCK_HEIGHT_KEY +
+                                             block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
+        except KeyError:
+            if self.last_unconfirmed_block:
+                if self.last_unconfirmed_block.header.height == block_height:
+                    return self.last_unconfirmed_block.header
+            return None
+
+        return self.__find_block_header_by_key(bytes(key))
+
+    @staticmethod
+    def get_block_header_key(block_height: int) -> bytes:
+        return BlockChain.BLOCK_HEADER_KEY + block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+
+    def find_block_header_record_by_height(self, block_height: int) -> Optional[BlockHeaderRecord]:
+        """find the record of the block header in the header index by its height.
+
+        :param block_height: int
+        :return: None or BlockHeaderRecord. None if there is no block or the block is stored before the index.
+        """
+        try:
+            record_dumped = self._blockchain_store.get(self.get_block_header_key(block_height))
+        except KeyError:
+            return None
+        return BlockHeaderRecord.loads(block_height, bytes(record_dumped))
+
+    def iter_block_header_records(self, from_height: int, to_height: int, reverse=False):
+        """Iterate records of block headers in the header index from `from_height` to `to_height` (inclusive).
+
+        Blocks stored before the index have no record, so heights of the records may not be continuous.
+
+        :param from_height: int
+        :param to_height: int
+        :param reverse: iterate from `to_height` to `from_height` if True
+        :return: iterator of BlockHeaderRecord
+        """
+        iterator = self._blockchain_store.Iterator(start_key=self.get_block_header_key(from_height),
+                                                   stop_key=self.get_block_header_key(to_height),
+                                                   reverse=reverse)
+        key_len = len(BlockChain.BLOCK_HEADER_KEY)
+        for key, value in iterator:
+            key = bytes(key)
+            if not key.startswith(BlockChain.BLOCK_HEADER_KEY):
+                break
+            yield BlockHeaderRecord.loads(int.from_bytes(key[key_len:], byteorder='big'), bytes(value))
+
+    def find_stored_block_by_height(self, block_height: int) -> Tuple[str, bytes]:
+        """find block in DB by its height without deserialization. Use `stored_block_loads` to get the block.
+
+        :return: block hash hex, block as stored in DB
+        :raises KeyError: if there is no block of the height in DB
+        """
+        key = self._blockchain_store.get(BlockChain.BLOCK_HEIGHT_KEY +
+                                         block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
+        return bytes(key).decode(encoding='UTF-8'), bytes(self._blockchain_store.get(key))
 
     def find_confirm_info_by_hash(self, block_hash: Union[str, Hash32]) -> bytes:
         if isinstance(block_hash, Hash32):
@@ -471,25 +654,29 @@ class BlockChain:
             return json.dumps(votes_serialized).encode(encoding='UTF-8')
         return bytes()
 
-    @lru_cache(maxsize=4)
     def find_preps_ids_by_roothash(self, roothash: Hash32) -> Tuple[str, ...]:
-        preps = self.find_preps_by_roothash(roothash)
-        return tuple([prep["id"] for prep in preps])
+        return self.__find_preps(roothash).ids
 
-    @lru_cache(maxsize=4)
     def find_preps_addresses_by_roothash(self, roothash: Hash32) -> Tuple[ExternalAddress, ...]:
-        preps_ids = self.find_preps_ids_by_roothash(roothash)
-        return tuple([ExternalAddress.fromhex(prep_id) for prep_id in preps_ids])
+        """find addresses of preps by roothash.
+
+        :return: Reps which finds the index of a rep in O(1)
+        """
+        return self.__find_preps(roothash).addresses
 
-    @lru_cache(maxsize=4)
     def find_preps_targets_by_roothash(self, roothash: Hash32) -> Mapping[str, str]:
-        preps = self.find_preps_by_roothash(roothash)
-        return MappingProxyType({prep["id"]: prep["p2pEndpoint"] for prep in preps})
+        return self.__find_preps(roothash).targets
 
-    def __cache_clear_roothash(self):
-        self.find_preps_ids_by_roothash.cache_clear()
-        self.find_preps_addresses_by_roothash.cache_clear()
-        self.find_preps_targets_by_roothash.cache_clear()
+    def __find_preps(self, roothash: Hash32) -> Preps:
+        preps = self.__preps_cache.get(roothash)
+        if preps is not None:
+            return preps
+
+        preps = self.__load_preps(roothash)
+        if not preps:
+            # Preps of the roothash may be written later, so not found ones are not cached.
+            return Preps.from_preps(preps)
+        return self.__preps_cache.put(roothash, preps)
 
     @staticmethod
     def get_reps_hash_by_header(header: BlockHeader) -> Hash32:
@@ -520,6 +707,9 @@ class BlockChain:
         return self.find_preps_addresses_by_roothash(self.get_reps_hash_by_header(header))
 
     def find_preps_by_roothash(self, roothash: Hash32) -> list:
+        return [dict(prep) for prep in self.__find_preps(roothash).preps]
+
+    def __load_preps(self, roothash: Hash32) -> list:
         try:
             preps_dumped = bytes(self._blockchain_store.get(BlockChain.PREPS_KEY + roothash))
         except (KeyError, TypeError):
@@ -543,6 +733,7 @@ class BlockChain:
             BlockChain.PREPS_KEY + roothash,
             json.dumps(preps).encode(encoding=conf.PEER_DATA_ENCODING)
         )
+        self.__preps_cache.remove(roothash)
 
     # TODO The current Citizen node sync by announce_confirmed_block message.
     #  However, this message does not include voting.
@@ -593,7 +784,9 @@ class BlockChain:
                     Hash32.fromhex(next_prep['rootHash'], ignore_prefix=True)):
                 next_prep = None
 
-            next_total_tx = self.__write_block_data(block, confirm_info, receipts, next_prep)
+            made_block_count = self.__next_made_block_count(block.header) if self.__last_block else None
+            next_total_tx = self.__write_block_data(block, confirm_info, receipts, next_prep, made_block_count)
+            self.__block_cache.put(block)
 
             try:
                 if need_to_score_invoke:
@@ -662,12 +855,12 @@ class BlockChain:
 
             write_target.put(
                 tx_hash.encode(encoding=conf.HASH_KEY_ENCODING),
-                json.dumps(tx_info).encode(encoding=conf.PEER_DATA_ENCODING))
+                self.__dumps_to_store(tx_info))
 
             tx_queue.pop(tx_hash, None)
 
             if block.header.height > 0:
-                self._write_tx_by_address(tx, batch)
+                self._write_tx_by_address(tx, block.header.height, index, write_target)
 
         # save_invoke_result_block_height
         bit_length = block.header.height.bit_length()
@@ -678,7 +871,7 @@ class BlockChain:
             block_height_bytes
         )
 
-    def __write_block_data(self, block: Block, confirm_info, receipts, next_prep):
+    def __write_block_data(self, block: Block, confirm_info, receipts, next_prep, made_block_count: int = None):
         # a condition for the exception case of genesis block.
         next_total_tx = self.__total_tx
         if block.header.height > 0:
@@ -688,18 +881,24 @@ class BlockChain:
         byte_length = (bit_length + 7) // 8
         next_total_tx_bytes = next_total_tx.to_bytes(byte_length, byteorder='big')
 
-        block_serializer = BlockSerializer.new(block.header.version, self.__tx_versioner)
-        block_serialized = json.dumps(block_serializer.serialize(block))
+        block_serialized = self.__dumps_block_to_store(block)
         block_hash_encoded = block.header.hash.hex().encode(encoding='UTF-8')
 
         batch = self._blockchain_store.WriteBatch()
-        batch.put(block_hash_encoded, block_serialized.encode("utf-8"))
+        batch.put(block_hash_encoded, block_serialized)
         batch.put(BlockChain.LAST_BLOCK_KEY, block_hash_encoded)
         batch.put(BlockChain.TRANSACTION_COUNT_KEY, next_total_tx_bytes)
         batch.put(
             BlockChain.BLOCK_HEIGHT_KEY +
             block.header.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
             block_hash_encoded)
+        batch.put(self.get_block_header_key(block.header.height), BlockHeaderRecord.from_block(block).dumps())
+        if made_block_count is not None and block.header.height > 0:
+            batch.put(BlockChain.MADE_BLOCK_COUNT_KEY, self.__dumps_to_store({
+                "blockHash": block.header.hash.hex_0x(),
+                "peerId": block.header.peer_id.hex_hx(),
+                "count": made_block_count
+            }))
 
         if receipts:
             self._write_tx(block, receipts, batch)
@@ -733,6 +932,19 @@ class BlockChain:
 
         return next_total_tx
 
+    @staticmethod
+    def __dumps_to_store(data) -> bytes:
+        if conf.BLOCK_STORE_BINARY_FORMAT:
+            return binary_codec.dumps(data)
+        return json.dumps(data).encode(encoding=conf.PEER_DATA_ENCODING)
+
+    def __dumps_block_to_store(self, block: Block) -> bytes:
+        block_serializer = BlockSerializer.new(block.header.version, self.__tx_versioner)
+        if conf.BLOCK_STORE_BINARY_FORMAT:
+            return binary_codec.dumps(block_serializer.serialize(block))
+        # The json of the latest blocks is cached by BlockSerializer, so a broadcast block is not serialized again.
+        return block_serializer.dumps(block)
+
     def prevent_next_block_mismatch(self, next_height: int) -> bool:
         logging.debug(f"prevent_block_mismatch...")
         score_stub = StubCollection().icon_score_stubs[self.__channel_name]
@@ -814,28 +1026,61 @@ class BlockChain:
                 except KeyError as e:
                     logging.warning(f"blockchain:__precommit_tx::KeyError:There is no tx by hash({tx_hash})")
 
-    def _write_tx_by_address(self, tx: 'Transaction', batch):
+    def _write_tx_by_address(self, tx: 'Transaction', block_height: int, tx_index: int, batch):
         if tx.type() == "base":
             return
         address = tx.from_address.hex_hx()
-        return self.add_tx_to_list_by_address(address, tx.hash.hex(), batch)
+        return self.add_tx_to_list_by_address(address, tx.hash.hex(), block_height, tx_index, batch)
 
     @staticmethod
-    def __get_tx_list_key(address, index):
-        return conf.TX_LIST_ADDRESS_PREFIX + (address + str(index)).encode(encoding=conf.HASH_KEY_ENCODING)
+    def get_tx_by_address_key(address: str, block_height: int = None, tx_index: int = None) -> bytes:
+        key = BlockChain.TX_BY_ADDRESS_KEY + address.encode(encoding=conf.HASH_KEY_ENCODING)
+        if block_height is not None:
+            key += block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+            key += tx_index.to_bytes(BlockChain.TX_INDEX_BYTES_LEN, byteorder='big')
+        return key
 
     def get_tx_list_by_address(self, address, index=0):
-        list_key = self.__get_tx_list_key(address, index)
+        """Get a page of tx hashes sent by the address, from the latest tx.
 
-        try:
-            tx_list = pickle.loads(self._blockchain_store.get(list_key))
-            next_index = tx_list[-1]
-        except KeyError:
-            tx_list = [0]  # 0 means there is no more list after this.
-            next_index = 0
+        Pages are not shifted by new txs, because next_index is the position of the first tx of the next page.
 
+        :param address: address of tx sender
+        :param index: 0 for the first page, or next_index of the previous page
+        :return: [tx_hash, ..., next_index], next_index. 0 of next_index means there is no more page.
+        """
+        page_size = conf.MAX_TX_LIST_SIZE_BY_ADDRESS
+        prefix = self.get_tx_by_address_key(address)
+        if index:
+            block_height, tx_index = self.__tx_position_from_index(index)
+            stop_key = self.get_tx_by_address_key(address, block_height, tx_index)
+        else:
+            stop_key = prefix + b'\xff'
+
+        tx_list = []
+        next_index = 0
+        iterator = self._blockchain_store.Iterator(start_key=prefix, stop_key=stop_key, reverse=True)
+        for key, value in iterator:
+            key = bytes(key)
+            if not key.startswith(prefix):
+                break
+            if len(tx_list) == page_size:
+                next_index = self.__tx_position_to_index(key[len(prefix):])
+                break
+            tx_list.append(bytes(value).hex())
+
+        tx_list.append(next_index)
         return tx_list, next_index
 
+    @staticmethod
+    def __tx_position_to_index(position: bytes) -> int:
+        """Make next_index from 'block height || tx index' of the key. It is 1-based, because 0 means no more page."""
+        return int.from_bytes(position, byteorder='big') + 1
+
+    @staticmethod
+    def __tx_position_from_index(index: int) -> Tuple[int, int]:
+        return divmod(int(index) - 1, 1 << (8 * BlockChain.TX_INDEX_BYTES_LEN))
+
     def get_precommit_block(self):
         return self.__find_block_by_key(BlockChain.PRECOMMIT_BLOCK_KEY)
 
@@ -851,20 +1096,10 @@ class BlockChain:
             logging.debug(f"blockchain:get_nid::There is no NID.")
             return None
 
-    def add_tx_to_list_by_address(self, address, tx_hash, batch=None):
+    def add_tx_to_list_by_address(self, address, tx_hash, block_height, tx_index, batch=None):
         write_target = batch or self._blockchain_store
-        current_list, current_index = self.get_tx_list_by_address(address, 0)
-
-        if len(current_list) > conf.MAX_TX_LIST_SIZE_BY_ADDRESS:
-            new_index = current_index + 1
-            new_list_key = self.__get_tx_list_key(address, new_index)
-            self._blockchain_store.put(new_list_key, pickle.dumps(current_list))
-            current_list = [new_index]
-
-        current_list.insert(0, tx_hash)
-        list_key = self.__get_tx_list_key(address, 0)
-        write_target.put(list_key, pickle.dumps(current_list))
-
+        key = self.get_tx_by_address_key(address, block_height, tx_index)
+        write_target.put(key, bytes.fromhex(tx_hash))
         return True
 
     def find_tx_by_key(self, tx_hash_key):
@@ -875,17 +1110,16 @@ class BlockChain:
         """
 
         try:
-            tx_info_json = self.find_tx_info(tx_hash_key)
+            tx_data = self.find_tx_info_field(tx_hash_key, "transaction")
         except KeyError as e:
             return None
-        if tx_info_json is None:
+        if tx_data is None:
             logging.warning(f"tx not found. tx_hash ({tx_hash_key})")
             return None
 
-        tx_data = tx_info_json["transaction"]
         tx_version, tx_type = self.__tx_versioner.get_version(tx_data)
         tx_serializer = TransactionSerializer.new(tx_version, tx_type, self.__tx_versioner)
-        return tx_serializer.from_(tx_data)
+        return tx_serializer.from_trusted(tx_data, tx_hash_key)
 
     def find_invoke_result_by_tx_hash(self, tx_hash: Union[str, Hash32]):
         """find invoke result matching tx_hash and return result if not in blockchain return code delay
@@ -896,7 +1130,7 @@ class BlockChain:
         if isinstance(tx_hash, Hash32):
             tx_hash = tx_hash.hex()
         try:
-            tx_info = self.find_tx_info(tx_hash)
+            tx_result = self.find_tx_info_field(tx_hash, "result")
         except KeyError as e:
             if tx_hash in self.__block_manager.get_tx_queue():
                 # this case is tx pending
@@ -907,7 +1141,7 @@ class BlockChain:
                 # This transaction is considered a failure.
                 return {'code': ScoreResponse.NOT_EXIST}
 
-        return tx_info['result']
+        return tx_result
 
     def find_tx_info(self, tx_hash_key: Union[str, Hash32]):
         if isinstance(tx_hash_key, Hash32):
@@ -916,7 +1150,7 @@ class BlockChain:
         try:
             tx_info = self._blockchain_store.get(
                 tx_hash_key.encode(encoding=conf.HASH_KEY_ENCODING))
-            tx_info_json = json.loads(tx_info, encoding=conf.PEER_DATA_ENCODING)
+            tx_info_json = binary_codec.loads(tx_info)
 
         except UnicodeDecodeError as e:
             logging.warning("blockchain::find_tx_info: UnicodeDecodeError: " + str(e))
@@ -924,6 +1158,23 @@ class BlockChain:
 
         return tx_info_json
 
+    def find_tx_info_field(self, tx_hash_key: Union[str, Hash32], field: str):
+        """Find a field of tx info without decoding the others.
+
+        :raises KeyError: There is no tx by hash.
+        """
+        if isinstance(tx_hash_key, Hash32):
+            tx_hash_key = tx_hash_key.hex()
+
+        try:
+            tx_info = self._blockchain_store.get(
+                tx_hash_key.encode(encoding=conf.HASH_KEY_ENCODING))
+            return binary_codec.loads_field(tx_info, field)
+
+        except UnicodeDecodeError as e:
+            logging.warning("blockchain::find_tx_info_field: UnicodeDecodeError: " + str(e))
+            return None
+
     def __add_genesis_block(self, tx_info: dict, reps: List[ExternalAddress]):
         """
         :param tx_info: Transaction data for making genesis block from an initial file
@@ -964,10 +1215,7 @@ class BlockChain:
             self.__precommit_tx(precommit_block)
             utils.logger.spam(f"blockchain:put_precommit_block:confirmed_transaction_list")
 
-            block_serializer = BlockSerializer.new(precommit_block.header.version, self.__tx_versioner)
-            block_serialized = block_serializer.serialize(precommit_block)
-            block_serialized = json.dumps(block_serialized)
-            block_serialized = block_serialized.encode('utf-8')
+            block_serialized = self.__dumps_block_to_store(precommit_block)
             results = self._blockchain_store.put(BlockChain.PRECOMMIT_BLOCK_KEY, block_serialized)
 
             utils.logger.spam(f"result of to write to db ({results})")
@@ -1068,12 +1316,13 @@ class BlockChain:
 
         if last_block_key:
             block_dump = self._blockchain_store.get(last_block_key)
-            block_dump = json.loads(block_dump)
+            block_dump = binary_codec.loads(block_dump)
             block_height = self.__block_versioner.get_height(block_dump)
             block_version = self.__block_versioner.get_version(block_height)
             confirm_info = self.find_confirm_info_by_hash(self.__block_versioner.get_hash(block_dump))
             block_dump["confirm_prev_block"] = confirm_info is not b''
-            self.__last_block = BlockSerializer.new(block_version, self.__tx_versioner).deserialize(block_dump)
+            block_serializer = BlockSerializer.new(block_version, self.__tx_versioner, trusted=True)
+            self.__last_block = block_serializer.deserialize(block_dump)
 
             logging.debug("restore from last block hash(" + str(self.__last_block.header.hash.hex()) + ")")
             logging.debug("restore from last block height(" + str(self.__last_block.header.height) + ")")
@@ -1100,21 +1349,22 @@ class BlockChain:
         utils.logger.spam(f"add_genesis_block({self.__channel_name}/nid({nid}))")
 
     def block_dumps(self, block: Block) -> bytes:
+        """Dump the block to send it to other peers. It is compressed from `BlockSerializer.dumps`."""
         block_version = self.__block_versioner.get_version(block.header.height)
         block_serializer = BlockSerializer.new(block_version, self.__tx_versioner)
-        block_serialized = block_serializer.serialize(block)
 
         """
         FIXME: this is a workaround. confirm_prev_block is used temporarily. We will remove the attribute.
         If confirm_prev_block is serialized in serialize() function, it will be put in DB but we don't want it.
         """
         if hasattr(block.body, 'confirm_prev_block'):
+            block_serialized = block_serializer.serialize(block)
             block_serialized['confirm_prev_block'] = block.body.confirm_prev_block
+            block_dumped = json.dumps(block_serialized).encode(encoding=conf.PEER_DATA_ENCODING)
+        else:
+            block_dumped = block_serializer.dumps(block)
 
-        block_json = json.dumps(block_serialized)
-        block_dumped = block_json.encode(encoding=conf.PEER_DATA_ENCODING)
-        block_dumped = zlib.compress(block_dumped)
-        return block_dumped
+        return zlib.compress(block_dumped)
 
     def block_loads(self, block_dumped: bytes) -> Block:
         block_dumped = zlib.decompress(block_dumped)
@@ -1125,20 +1375,46 @@ class BlockChain:
         block_serializer = BlockSerializer.new(block_version, self.__tx_versioner)
         return block_serializer.deserialize(block_serialized)
 
+    def stored_block_loads(self, block_bytes: bytes, *, trusted: bool) -> Block:
+        """Deserialize a block in the format of the block store.
+
+        Blocks read from the store of this node are deserialized by `__find_block_by_key` with trusted=True.
+
+        :param block_bytes:
+        :param trusted: True if the block is read from the store of this node, not received from other peers.
+            It has no default, so that every caller decides whether tx hashes are computed or taken as stored.
+        """
+        block_dumped = binary_codec.loads(block_bytes)
+        block_height = self.__block_versioner.get_height(block_dumped)
+        block_version = self.__block_versioner.get_version(block_height)
+        return BlockSerializer.new(block_version, self.__tx_versioner, trusted).deserialize(block_dumped)
+
+    def stored_block_header_loads(self, block_bytes: bytes) -> BlockHeader:
+        """Deserialize the header of a block in the format of the block store without decoding its body."""
+        return self.__stored_block_header_loads(block_bytes)[0]
+
+    def __stored_block_header_loads(self, block_bytes: bytes) -> Tuple[BlockHeader, BlockSerializer]:
+        block_height = self.__block_versioner.get_height({"height": binary_codec.loads_field(block_bytes, "height")})
+        block_version = self.__block_versioner.get_version(block_height)
+        block_serializer = BlockSerializer.new(block_version, self.__tx_versioner, trusted=True)
+
+        header_dumped = binary_codec.loads_except(block_bytes, *block_serializer.body_keys)
+        return block_serializer.deserialize_header(header_dumped), block_serializer
+
+    def __stored_block_loads_lazy(self, block_bytes: bytes) -> LazyBlock:
+        """Deserialize a block read from the store of this node. Its body is decoded on first access."""
+        block_header, block_serializer = self.__stored_block_header_loads(block_bytes)
+        return LazyBlock(block_header,
+                         lambda: block_serializer.deserialize_body(binary_codec.loads(block_bytes)))
+
     def get_transaction_proof(self, tx_hash: Hash32):
         try:
             tx_info = self.find_tx_info(tx_hash.hex())
         except KeyError:
             raise RuntimeError(f"Tx does not exist.")
 
-        block_hash = tx_info["block_hash"]
-        block = self.find_block_by_hash(block_hash)
-
-        if block.header.version == "0.1a":
-            raise RuntimeError(f"Block version({block.header.version}) of the Tx does not support proof.")
-
-        block_prover = BlockProver.new(block.header.version, block.body.transactions, BlockProverType.Transaction)
-        return block_prover.get_proof(tx_hash)
+        block_prover = self.__get_block_prover(tx_info, BlockProverType.Transaction)
+        return block_prover.get_proof(int(tx_info["tx_index"], 16))
 
     def prove_transaction(self, tx_hash: Hash32, proof: list):
         try:
@@ -1160,18 +1436,46 @@ class BlockChain:
             tx_info = self.find_tx_info(tx_hash.hex())
         except KeyError:
             raise RuntimeError(f"Tx does not exist.")
-        tx_result = tx_info["result"]
 
-        block_hash = tx_info["block_hash"]
-        block = self.find_block_by_hash(block_hash)
+        block_prover = self.__get_block_prover(tx_info, BlockProverType.Receipt)
+        return block_prover.get_proof(int(tx_info["tx_index"], 16))
 
-        if block.header.version == "0.1a":
-            raise RuntimeError(f"Block version({block.header.version}) of the Tx does not support proof.")
+    def __get_block_prover(self, tx_info: dict, type_: BlockProverType) -> BlockProver:
+        """Get a prover of the block including the tx.
 
-        tx_results = (self.find_tx_info(tx_hash)["result"] for tx_hash in block.body.transactions)
-        block_prover = BlockProver.new(block.header.version, tx_results, BlockProverType.Receipt)
-        receipts_hash = block_prover.to_hash32(tx_result)
-        return block_prover.get_proof(receipts_hash)
+        Merkle trees of recently proved blocks are kept in memory up to `conf.MAX_PROOF_TREE_CACHE_SIZE`,
+        so later requests make a proof without loading and re-hashing the block. They are never stored.
+        """
+        block_version = self.__block_versioner.get_version(tx_info["block_height"])
+        if block_version == v0_1a.version:
+            raise RuntimeError(f"Block version({block_version}) of the Tx does not support proof.")
+
+        tree_key = (type_, tx_info["block_hash"])
+        with self.__proof_trees_lock:
+            tree_dumped = self.__proof_trees.get(tree_key)
+            if tree_dumped is not None:
+                self.__proof_trees.move_to_end(tree_key)
+
+        if tree_dumped is not None:
+            block_prover = BlockProver.new(block_version, None, type_)
+            block_prover.loads_tree(tree_dumped)
+            return block_prover
+
+        block = self.find_block_by_hash(tx_info["block_hash"])
+        if type_ == BlockProverType.Transaction:
+            values = block.body.transactions
+        else:
+            values = (self.find_tx_info(tx_hash)["result"] for tx_hash in block.body.transactions)
+
+        block_prover = BlockProver.new(block.header.version, values, type_)
+        if conf.MAX_PROOF_TREE_CACHE_SIZE > 0:
+            tree_dumped = block_prover.dumps_tree()
+            with self.__proof_trees_lock:
+                self.__proof_trees[tree_key] = tree_dumped
+                while len(self.__proof_trees) > conf.MAX_PROOF_TREE_CACHE_SIZE:
+                    self.__proof_trees.popitem(last=False)
+
+        return block_prover
 
     def prove_receipt(self, tx_hash: Hash32, proof: list):
         try:
@@ -1454,5 +1758,4 @@ class BlockChain:
     def __write_preps(self, preps: list, next_reps_hash):
         """Write prep data to DB."""
         self.write_preps(roothash=next_reps_hash, preps=preps)
-        self.__cache_clear_roothash()
         ObjectManager().channel_service.broadcast_scheduler.reset_audience_reps_hash()
@@ -16,7 +16,7 @@ from collections import OrderedDict
 from dataclasses import dataclass, _FIELD, _FIELDS
 from enum import IntEnum
 from types import MappingProxyType
-from typing import Mapping
+from typing import Callable, Mapping
 
 from loopchain.blockchain.transactions import Transaction
 from loopchain.blockchain.types import Hash32, ExternalAddress, Signature
@@ -52,6 +52,41 @@ class Block:
     body: BlockBody
 
 
+class LazyBlock(Block):
+    """Block whose body is decoded on first access.
+
+    It is equal to the `Block` of the same header and body.
+    """
+
+    def __init__(self, header: BlockHeader, body_loader: Callable[[], BlockBody]):
+        object.__setattr__(self, "header", header)
+        object.__setattr__(self, "_body_loader", body_loader)
+        object.__setattr__(self, "_body", None)
+
+    @property
+    def body(self) -> BlockBody:
+        if self._body is None:
+            body_loader = self._body_loader
+            if body_loader is not None:
+                object.__setattr__(self, "_body", body_loader())
+                object.__setattr__(self, "_body_loader", None)
+        return self._body
+
+    @property
+    def is_body_loaded(self) -> bool:
+        return self._body is not None
+
+    def __eq__(self, other):
+        if not isinstance(other, Block):
+            return NotImplemented
+        return self.header == other.header and self.body == other.body
+
+    __hash__ = Block.__hash__
+
+    def __reduce__(self):
+        return Block, (self.header, self.body)
+
+
 def _dataclass__str__(self):
     fields = getattr(self, _FIELDS, None)
     if fields is None:
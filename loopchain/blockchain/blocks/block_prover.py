@@ -18,6 +18,14 @@ class BlockProver(ABC):
     def get_proof_root(self) -> Hash32:
         raise NotImplementedError
 
+    @abstractmethod
+    def dumps_tree(self) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads_tree(self, tree_dumped: bytes):
+        raise NotImplementedError
+
     @abstractmethod
     def prove(self, hash_: Hash32, root_hash: Hash32, proof: list) -> bool:
         raise NotImplementedError
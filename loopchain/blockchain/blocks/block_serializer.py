@@ -1,20 +1,38 @@
+import json
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Tuple
 
+from loopchain import configure as conf
 from loopchain.blockchain.blocks import Block
 from loopchain.blockchain.exception import BlockVersionNotMatch
+from loopchain.blockchain.transactions import TransactionSerializer
 
 if TYPE_CHECKING:
-    from loopchain.blockchain.transactions import TransactionVersioner
+    from loopchain.blockchain.blocks import BlockHeader, BlockBody
+    from loopchain.blockchain.transactions import Transaction, TransactionVersioner
+    from loopchain.blockchain.types import Hash32
 
 
 class BlockSerializer(ABC):
     version = None
     BlockHeaderClass = None
     BlockBodyClass = None
+    body_keys = ()  # keys of the serialized block which are decoded to the body
 
-    def __init__(self, tx_versioner: 'TransactionVersioner'):
+    _dumped_blocks: Dict['Hash32', bytes] = OrderedDict()  # {block hash: json bytes} shared by all serializers
+    _dumped_blocks_lock = threading.Lock()
+
+    def __init__(self, tx_versioner: 'TransactionVersioner', trusted=False):
+        """
+        :param tx_versioner:
+        :param trusted: True if blocks are read from the store of this node.
+        Hashes of txs in the blocks are used without recomputation.
+        """
         self._tx_versioner = tx_versioner
+        self._trusted = trusted
+        self._tx_serializers: Dict[Tuple[str, str], TransactionSerializer] = {}
 
     def serialize(self, block: 'Block') -> dict:
         if block.header.version != self.version:
@@ -22,15 +40,50 @@ class BlockSerializer(ABC):
                                        "The block of this version cannot be serialized by the serializer.")
         return self._serialize(block)
 
+    def dumps(self, block: 'Block') -> bytes:
+        """Serialize the block to json bytes.
+
+        The json of the latest blocks is cached by their hashes up to `conf.MAX_DUMPED_BLOCK_CACHE_SIZE`,
+        so a block is serialized once for broadcasts, sync, subscribers and the json block store.
+        """
+        block_hash = block.header.hash
+        with self._dumped_blocks_lock:
+            block_dumped = self._dumped_blocks.get(block_hash)
+            if block_dumped is not None:
+                self._dumped_blocks.move_to_end(block_hash)
+                return block_dumped
+
+        block_dumped = json.dumps(self.serialize(block)).encode(conf.PEER_DATA_ENCODING)
+        if block_hash is None:
+            return block_dumped
+
+        with self._dumped_blocks_lock:
+            self._dumped_blocks[block_hash] = block_dumped
+            while len(self._dumped_blocks) > conf.MAX_DUMPED_BLOCK_CACHE_SIZE:
+                self._dumped_blocks.popitem(last=False)
+        return block_dumped
+
     @abstractmethod
     def _serialize(self, block: 'Block') -> dict:
         raise NotImplementedError
 
     def deserialize(self, block_dumped: dict) -> 'Block':
+        self._check_version(block_dumped)
+        return self._deserialize(block_dumped)
+
+    def deserialize_header(self, block_dumped: dict) -> 'BlockHeader':
+        """Deserialize the header only. `block_dumped` does not need to have `body_keys`."""
+        self._check_version(block_dumped)
+        return self.BlockHeaderClass(**self._deserialize_header_data(block_dumped))
+
+    def deserialize_body(self, block_dumped: dict) -> 'BlockBody':
+        """Deserialize the body only. Use it with `deserialize_header` to make a `LazyBlock`."""
+        return self.BlockBodyClass(**self._deserialize_body_data(block_dumped))
+
+    def _check_version(self, block_dumped: dict):
         if block_dumped['version'] != self.version:
             raise BlockVersionNotMatch(block_dumped['version'], self.version,
                                        "The block of this version cannot be deserialized by the serializer.")
-        return self._deserialize(block_dumped)
 
     def _deserialize(self, json_data):
         header_data = self._deserialize_header_data(json_data)
@@ -40,6 +93,16 @@ class BlockSerializer(ABC):
         body = self.BlockBodyClass(**body_data)
         return Block(header, body)
 
+    def _deserialize_tx(self, tx_data: dict) -> 'Transaction':
+        tx_version, tx_type = self._tx_versioner.get_version(tx_data)
+        try:
+            ts = self._tx_serializers[(tx_version, tx_type)]
+        except KeyError:
+            ts = self._tx_serializers[(tx_version, tx_type)] = \
+                TransactionSerializer.new(tx_version, tx_type, self._tx_versioner)
+
+        return ts.from_trusted(tx_data) if self._trusted else ts.from_(tx_data)
+
     @abstractmethod
     def _deserialize_header_data(self, json_data: dict):
         raise NotImplementedError
@@ -49,21 +112,21 @@ class BlockSerializer(ABC):
         raise NotImplementedError
 
     @classmethod
-    def new(cls, version: str, tx_versioner: 'TransactionVersioner') -> 'BlockSerializer':
+    def new(cls, version: str, tx_versioner: 'TransactionVersioner', trusted=False) -> 'BlockSerializer':
         from . import v0_5
         if version == v0_5.version:
-            return v0_5.BlockSerializer(tx_versioner)
+            return v0_5.BlockSerializer(tx_versioner, trusted)
 
         from . import v0_4
         if version == v0_4.version:
-            return v0_4.BlockSerializer(tx_versioner)
+            return v0_4.BlockSerializer(tx_versioner, trusted)
 
         from . import v0_3
         if version == v0_3.version:
-            return v0_3.BlockSerializer(tx_versioner)
+            return v0_3.BlockSerializer(tx_versioner, trusted)
 
         from . import v0_1a
         if version == v0_1a.version:
-            return v0_1a.BlockSerializer(tx_versioner)
+            return v0_1a.BlockSerializer(tx_versioner, trusted)
 
         raise NotImplementedError(f"BlockBuilder Version({version}) not supported.")
@@ -13,6 +13,12 @@ class BlockProver(BaseBlockProver):
     def get_proof_root(self):
         raise RuntimeError(f"get_proof_root: Not supported ver: {self.version}")
 
+    def dumps_tree(self):
+        raise RuntimeError(f"dumps_tree: Not supported ver: {self.version}")
+
+    def loads_tree(self, tree_dumped: bytes):
+        raise RuntimeError(f"loads_tree: Not supported ver: {self.version}")
+
     def prove(self, hash_: Hash32, root_hash: Hash32, proof: list):
         raise RuntimeError(f"prove: Not supported ver: {self.version}")
 
@@ -9,6 +9,7 @@ class BlockSerializer(BaseBlockSerializer):
     version = BlockHeader.version
     BlockHeaderClass = BlockHeader
     BlockBodyClass = BlockBody
+    body_keys = ("confirmed_transaction_list", "confirm_prev_block")
 
     def _serialize(self, block: 'Block'):
         header: BlockHeader = block.header
@@ -64,9 +65,7 @@ class BlockSerializer(BaseBlockSerializer):
 
         transactions = OrderedDict()
         for tx_data in json_data['confirmed_transaction_list']:
-            tx_version, tx_type = self._tx_versioner.get_version(tx_data)
-            ts = TransactionSerializer.new(tx_version, tx_type, self._tx_versioner)
-            tx = ts.from_(tx_data)
+            tx = self._deserialize_tx(tx_data)
             transactions[tx.hash] = tx
 
         return {
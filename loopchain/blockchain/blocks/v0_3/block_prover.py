@@ -28,6 +28,15 @@ class BlockProver(BaseBlockProver):
         root = self._merkle_tree.get_merkle_root()
         return Hash32(root) if root is not None else Hash32.empty()
 
+    def dumps_tree(self) -> bytes:
+        if not self._merkle_tree.is_ready:
+            self.make_tree()
+        return self._merkle_tree.dumps()
+
+    def loads_tree(self, tree_dumped: bytes):
+        """Restore the tree dumped by `dumps_tree`. Proofs can be made by index without re-hashing the values."""
+        self._merkle_tree = MerkleTree.loads(tree_dumped)
+
     def prove(self, hash_: Hash32, root_hash: Hash32, proof: list) -> bool:
         return MerkleTree.validate_proof(proof, hash_, root_hash)
 
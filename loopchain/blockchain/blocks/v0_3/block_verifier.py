@@ -13,6 +13,7 @@
 # limitations under the License.
 """block verifier for version 0.3 block"""
 
+import itertools
 from typing import TYPE_CHECKING, Callable, Sequence
 
 from loopchain import configure as conf
@@ -20,6 +21,7 @@ from loopchain.blockchain.blocks import BlockVerifier as BaseBlockVerifier
 from loopchain.blockchain.blocks.v0_3 import BlockHeader, BlockBody, BlockBuilder
 from loopchain.blockchain.exception import NotInReps
 from loopchain.blockchain.types import ExternalAddress, Hash32
+from loopchain.blockchain.votes import Vote
 from loopchain.blockchain.votes.v0_3 import BlockVotes, LeaderVotes
 
 if TYPE_CHECKING:
@@ -44,6 +46,8 @@ class BlockVerifier(BaseBlockVerifier):
             self._handle_exception(exception)
 
         if header.height > 0:
+            # Signatures of both votes are verified in a batch, and `verify` of the votes uses the cached results.
+            Vote.verify_many(itertools.chain(body.leader_votes, body.prev_votes))
             self.verify_leader_votes(block, prev_block, reps)
 
         if header.height > 1:
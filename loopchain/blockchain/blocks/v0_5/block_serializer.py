@@ -70,9 +70,7 @@ class BlockSerializer(BlockSerializer):
     def _deserialize_body_data(self, json_data: dict):
         transactions = OrderedDict()
         for tx_data in json_data['transactions']:
-            tx_version, tx_type = self._tx_versioner.get_version(tx_data)
-            ts = TransactionSerializer.new(tx_version, tx_type, self._tx_versioner)
-            tx = ts.from_(tx_data)
+            tx = self._deserialize_tx(tx_data)
             transactions[tx.hash] = tx
 
         vote_class = BlockVotes
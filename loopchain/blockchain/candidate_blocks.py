@@ -14,7 +14,7 @@
 """Candidate Blocks"""
 
 import threading
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Set
 
 from loopchain import utils, configure as conf
 from loopchain.blockchain.blocks import Block
@@ -91,22 +91,33 @@ class CandidateBlock:
 
 
 class CandidateBlocks:
+    """Candidate blocks indexed by block hash, height and prev_hash.
+
+    `blocks` keeps the insertion order, which is also the order of `start_time`,
+    so expired candidates are swept from the oldest one.
+    """
+
     def __init__(self, blockchain):
         self.blocks: Dict[Hash32, CandidateBlock] = {}
         self.__blocks_lock = threading.Lock()
         self._blockchain = blockchain
 
+        self._hashes_by_height: Dict[int, Set[Hash32]] = {}
+        self._hashes_by_prev_hash: Dict[Hash32, Set[Hash32]] = {}  # only candidates which have their blocks
+
     def add_vote(self, vote: 'BlockVote'):
         with self.__blocks_lock:
             if vote.block_hash != Hash32.empty() and vote.block_hash not in self.blocks:
-                self.blocks[vote.block_hash] = CandidateBlock.from_hash(vote.block_hash, vote.block_height)
+                self._put_block(CandidateBlock.from_hash(vote.block_hash, vote.block_height))
 
-        if vote.block_hash != Hash32.empty():
-            self.blocks[vote.block_hash].add_vote(vote)
-        else:
-            for block in self.blocks.values():
-                if block.height == vote.block_height:
-                    block.add_vote(vote)
+            if vote.block_hash != Hash32.empty():
+                candidate_blocks = [self.blocks[vote.block_hash]]
+            else:
+                candidate_blocks = [self.blocks[block_hash]
+                                    for block_hash in self._hashes_by_height.get(vote.block_height, ())]
+
+        for candidate_block in candidate_blocks:
+            candidate_block.add_vote(vote)
 
     def get_votes(self, block_hash, round_: int):
         votes = self.blocks[block_hash].votes
@@ -121,18 +132,45 @@ class CandidateBlocks:
 
         with self.__blocks_lock:
             if block.header.hash not in self.blocks:
-                self.blocks[block.header.hash] = CandidateBlock.from_block(block, reps)
+                self._put_block(CandidateBlock.from_block(block, reps))
             else:
                 self.blocks[block.header.hash].add_block(block, reps)
+            self._hashes_by_prev_hash.setdefault(block.header.prev_hash, set()).add(block.header.hash)
 
     def remove_block(self, block_hash):
-        if block_hash in self.blocks and self.blocks[block_hash].block:
-            prev_block_hash = self.blocks[block_hash].block.header.prev_hash
-
-            for _block_hash in list(self.blocks.keys()):
-                if self.blocks[_block_hash].block:
-                    if self.blocks[_block_hash].block.header.prev_hash == prev_block_hash:
-                        self.blocks.pop(_block_hash, None)
-                        continue
-                if utils.diff_in_seconds(self.blocks[_block_hash].start_time) >= conf.CANDIDATE_BLOCK_TIMEOUT:
-                    self.blocks.pop(_block_hash, None)
+        """Remove the block and its siblings which have the same prev_hash. Expired candidates are removed too."""
+        with self.__blocks_lock:
+            candidate_block = self.blocks.get(block_hash)
+            if candidate_block and candidate_block.block:
+                prev_block_hash = candidate_block.block.header.prev_hash
+                for sibling_hash in list(self._hashes_by_prev_hash.get(prev_block_hash, ())):
+                    self._pop_block(sibling_hash)
+                self._expire_blocks()
+
+    def _put_block(self, candidate_block: CandidateBlock):
+        self.blocks[candidate_block.hash] = candidate_block
+        self._hashes_by_height.setdefault(candidate_block.height, set()).add(candidate_block.hash)
+
+    def _pop_block(self, block_hash: Hash32):
+        candidate_block = self.blocks.pop(block_hash, None)
+        if candidate_block is None:
+            return
+
+        self._discard_hash(self._hashes_by_height, candidate_block.height, block_hash)
+        if candidate_block.block:
+            self._discard_hash(self._hashes_by_prev_hash, candidate_block.block.header.prev_hash, block_hash)
+
+    def _expire_blocks(self):
+        while self.blocks:
+            oldest_block = next(iter(self.blocks.values()))
+            if utils.diff_in_seconds(oldest_block.start_time) < conf.CANDIDATE_BLOCK_TIMEOUT:
+                break
+            self._pop_block(oldest_block.hash)
+
+    @staticmethod
+    def _discard_hash(hashes_by_key: Dict, key, block_hash: Hash32):
+        hashes = hashes_by_key.get(key)
+        if hashes is not None:
+            hashes.discard(block_hash)
+            if not hashes:
+                del hashes_by_key[key]
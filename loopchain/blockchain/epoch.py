@@ -16,7 +16,7 @@ Candidate Blocks, Quorum, Votes and Leader Complaints.
 """
 
 import traceback
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 import time
 from pkg_resources import parse_version
@@ -144,6 +144,30 @@ class Epoch:
                     f"_txQueue size ({len(tx_queue)})")
                 break
 
+            txs = self.__get_txs_from_queue(tx_queue, block_builder.fixed_timestamp,
+                                            conf.MAX_TX_SIZE_IN_BLOCK - block_tx_size)
+            if not txs:
+                break
+
+            exceptions = TransactionVerifier.verify_many(txs, tx_versioner, self.__blockchain)
+            for tx, exception in zip(txs, exceptions):
+                if exception:
+                    utils.logger.warning(
+                        f"tx hash invalid.\n"
+                        f"tx: {tx}\n"
+                        f"exception: {exception}"
+                    )
+                    traceback.print_exception(type(exception), exception, exception.__traceback__)
+                else:
+                    block_builder.transactions[tx.hash] = tx
+                    block_tx_size += tx.size(tx_versioner)
+
+    def __get_txs_from_queue(self, tx_queue, block_timestamp: int, max_size: int) -> List['Transaction']:
+        """Take txs to be verified together until their total size reaches `max_size`."""
+        txs = []
+        txs_size = 0
+        tx_versioner = self.__blockchain.tx_versioner
+        while txs_size < max_size:
             tx: 'Transaction' = tx_queue.get_item_in_status(
                 get_status=TransactionStatusInQueue.normal,
                 set_status=TransactionStatusInQueue.added_to_block
@@ -151,27 +175,15 @@ class Epoch:
             if tx is None:
                 break
 
-            block_timestamp = block_builder.fixed_timestamp
             if not utils.is_in_time_boundary(tx.timestamp, conf.TIMESTAMP_BOUNDARY_SECOND, block_timestamp):
                 utils.logger.info(f"fail add tx to block by TIMESTAMP_BOUNDARY_SECOND"
                                   f"({conf.TIMESTAMP_BOUNDARY_SECOND}) "
                                   f"tx({tx.hash}), timestamp({tx.timestamp})")
                 continue
 
-            tv = TransactionVerifier.new(tx.version, tx.type(), tx_versioner)
-
-            try:
-                tv.verify(tx, self.__blockchain)
-            except Exception as e:
-                utils.logger.warning(
-                    f"tx hash invalid.\n"
-                    f"tx: {tx}\n"
-                    f"exception: {e}"
-                )
-                traceback.print_exc()
-            else:
-                block_builder.transactions[tx.hash] = tx
-                block_tx_size += tx.size(tx_versioner)
+            txs.append(tx)
+            txs_size += tx.size(tx_versioner)
+        return txs
 
     def remove_duplicate_tx_when_turn_to_leader(self):
         if self.__blockchain.last_unconfirmed_block and \
@@ -15,95 +15,148 @@
 # link: https://github.com/Tierion/pymerkletools/
 
 import hashlib
-from typing import Union, Iterable, ByteString
+from typing import Union, Iterable, ByteString, List, Optional
 
 
 class MerkleTree:
+    """Merkle tree which is updated incrementally whenever a leaf is appended.
+
+    Each level is stored as one bytearray of fixed-size nodes and levels are kept bottom-up,
+    so appending a leaf only touches the right-most node of each level, O(log n).
+    A node without a sibling is promoted to the upper level as it is.
+    """
     hash_function = hashlib.sha3_256
+    node_size = hash_function().digest_size
+    leaf_count_bytes_len = 4
 
     def __init__(self):
-        self.leaves = list()
-        self.levels = None
+        self.levels: List[bytearray] = None
         self.is_ready = False
 
         self.reset_tree()
 
     def reset_tree(self):
-        self.leaves = list()
-        self.levels = None
+        self.levels = [bytearray()]
         self.is_ready = False
 
+    @property
+    def leaves(self) -> List[bytes]:
+        return [self.get_leaf(index) for index in range(self.get_leaf_count())]
+
     def add_leaf(self, values: Union[Iterable[ByteString], ByteString], do_hash=False):
-        self.is_ready = False
         # check if single leaf
-        if not isinstance(values, Iterable):
+        if not isinstance(values, Iterable) or isinstance(values, (bytes, bytearray)):
             values = [values]
 
         for v in values:
             if do_hash:
                 v = self.hash_function(v).digest()
             v = bytes(v)
-            self.leaves.append(v)
+            if len(v) != self.node_size:
+                raise ValueError(f"Size of a leaf must be {self.node_size}. leaf({v.hex()})")
+            self._append_leaf(v)
+        self.is_ready = True
+
+    def _append_leaf(self, leaf: bytes):
+        self.levels[0] += leaf
+        index = self.get_leaf_count() - 1
+
+        # Only the right-most node of each level is affected by the new leaf.
+        level_index = 0
+        while self._count(self.levels[level_index]) > 1:
+            level = self.levels[level_index]
+            if index % 2:
+                node = self.hash_function(self._get_node(level, index - 1) + self._get_node(level, index)).digest()
+            else:
+                node = self._get_node(level, index)  # odd end node is promoted
+
+            if level_index + 1 == len(self.levels):
+                self.levels.append(bytearray())
+            upper_level = self.levels[level_index + 1]
+
+            index //= 2
+            if index == self._count(upper_level):
+                upper_level += node
+            else:
+                self._set_node(upper_level, index, node)
+            level_index += 1
 
     def get_leaf(self, index):
-        return self.leaves[index]
+        return self._get_node(self.levels[0], index)
 
     def get_leaf_count(self):
-        return len(self.leaves)
+        return self._count(self.levels[0])
 
     def get_tree_ready_state(self):
         return self.is_ready
 
-    def _calculate_next_level(self):
-        solo_leave = None
-        N = len(self.levels[0])  # number of leaves on the level
-        if N % 2 == 1:  # if odd number of leaves on the level
-            solo_leave = self.levels[0][-1]
-            N -= 1
-
-        new_level = []
-        for l, r in zip(self.levels[0][0:N:2], self.levels[0][1:N:2]):
-            new_level.append(self.hash_function(l+r).digest())
-        if solo_leave is not None:
-            new_level.append(solo_leave)
-        self.levels = [new_level, ] + self.levels  # prepend new level
-
     def make_tree(self):
-        self.is_ready = False
-        if self.get_leaf_count() > 0:
-            self.levels = [self.leaves, ]
-            while len(self.levels[0]) > 1:
-                self._calculate_next_level()
+        """The tree is always up to date. It is left for compatibility."""
         self.is_ready = True
 
     def get_merkle_root(self):
-        if self.is_ready:
-            if self.levels is not None:
-                return self.levels[0][0]
-            else:
-                return None
-        else:
+        if not self.is_ready or not self.get_leaf_count():
             return None
+        return bytes(self.levels[-1][:self.node_size])
 
     def get_proof(self, index):
-        if self.levels is None:
+        leaf_count = self.get_leaf_count()
+        if not self.is_ready or not leaf_count:
             return None
-        elif not self.is_ready or index > len(self.leaves)-1 or index < 0:
+        elif index > leaf_count - 1 or index < 0:
             return None
-        else:
-            proof = []
-            for x in range(len(self.levels) - 1, 0, -1):
-                level_len = len(self.levels[x])
-                if (index == level_len - 1) and (level_len % 2 == 1):  # skip if this is an odd end node
-                    index = int(index / 2.)
-                    continue
-                is_right_node = index % 2
-                sibling_index = index - 1 if is_right_node else index + 1
-                sibling_pos = "left" if is_right_node else "right"
-                sibling_value = self.levels[x][sibling_index]
-                proof.append({sibling_pos: sibling_value})
-                index = int(index / 2.)
-            return proof
+
+        proof = []
+        for level in self.levels[:-1]:
+            level_len = self._count(level)
+            if (index == level_len - 1) and (level_len % 2 == 1):  # skip if this is an odd end node
+                index //= 2
+                continue
+            is_right_node = index % 2
+            sibling_index = index - 1 if is_right_node else index + 1
+            sibling_pos = "left" if is_right_node else "right"
+            sibling_value = self._get_node(level, sibling_index)
+            proof.append({sibling_pos: sibling_value})
+            index //= 2
+        return proof
+
+    def dumps(self) -> bytes:
+        """Dump the whole tree. The level layout is derived from the leaf count when loading."""
+        leaf_count = self.get_leaf_count().to_bytes(self.leaf_count_bytes_len, "big")
+        return leaf_count + b"".join(self.levels)
+
+    @classmethod
+    def loads(cls, tree_dumped: bytes) -> 'MerkleTree':
+        leaf_count = int.from_bytes(tree_dumped[:cls.leaf_count_bytes_len], "big")
+        offset = cls.leaf_count_bytes_len
+
+        tree = cls()
+        tree.levels = []
+        count = leaf_count
+        while True:
+            level_size = count * cls.node_size
+            tree.levels.append(bytearray(tree_dumped[offset:offset + level_size]))
+            offset += level_size
+            if count <= 1:
+                break
+            count = (count + 1) // 2
+
+        if offset != len(tree_dumped):
+            raise ValueError(f"Invalid merkle tree dump. leaf_count({leaf_count}), size({len(tree_dumped)})")
+        tree.is_ready = True
+        return tree
+
+    @classmethod
+    def _count(cls, level: bytearray) -> int:
+        return len(level) // cls.node_size
+
+    @classmethod
+    def _get_node(cls, level: bytearray, index: int) -> bytes:
+        return bytes(level[index * cls.node_size:(index + 1) * cls.node_size])
+
+    @classmethod
+    def _set_node(cls, level: bytearray, index: int, node: bytes):
+        level[index * cls.node_size:(index + 1) * cls.node_size] = node
 
     @classmethod
     def validate_proof(cls, proof, target_hash, merkle_root):
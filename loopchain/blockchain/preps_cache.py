@@ -0,0 +1,81 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of decoded preps by roothash"""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from loopchain.blockchain.types import Hash32, ExternalAddress, Address, Reps
+
+__all__ = ("Preps", "PrepsCache")
+
+
+class Preps(NamedTuple):
+    """Preps of a roothash in the forms requested by consensus, votes and broadcast."""
+    preps: Tuple[Mapping[str, str], ...]
+    ids: Tuple[str, ...]
+    addresses: Reps
+    targets: Mapping[str, str]
+
+    @classmethod
+    def from_preps(cls, preps: List[dict]) -> 'Preps':
+        ids = tuple(prep["id"] for prep in preps)
+        return cls(preps=tuple(MappingProxyType(prep) for prep in preps),
+                   ids=ids,
+                   addresses=Reps(Address.intern(ExternalAddress.fromhex(prep_id)) for prep_id in ids),
+                   targets=MappingProxyType({prep["id"]: prep["p2pEndpoint"] for prep in preps}))
+
+
+class PrepsCache:
+    """Thread-safe LRU cache of decoded preps by roothash.
+
+    Preps of a roothash never change, so only the entry of a rewritten roothash is removed.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._preps: Dict[Hash32, Preps] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._preps)
+
+    def get(self, roothash: Hash32) -> Optional[Preps]:
+        with self._lock:
+            preps = self._preps.get(roothash)
+            if preps is not None:
+                self._preps.move_to_end(roothash)
+            return preps
+
+    def put(self, roothash: Hash32, preps: List[dict]) -> Preps:
+        preps = Preps.from_preps(preps)
+        if self.max_size <= 0:
+            return preps
+
+        with self._lock:
+            self._preps[roothash] = preps
+            self._preps.move_to_end(roothash)
+            while len(self._preps) > self.max_size:
+                self._preps.popitem(last=False)
+        return preps
+
+    def remove(self, roothash: Hash32):
+        with self._lock:
+            self._preps.pop(roothash, None)
+
+    def clear(self):
+        with self._lock:
+            self._preps.clear()
@@ -32,6 +32,15 @@ class TransactionSerializer(ABC):
     def from_(self, tx_dumped: dict) -> 'Transaction':
         raise NotImplementedError
 
+    def from_trusted(self, tx_dumped: dict, tx_hash: str = None) -> 'Transaction':
+        """Deserialize tx from the data which this node stored. The hash in the data is used without recomputation.
+        Hash of the tx is verified by `TransactionVerifier.verify_hash` if needed.
+
+        :param tx_dumped: tx data
+        :param tx_hash: hash of the tx if it is not in the data
+        """
+        return self.from_(tx_dumped)
+
     @abstractmethod
     def get_hash(self, tx_dumped: dict) -> str:
         raise NotImplementedError
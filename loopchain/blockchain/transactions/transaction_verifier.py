@@ -1,6 +1,6 @@
 import functools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Sequence, List, Optional, Dict, Tuple
 
 from loopchain.blockchain.exception import TransactionDuplicatedHashError, TransactionInvalidHashError
 from loopchain.blockchain.exception import TransactionInvalidSignatureError
@@ -100,6 +100,58 @@ class TransactionVerifier(ABC):
             exception = TransactionInvalidSignatureError(tx, message=str(e))
             self._handle_exceptions(exception)
 
+    @classmethod
+    def verify_many(cls, txs: Sequence['Transaction'], versioner: 'TransactionVersioner', blockchain=None) \
+            -> List[Optional[Exception]]:
+        """Verify txs in bulk.
+
+        Signatures of all txs are verified at once by `verify_signatures`, and the rest is verified tx by tx.
+
+        :return: exception of each tx. None if the tx is verified.
+        """
+        cls.verify_signatures(txs, versioner)
+
+        results = []
+        for tx in txs:
+            tv = cls.new(tx.version, tx.type(), versioner)
+            try:
+                tv.verify(tx, blockchain)
+            except Exception as e:
+                results.append(e)
+            else:
+                results.append(None)
+        return results
+
+    @classmethod
+    def verify_signatures(cls, txs: Iterable['Transaction'], versioner: 'TransactionVersioner'):
+        """Verify signatures of txs in bulk and cache the results to each tx.
+
+        `verify_signature` of the txs returns the cached result afterwards. Already verified txs are skipped.
+        """
+        attr_name = "_cache_" + cls.verify_signature.__name__
+        allow_unsigned: Dict[Tuple[str, str], bool] = {}
+
+        targets = []
+        for tx in txs:
+            if hasattr(tx, attr_name):
+                continue
+
+            key = (tx.version, tx.type())
+            if key not in allow_unsigned:
+                allow_unsigned[key] = cls.new(tx.version, tx.type(), versioner)._allow_unsigned
+            if allow_unsigned[key] and not tx.is_signed():
+                continue
+            targets.append(tx)
+
+        if not targets:
+            return
+
+        items = [(tx.signer_address.hex_xx(), bytes(tx.hash), tx.signature) for tx in targets]
+        errors = SignVerifier.verify_hash_many(items)
+        for tx, error in zip(targets, errors):
+            result = TransactionInvalidSignatureError(tx, message=error) if error else True
+            object.__setattr__(tx, attr_name, result)
+
     def _handle_exceptions(self, exception: Exception):
         if self._raise_exceptions:
             raise exception
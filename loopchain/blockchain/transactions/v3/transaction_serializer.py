@@ -23,13 +23,24 @@ class TransactionSerializer(BaseTransactionSerializer):
         return dict(tx.raw_data)
 
     def from_(self, tx_data: dict) -> 'Transaction':
-        tx_data_copied = dict(tx_data)
-        tx_data_copied.pop('txHash', None)
-        raw_data = dict(tx_data_copied)
+        raw_data = dict(tx_data)
+        raw_data.pop('txHash', None)
 
-        tx_data_copied.pop('signature', None)
-        tx_hash = self._hash_generator.generate_hash(tx_data_copied)
+        origin_data = dict(raw_data)
+        origin_data.pop('signature', None)
+        tx_hash = self._hash_generator.generate_hash(origin_data)
+        return self._from(tx_data, raw_data, Hash32(tx_hash))
 
+    def from_trusted(self, tx_data: dict, tx_hash: str = None) -> 'Transaction':
+        tx_hash = tx_hash or tx_data.get('txHash')
+        if tx_hash is None:
+            return self.from_(tx_data)
+
+        raw_data = dict(tx_data)
+        raw_data.pop('txHash', None)
+        return self._from(tx_data, raw_data, Hash32.fromhex(tx_hash, ignore_prefix=not tx_hash.startswith("0x")))
+
+    def _from(self, tx_data: dict, raw_data: dict, tx_hash: Hash32) -> 'Transaction':
         nonce = tx_data.get('nonce')
         if nonce is not None:
             nonce = int(nonce, 16)
@@ -40,7 +51,7 @@ class TransactionSerializer(BaseTransactionSerializer):
 
         return Transaction(
             raw_data=raw_data,
-            hash=Hash32(tx_hash),
+            hash=tx_hash,
             signature=Signature.from_base64str(tx_data['signature']),
             timestamp=int(tx_data['timestamp'], 16),
             from_address=Address.fromhex_address(tx_data['from']),
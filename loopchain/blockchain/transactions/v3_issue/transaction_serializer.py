@@ -21,15 +21,25 @@ class TransactionSerializer(BaseTransactionSerializer):
         return dict(tx.raw_data)
 
     def from_(self, tx_data: dict) -> 'Transaction':
-        tx_data_copied = dict(tx_data)
-        tx_data_copied.pop('txHash', None)
-        raw_data = dict(tx_data_copied)
+        raw_data = dict(tx_data)
+        raw_data.pop('txHash', None)
 
-        tx_hash = self._hash_generator.generate_hash(tx_data_copied)
+        tx_hash = self._hash_generator.generate_hash(dict(raw_data))
+        return self._from(tx_data, raw_data, Hash32(tx_hash))
 
+    def from_trusted(self, tx_data: dict, tx_hash: str = None) -> 'Transaction':
+        tx_hash = tx_hash or tx_data.get('txHash')
+        if tx_hash is None:
+            return self.from_(tx_data)
+
+        raw_data = dict(tx_data)
+        raw_data.pop('txHash', None)
+        return self._from(tx_data, raw_data, Hash32.fromhex(tx_hash, ignore_prefix=not tx_hash.startswith("0x")))
+
+    def _from(self, tx_data: dict, raw_data: dict, tx_hash: Hash32) -> 'Transaction':
         return Transaction(
             raw_data=raw_data,
-            hash=Hash32(tx_hash),
+            hash=tx_hash,
             signature=None,
             timestamp=int(tx_data['timestamp'], 16),
             data_type=tx_data.get('dataType'),
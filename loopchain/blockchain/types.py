@@ -1,12 +1,22 @@
 import base64
+import threading
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Union, Type, TypeVar
+from typing import Dict, Iterable, Union, Type, TypeVar
 
 T = TypeVar('T', bound='Bytes')
 
+# The max count of addresses which can be interned by `Address.intern`. The least recently interned is evicted.
+MAX_INTERNED_ADDRESSES = 1024
+
+_interned_addresses: Dict[str, 'Address'] = OrderedDict()
+_interned_addresses_lock = threading.Lock()
+
 
 class Bytes(bytes):
+    """Sized bytes. String forms are memoized in the instance because they are requested repeatedly
+    for the same value by serializers, stores and logs. Subtypes of bytes cannot have non-empty __slots__."""
     size = None
     prefix = None
 
@@ -25,6 +35,10 @@ class Bytes(bytes):
         type_name = type(self).__qualname__
         return type_name + "(" + self.hex_xx() + ")"
 
+    def __reduce__(self):
+        # Memoized string forms are not pickled.
+        return type(self), (bytes(self), )
+
     @classmethod
     def new(cls: Type[T]) -> T:
         """
@@ -37,11 +51,28 @@ class Bytes(bytes):
     def empty(cls):
         return cls.new()
 
+    def hex(self, *args, **kwargs) -> str:
+        if args or kwargs:
+            return super().hex(*args, **kwargs)
+
+        try:
+            return self._hex
+        except AttributeError:
+            self._hex = super().hex()
+            return self._hex
+
     def hex_xx(self):
         if self.prefix:
-            return self.prefix + self.hex()
+            return self._hex_with_prefix()
         return self.hex()
 
+    def _hex_with_prefix(self) -> str:
+        try:
+            return self._hex_prefixed
+        except AttributeError:
+            self._hex_prefixed = self.prefix + self.hex()
+            return self._hex_prefixed
+
     @classmethod
     def fromhex(cls: Type[T], value: str, ignore_prefix=False, allow_malformed=False) -> Union[T, 'MalformedStr']:
         if isinstance(cls, Address):
@@ -72,7 +103,7 @@ class VarBytes(Bytes):
     prefix = '0x'
 
     def hex_0x(self):
-        return self.prefix + self.hex()
+        return self._hex_with_prefix()
 
 
 class Hash32(VarBytes):
@@ -91,6 +122,10 @@ class Address(Bytes, metaclass=ABCMeta):
                         value: str,
                         allow_malformed=False) -> Union['ExternalAddress', 'ContractAddress', 'MalformedStr']:
         try:
+            address = _interned_addresses.get(value)
+            if address is not None:
+                return address
+
             prefix, contents = value[:2], value[2:]
 
             if len(contents) != cls.size * 2:
@@ -111,12 +146,43 @@ class Address(Bytes, metaclass=ABCMeta):
 
         return MalformedStr(cls, value)
 
+    @classmethod
+    def fromhex(cls: Type[T], value: str, ignore_prefix=False, allow_malformed=False) -> Union[T, 'MalformedStr']:
+        if isinstance(value, str) and not ignore_prefix:
+            address = _interned_addresses.get(value)
+            if type(address) is cls:
+                return address
+        return super().fromhex(value, ignore_prefix, allow_malformed)
+
+    @staticmethod
+    def intern(address: 'Address') -> 'Address':
+        """Return the interned address equal to the address, or intern it.
+
+        Interned addresses are returned by `fromhex` and `fromhex_address` of their hex strings,
+        so their memoized string forms are shared. Intern frequently seen addresses only. e.g. reps
+        Interning an interned address again keeps it from being evicted.
+        """
+        if not isinstance(address, Address):
+            return address
+
+        key = address.hex_xx()
+        with _interned_addresses_lock:
+            interned = _interned_addresses.get(key)
+            if interned is not None:
+                _interned_addresses.move_to_end(key)
+                return interned
+
+            _interned_addresses[key] = address
+            while len(_interned_addresses) > MAX_INTERNED_ADDRESSES:
+                _interned_addresses.popitem(last=False)
+        return address
+
 
 class ExternalAddress(Address):
     prefix = "hx"
 
     def hex_hx(self):
-        return self.prefix + self.hex()
+        return self._hex_with_prefix()
 
     def extend(self) -> 'ExternalAddressEx':
         return ExternalAddressEx(ExternalAddressEx.prefix_bytes + self)
@@ -126,7 +192,7 @@ class ContractAddress(Address):
     prefix = "cx"
 
     def hex_cx(self):
-        return self.prefix + self.hex()
+        return self._hex_with_prefix()
 
     def extend(self) -> 'ContractAddressEx':
         return ContractAddressEx(ContractAddressEx.prefix_bytes + self)
@@ -187,7 +253,11 @@ class Signature(Bytes):
         return base64.b64encode(self)
 
     def to_base64str(self):
-        return self.to_base64().decode('utf-8')
+        try:
+            return self._base64str
+        except AttributeError:
+            self._base64str = self.to_base64().decode('utf-8')
+            return self._base64str
 
     def __str__(self):
         type_name = type(self).__qualname__
@@ -204,6 +274,32 @@ class Signature(Bytes):
         return cls.from_base64(base64_bytes)
 
 
+class Reps(tuple):
+    """Tuple of rep addresses which finds the index of a rep in O(1)."""
+
+    def __new__(cls, reps: Iterable['Address'] = ()):
+        self = super().__new__(cls, reps)
+        self._indexes = {}
+        for index, rep in enumerate(self):
+            self._indexes.setdefault(rep, index)
+        return self
+
+    def index(self, rep, *args) -> int:
+        if args:
+            return super().index(rep, *args)
+
+        try:
+            return self._indexes[rep]
+        except (KeyError, TypeError):
+            raise ValueError(f"{rep!r} is not in reps")
+
+    def __contains__(self, rep) -> bool:
+        try:
+            return rep in self._indexes
+        except TypeError:
+            return False
+
+
 class MalformedStr:
     def __init__(self, origin_type, value):
         self.origin_type = origin_type
@@ -27,6 +27,7 @@ class BlockVotes(BaseVotes[BlockVote]):
         self.block_height = block_height
         self.round = round_
         self.block_hash = block_hash
+        self._block_hash_counts = Counter()
         super().__init__(reps, voting_ratio, votes)
 
     def verify_vote(self, vote: BlockVote):
@@ -43,17 +44,19 @@ class BlockVotes(BaseVotes[BlockVote]):
                                f"{vote}")
         super().verify_vote(vote)
 
+    def _count_vote(self, vote: BlockVote, delta: int):
+        super()._count_vote(vote, delta)
+        self._add_count(self._block_hash_counts, vote.block_hash, delta)
+
     def is_completed(self):
         return self.get_result() is not None
 
     def get_result(self):
-        true_vote_count = sum(1 for vote in self.votes
-                              if vote and vote.block_hash == self.block_hash)
+        true_vote_count = self._block_hash_counts[self.block_hash]
         if true_vote_count >= self.quorum:
             return True
 
-        false_vote_count = sum(1 for vote in self.votes
-                               if vote and vote.block_hash == Hash32.empty())
+        false_vote_count = self._block_hash_counts[Hash32.empty()]
         if false_vote_count >= len(self.reps) - self.quorum + 1:
             return False
         return None
@@ -113,7 +116,7 @@ class LeaderVotes(BaseVotes[LeaderVote]):
             if majority_count + out_of_round_count >= self.quorum:
                 return True
 
-            empty_count = self.votes.count(None)
+            empty_count = self.get_empty_count()
             if majority_count + out_of_round_count + empty_count < self.quorum:
                 # It determines the majority of this votes cannot reach the quorum
                 return True
@@ -130,14 +133,12 @@ class LeaderVotes(BaseVotes[LeaderVote]):
         return None
 
     def get_majority(self):
-        counter = Counter(vote.result() for vote in self.votes if (vote and vote.result() != ExternalAddress.empty()))
-        majorities = counter.most_common()
-        return majorities
+        counter = Counter(self._result_counts)
+        del counter[ExternalAddress.empty()]
+        return self._most_common(counter)
 
     def get_out_of_round(self):
-        counter = Counter(vote.result() for vote in self.votes if vote)
-        out_of_round = counter[ExternalAddress.empty()]
-        return out_of_round
+        return self._result_counts[ExternalAddress.empty()]
 
     def get_summary(self):
         msg = super().get_summary()
@@ -169,8 +170,8 @@ class LeaderVotes(BaseVotes[LeaderVote]):
             reps = [vote.rep for vote in votes]
             votes_instance = cls(reps, voting_ratio, votes[0].block_height, votes[0].round, votes[0].old_leader)
             for vote in votes:
-                index = reps.index(vote.rep)
-                votes_instance.votes[index] = vote
+                index = votes_instance.reps.index(vote.rep)
+                votes_instance._set_vote(index, vote)
             return votes_instance
         else:
             return cls([], voting_ratio, -1, -1, ExternalAddress.empty())
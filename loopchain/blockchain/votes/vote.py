@@ -13,9 +13,10 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+from dataclasses import dataclass, fields
+from typing import Generic, TypeVar, Iterable
 
+from loopchain import configure as conf
 from loopchain.blockchain.types import ExternalAddress, Signature, Hash32
 from loopchain.crypto.hashing import build_hash_generator
 from loopchain.crypto.signature import SignVerifier, Signer
@@ -23,6 +24,11 @@ from loopchain.crypto.signature import SignVerifier, Signer
 TResult = TypeVar("TResult")
 hash_generator = build_hash_generator(1, "icx_vote")
 
+# Attribute name of the cached result of `Vote.verify`. It is not a field so it does not affect `__eq__` and `__hash__`.
+_VERIFY_RESULT = "_cache_verify"
+# Attribute name of the cached result of `Vote.serialize`. Votes are serialized again in every block which has them.
+_SERIALIZE_RESULT = "_cache_serialize"
+
 
 @dataclass(frozen=True)
 class Vote(ABC, Generic[TResult]):
@@ -35,27 +41,57 @@ class Vote(ABC, Generic[TResult]):
         raise NotImplementedError
 
     def origin_args(self):
-        args = dict(self.__dict__)
-        args.pop("signature", None)
-        return args
+        # Only fields are the origin of the vote. Results cached to the vote are excluded.
+        return {field.name: getattr(self, field.name) for field in fields(self) if field.name != "signature"}
 
     def hash(self):
         return self.to_hash(**self.origin_args())
 
     def serialize(self):
-        origin_args = self.origin_args()
-        origin_data = self.to_origin_data(**origin_args)
-        origin_data["signature"] = self.signature.to_base64str()
-        return origin_data
+        origin_data = self.__dict__.get(_SERIALIZE_RESULT)
+        if origin_data is None:
+            origin_args = self.origin_args()
+            origin_data = self.to_origin_data(**origin_args)
+            origin_data["signature"] = self.signature.to_base64str()
+            object.__setattr__(self, _SERIALIZE_RESULT, origin_data)
+        return dict(origin_data)
 
     def verify(self):
-        hash_ = self.to_hash(**self.origin_args())
-        sign_verifier = SignVerifier.from_address(self.rep.hex_hx())
-        try:
-            sign_verifier.verify_hash(hash_, self.signature)
-        except Exception as e:
-            raise RuntimeError(f"Invalid vote signature. {self}"
-                               f"{e}")
+        """Verify the signature of the vote. The result is cached to the vote, so it is verified only once."""
+        result = self.__dict__.get(_VERIFY_RESULT)
+        if result is None:
+            hash_ = self.to_hash(**self.origin_args())
+            sign_verifier = SignVerifier.from_address(self.rep.hex_hx())
+            try:
+                sign_verifier.verify_hash(hash_, self.signature)
+            except Exception as e:
+                result = self._invalid_signature_error(str(e))
+            else:
+                result = True
+            object.__setattr__(self, _VERIFY_RESULT, result)
+
+        if result is not True:
+            raise result
+
+    @classmethod
+    def verify_many(cls, votes: Iterable['Vote']):
+        """Verify signatures of votes in bulk and cache the results to each vote.
+
+        `verify` of the votes returns the cached result afterwards. Already verified votes are skipped.
+        """
+        targets = [vote for vote in votes if vote and _VERIFY_RESULT not in vote.__dict__]
+        if not targets:
+            return
+
+        items = [(vote.rep.hex_hx(), bytes(vote.hash()), vote.signature) for vote in targets]
+        errors = SignVerifier.verify_hash_many(items, conf.VOTE_VERIFY_POOL_THRESHOLD)
+        for vote, error in zip(targets, errors):
+            result = vote._invalid_signature_error(error) if error else True
+            object.__setattr__(vote, _VERIFY_RESULT, result)
+
+    def _invalid_signature_error(self, message: str):
+        return RuntimeError(f"Invalid vote signature. {self}"
+                            f"{message}")
 
     @abstractmethod
     def result(self) -> TResult:
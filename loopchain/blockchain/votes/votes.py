@@ -17,7 +17,7 @@ from abc import ABC, abstractmethod
 from collections import Counter
 from typing import Iterable, List, Generic, TypeVar, Optional
 
-from loopchain.blockchain.types import ExternalAddress
+from loopchain.blockchain.types import ExternalAddress, Reps
 from loopchain.blockchain.votes import Vote
 
 TVote = TypeVar("TVote", bound=Vote)
@@ -28,7 +28,7 @@ class Votes(ABC, Generic[TVote]):
 
     def __init__(self, reps: Iterable['ExternalAddress'], voting_ratio: float, votes: List[TVote] = None):
         super().__init__()
-        self.reps = tuple(reps)
+        self.reps = reps if isinstance(reps, Reps) else Reps(reps)
         if votes is None:
             self.votes: List[Optional[TVote]] = [None] * len(self.reps)
         else:
@@ -36,6 +36,13 @@ class Votes(ABC, Generic[TVote]):
         self.voting_ratio = voting_ratio
         self.quorum = math.ceil(voting_ratio * len(self.reps))
 
+        # running tallies of votes, which are updated by `_set_vote`
+        self._vote_count = 0
+        self._result_counts = Counter()
+        for vote in self.votes:
+            if vote:
+                self._count_vote(vote, 1)
+
     def add_vote(self, vote: TVote):
         try:
             self.verify_vote(vote)
@@ -45,9 +52,32 @@ class Votes(ABC, Generic[TVote]):
             raise
         else:
             index = self.reps.index(vote.rep)
-            self.votes[index] = vote
+            self._set_vote(index, vote)
+
+    def _set_vote(self, index: int, vote: Optional[TVote]):
+        old_vote = self.votes[index]
+        if old_vote:
+            self._count_vote(old_vote, -1)
+
+        self.votes[index] = vote
+        if vote:
+            self._count_vote(vote, 1)
+
+    def _count_vote(self, vote: TVote, delta: int):
+        """Update tallies by the vote. Override it to keep more tallies."""
+        self._vote_count += delta
+        self._add_count(self._result_counts, vote.result(), delta)
+
+    @staticmethod
+    def _add_count(counter: Counter, key, delta: int):
+        count = counter[key] + delta
+        if count > 0:
+            counter[key] = count
+        else:
+            del counter[key]
 
     def verify(self):
+        self.VoteType.verify_many(self.votes)
         for rep, vote in zip(self.reps, self.votes):
             if not vote:
                 continue
@@ -112,16 +142,28 @@ class Votes(ABC, Generic[TVote]):
         raise NotImplementedError
 
     def get_majority(self):
-        counter = Counter(vote.result() for vote in self.votes if vote)
+        return self._most_common(self._result_counts)
+
+    def _most_common(self, counter: Counter) -> list:
+        """Return `counter.most_common()`. Results of the same count are in the order of their first votes."""
         majorities = counter.most_common()
+        if len({count for _, count in majorities}) < len(majorities):
+            first_indexes = {}
+            for index, vote in enumerate(self.votes):
+                if vote:
+                    first_indexes.setdefault(vote.result(), index)
+            majorities.sort(key=lambda majority: (-majority[1], first_indexes[majority[0]]))
         return majorities
 
+    def get_empty_count(self) -> int:
+        return len(self.votes) - self._vote_count
+
     def get_summary(self):
         def _fill_space(left_str):
             return ' ' * (length - len(str(left_str)))
 
         length = 8
-        counter = Counter(vote.result() for vote in self.votes if vote)
+        counter = self._result_counts
         for k, v in counter.items():
             length = max(length, len(str(k)))
         length += 1
@@ -130,7 +172,7 @@ class Votes(ABC, Generic[TVote]):
         for k, v in counter.items():
             msg += f"{k} {_fill_space(k)}: {v}/{len(self.reps)}\n"
 
-        empty_count = sum(1 for vote in self.votes if not vote)
+        empty_count = self.get_empty_count()
         msg += f"Empty {_fill_space('Empty')}: {empty_count}/{len(self.reps)}\n"
         msg += f"Result {_fill_space('Result')}: {self.get_result()}\n"
         msg += f"Quorum {_fill_space('Quorum')}: {self.quorum}\n"
@@ -222,20 +222,28 @@ class ChannelTxReceiverInnerTask:
             message = "Node initialization is not completed."
             return response_code, message
 
-        tx_list = []
-        for tx_item in request.tx_list:
-            tx_json = json.loads(tx_item.tx_json)
+        txs = []
+        for tx_json in self.__loads_tx_jsons(request.tx_list):
+            try:
+                tx_version, tx_type = self.__tx_versioner.get_version(tx_json)
+                ts = TransactionSerializer.new(tx_version, tx_type, self.__tx_versioner)
+                txs.append(ts.from_(tx_json))
+            except Exception as e:
+                util.logger.warning(f"fail to deserialize tx while AddTxList: {type(e)}, {e}")
 
-            tx_version, tx_type = self.__tx_versioner.get_version(tx_json)
+        # signatures of all txs are verified at once and pre_verify uses the cached results.
+        TransactionVerifier.verify_signatures(txs, self.__tx_versioner)
 
-            ts = TransactionSerializer.new(tx_version, tx_type, self.__tx_versioner)
-            tx = ts.from_(tx_json)
-
-            tv = TransactionVerifier.new(tx_version, tx_type, self.__tx_versioner)
-            tv.pre_verify(tx, nid=self.__nid)
+        tx_list = []
+        for tx in txs:
+            try:
+                tv = TransactionVerifier.new(tx.version, tx.type(), self.__tx_versioner)
+                tv.pre_verify(tx, nid=self.__nid)
+            except Exception as e:
+                util.logger.warning(f"fail tx validate while AddTxList: tx({tx.hash.hex()}), {type(e)}, {e}")
+                continue
 
             tx.size(self.__tx_versioner)
-
             tx_list.append(tx)
 
         tx_len = len(tx_list)
@@ -249,6 +257,21 @@ class ChannelTxReceiverInnerTask:
 
         return response_code, message
 
+    @staticmethod
+    def __loads_tx_jsons(tx_items) -> list:
+        """Decode tx_json of each item. Items which cannot be decoded are skipped.
+
+        Items are not joined to be decoded at once, because an item could be decoded to several txs
+        or together with its neighbours. One item must be one tx.
+        """
+        tx_jsons = []
+        for tx_item in tx_items:
+            try:
+                tx_jsons.append(json.loads(tx_item.tx_json))
+            except json.JSONDecodeError as e:
+                util.logger.warning(f"fail to decode tx_json while AddTxList: {e}")
+        return tx_jsons
+
 
 class ChannelTxReceiverInnerService(MessageQueueService[ChannelTxReceiverInnerTask]):
     TaskType = ChannelTxReceiverInnerTask
@@ -389,7 +412,7 @@ class ChannelInnerTask:
         self._thread_pool = ThreadPoolExecutor(1, "ChannelInnerThread")
 
         # Citizen
-        CitizenInfo = namedtuple("CitizenInfo", "peer_id target connected_time")
+        CitizenInfo = namedtuple("CitizenInfo", "peer_id target connected_time catch_up")
         self._CitizenInfo = CitizenInfo
         self._citizens: Dict[str, CitizenInfo] = dict()
         self._citizen_condition_new_block: Condition = None
@@ -484,6 +507,30 @@ class ChannelInnerTask:
 
     @message_queue_task
     async def announce_new_block(self, subscriber_block_height: int, subscriber_id: str):
+        new_blocks = await self.__find_blocks_to_announce(subscriber_block_height, subscriber_id, 1, 0)
+        return new_blocks[0]
+
+    @message_queue_task
+    async def announce_new_blocks(self, subscriber_block_height: int, subscriber_id: str):
+        """Announce blocks after `subscriber_block_height` to the citizen.
+
+        Consecutive blocks are announced at once to catch up, only if the citizen subscribed with `catch_up`.
+        Publish them with `node_ws_PublishNewBlocks` if there are more than one, otherwise `node_ws_PublishNewBlock`.
+        At least one block is returned, even though it is larger than `conf.SUBSCRIBE_CATCH_UP_MAX_BYTES`.
+
+        :return: [(block_json, confirm_info), ...]
+        """
+        citizen = self._citizens.get(subscriber_id)
+        if citizen is None or not citizen.catch_up:
+            return await self.__find_blocks_to_announce(subscriber_block_height, subscriber_id, 1, 0)
+
+        return await self.__find_blocks_to_announce(subscriber_block_height,
+                                                    subscriber_id,
+                                                    conf.SUBSCRIBE_CATCH_UP_MAX_COUNT,
+                                                    conf.SUBSCRIBE_CATCH_UP_MAX_BYTES)
+
+    async def __find_blocks_to_announce(self, subscriber_block_height: int, subscriber_id: str,
+                                        max_count: int, max_bytes: int) -> List[Tuple[str, bytes]]:
         while True:
             my_block_height = self._blockchain.block_height
             if subscriber_block_height > my_block_height:
@@ -491,34 +538,64 @@ class ChannelInnerTask:
                                 f"than this node's height({my_block_height}).")
                 self._channel_service.inner_service.notify_unregister()
                 error_msg = {"error": "Invalid block height from citizen."}
-                return json.dumps(error_msg), b''
+                return [(json.dumps(error_msg), b'')]
             elif subscriber_block_height == my_block_height:
                 async with self._citizen_condition_new_block:
                     await self._citizen_condition_new_block.wait()
 
             new_block_height = subscriber_block_height + 1
-            new_block = self._blockchain.find_block_by_height(new_block_height)
-
-            if new_block is None:
+            new_blocks = await self.__get_blocks_to_announce(new_block_height, max_count, max_bytes)
+            if not new_blocks:
                 logging.warning(f"Cannot find block height({new_block_height})")
                 # To prevent excessive occupancy of the CPU in an infinite loop
                 await asyncio.sleep(2 * conf.INTERVAL_BLOCKGENERATION)
                 continue
 
+            logging.debug(f"announce_new_block: height({new_block_height}) "
+                          f"count({len(new_blocks)}), to: {subscriber_id}")
+            return new_blocks
+
+    async def __get_blocks_to_announce(self, from_height: int, max_count: int, max_bytes: int) \
+            -> List[Tuple[str, bytes]]:
+        """Get consecutive blocks from `from_height` with their confirm info.
+
+        Blocks and confirm info are read on the event loop, which also writes them to the store and the block cache.
+        Only blocks of a batch are serialized in the executor, one by one to stop at `max_bytes`.
+        Blocks of a batch are old to the other subscribers, so they are not put into the block cache.
+        """
+        loop = asyncio.get_event_loop()
+        is_batch = max_count > 1
+        new_blocks = []
+        total_bytes = 0
+        for block_height in range(from_height, min(from_height + max_count, self._blockchain.block_height + 1)):
+            new_block = self._blockchain.find_block_by_height(block_height, cache_block=not is_batch)
+            if new_block is None:
+                break
+
             confirm_info: bytes = self._blockchain.find_confirm_info_by_hash(new_block.header.hash)
+            if is_batch:
+                block_json = await loop.run_in_executor(None, self.__block_json, new_block)
+            else:
+                block_json = self.__block_json(new_block)
 
-            logging.debug(f"announce_new_block: height({new_block.header.height}), to: {subscriber_id}")
-            bs = BlockSerializer.new(new_block.header.version, self._blockchain.tx_versioner)
-            return json.dumps(bs.serialize(new_block)), confirm_info
+            total_bytes += len(block_json) + len(confirm_info or b'')
+            if new_blocks and total_bytes > max_bytes:
+                break
+            new_blocks.append((block_json, confirm_info))
+
+        return new_blocks
 
     @message_queue_task
-    async def register_citizen(self, peer_id, target, connected_time):
+    async def register_citizen(self, peer_id, target, connected_time, catch_up=False):
+        """
+        :param catch_up: True if the citizen accepts consecutive blocks at once by `node_ws_PublishNewBlocks`
+        """
         register_condition = (len(self._citizens) < conf.SUBSCRIBE_LIMIT
                               and (peer_id not in self._citizens)
                               and not (conf.SAFE_BLOCK_BROADCAST and
                                        self._channel_service.state_machine.state == 'BlockGenerate'))
         if register_condition:
-            new_citizen = self._CitizenInfo(peer_id, target, connected_time)
+            new_citizen = self._CitizenInfo(peer_id, target, connected_time, catch_up)
             self._citizens[peer_id] = new_citizen
             logging.info(f"register new citizen: {new_citizen}")
             logging.debug(f"remaining all citizens: {self._citizens}")
@@ -598,6 +675,9 @@ class ChannelInnerTask:
         status_data["leader"] = self._block_manager.epoch.leader_id if self._block_manager.epoch else ""
         status_data["epoch_leader"] = self._block_manager.epoch.leader_id if self._block_manager.epoch else ""
         status_data["versions"] = conf.ICON_VERSIONS
+        status_data["block_cache"] = self._blockchain.get_block_cache_status()
+        status_data["signature_cache"] = SignVerifier.get_cache().get_status()
+        status_data["tx_queue"] = self._block_manager.get_tx_queue().get_memory_status()
 
         return status_data
 
@@ -763,6 +843,49 @@ class ChannelInnerTask:
         return (message_code.Response.success, block.header.height, self._blockchain.block_height,
                 unconfirmed_block_height, confirm_info, self._blockchain.block_dumps(block))
 
+    @message_queue_task
+    def block_sync_range(self, from_height: int, max_count: int, max_bytes: int):
+        """Get confirmed blocks from `from_height` with their confirm info.
+        Blocks are returned as they are stored in DB to skip serialization.
+        At least one block is returned if there is, even though it is larger than `max_bytes`.
+        """
+        if max_count <= 0 or max_count > conf.BLOCK_SYNC_RANGE_MAX_COUNT:
+            max_count = conf.BLOCK_SYNC_RANGE_MAX_COUNT
+        if max_bytes <= 0 or max_bytes > conf.BLOCK_SYNC_RANGE_MAX_BYTES:
+            max_bytes = conf.BLOCK_SYNC_RANGE_MAX_BYTES
+
+        if self._blockchain.last_unconfirmed_block is None:
+            unconfirmed_block_height = -1
+        else:
+            unconfirmed_block_height = self._blockchain.last_unconfirmed_block.header.height
+
+        blocks_dumped, confirm_infos = [], []
+        total_bytes = 0
+        for block_height in range(from_height, min(from_height + max_count, self._blockchain.block_height + 1)):
+            try:
+                block_hash, block_dumped = self._blockchain.find_stored_block_by_height(block_height)
+            except KeyError:
+                break
+
+            confirm_info = b''
+            if block_height > 0:
+                confirm_info = self._blockchain.find_confirm_info_by_hash(block_hash)
+                block_version = self._blockchain.block_versioner.get_version(block_height)
+                if not confirm_info and parse_version(block_version) >= parse_version("0.3"):
+                    break
+
+            total_bytes += len(block_dumped) + len(confirm_info)
+            if blocks_dumped and total_bytes > max_bytes:
+                break
+            blocks_dumped.append(block_dumped)
+            confirm_infos.append(confirm_info)
+
+        if blocks_dumped:
+            response_code = message_code.Response.success
+        else:
+            response_code = message_code.Response.fail_wrong_block_height
+        return response_code, self._blockchain.block_height, unconfirmed_block_height, blocks_dumped, confirm_infos
+
     @message_queue_task(type_=MessageQueueType.Worker)
     def vote_unconfirmed_block(self, vote_dumped: str) -> None:
         try:
@@ -873,10 +996,12 @@ class ChannelInnerTask:
         if fail_response_code:
             return fail_response_code, block_hash, b"", json.dumps({})
 
-        tx_versioner = self._blockchain.tx_versioner
-        bs = BlockSerializer.new(block.header.version, tx_versioner)
-        block_dict = bs.serialize(block)
-        return message_code.Response.success, block_hash, confirm_info, json.dumps(block_dict)
+        return message_code.Response.success, block_hash, confirm_info, self.__block_json(block)
+
+    def __block_json(self, block: Block) -> str:
+        """Serialize the block to JSON for subscribers and clients. The json of the latest blocks is cached."""
+        bs = BlockSerializer.new(block.header.version, self._blockchain.tx_versioner)
+        return bs.dumps(block).decode(conf.PEER_DATA_ENCODING)
 
     async def __get_block(self, block_hash, block_height):
         if block_hash == "" and block_height == -1 and self._blockchain.last_block:
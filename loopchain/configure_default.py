@@ -98,6 +98,7 @@ PORT_DIFF_SCORE_CONTAINER = 20021  # peer service 가 score container 를 시작
 PORT_DIFF_BETWEEN_SCORE_CONTAINER = 30
 MAX_WORKERS = 8
 MAX_BROADCAST_WORKERS = 1
+MAX_BROADCAST_IN_FLIGHT_PER_TARGET = 4  # async broadcast requests in flight to a target. The rest wait by priority.
 SLEEP_SECONDS_IN_SERVICE_LOOP = 0.1  # 0.05  # multi thread 동작을 위한 최소 대기 시간 설정
 SLEEP_SECONDS_IN_SERVICE_NONE = 2  # _아무일도 하지 않는 대기 thread 의 대기 시간 설정
 GRPC_TIMEOUT = 30  # seconds
@@ -106,6 +107,8 @@ GRPC_TIMEOUT_BROADCAST_RETRY = 6  # seconds
 GRPC_TIMEOUT_TEST = 30  # seconds
 GRPC_CONNECTION_TIMEOUT = GRPC_TIMEOUT * 2  # seconds, Connect Peer 메시지는 처리시간이 좀 더 필요함
 STUB_REUSE_TIMEOUT = 60  # minutes
+GRPC_CHANNEL_COUNT_PER_PEER = 2  # StubManager distributes calls to a peer over this number of channels.
+PEER_HEALTH_EWMA_WEIGHT = 0.2  # the weight of the last call to the latency and failure rate of a peer
 
 GRPC_SSL_TYPE = SSLAuthType.none
 GRPC_SSL_KEY_LOAD_TYPE = KeyLoadType.FILE_LOAD
@@ -134,6 +137,20 @@ MAX_RETRY_CREATE_DB = 10
 DEFAULT_KEY_VALUE_STORE_TYPE = "plyvel"
 # default level db path
 DEFAULT_LEVEL_DB_PATH = "./db"
+# The number of decoded blocks cached by BlockChain
+MAX_BLOCK_CACHE_SIZE = 32
+# The number of decoded preps by roothash cached by BlockChain
+MAX_PREPS_CACHE_SIZE = 8
+# The number of merkle trees of proved blocks cached by BlockChain
+MAX_PROOF_TREE_CACHE_SIZE = 16
+# The number of json of the latest blocks cached by BlockSerializer for broadcasts, sync and subscribers
+MAX_DUMPED_BLOCK_CACHE_SIZE = 4
+# Blocks and tx infos are stored in the compact binary format instead of json. Both formats can be read.
+# Earlier releases cannot read the binary format and it cannot be converted back to json,
+# so turn it on after all nodes sharing the store are upgraded.
+BLOCK_STORE_BINARY_FORMAT = False
+# Counters persisted with blocks (made block count, tx count) are checked against the blocks on startup if True.
+VERIFY_BLOCKCHAIN_CHECKPOINTS = False
 # peer_id (UUID) 는 최초 1회 생성하여 level db에 저장한다.
 LEVEL_DB_KEY_FOR_PEER_ID = str.encode("peer_id_key")
 # String Peer Data Encoding
@@ -148,7 +165,9 @@ MAX_BLOCK_KBYTES = 3000  # default: 3000
 # The total size of the transactions in a block.
 MAX_TX_SIZE_IN_BLOCK = 1 * 1024 * 1024  # 1 MB is better than 2 MB (because tx invoke need CPU time)
 MAX_TX_COUNT_IN_ADDTX_LIST = 128  # AddTxList can send multiple tx in one message.
-SEND_TX_LIST_DURATION = 0.3  # seconds
+SEND_TX_LIST_DURATION = 0.3  # seconds, the longest time for txs to wait to be sent together by AddTxList.
+SEND_TX_LIST_MIN_DURATION = 0.01  # seconds, the time for sparse txs to wait.
+SEND_TX_LIST_INTERVAL_WEIGHT = 0.2  # the weight of the last interval of txs to decide the waiting time.
 # Consensus Vote Ratio 1 = 100%, 0.5 = 50%
 VOTING_RATIO = 0.67  # for Add Block
 LEADER_COMPLAIN_RATIO = 0.51  # for Leader Complain
@@ -160,9 +179,17 @@ CANDIDATE_BLOCK_TIMEOUT = 60 * 60  # seconds
 # default storage path
 DEFAULT_STORAGE_PATH = os.getenv('DEFAULT_STORAGE_PATH', os.path.join(LOOPCHAIN_ROOT_PATH, '.storage'))
 # max tx list size by address
+# TX_LIST_ADDRESS_PREFIX is the prefix of pickled tx lists which are converted by loopchain.tools.block_store_migrator
 TX_LIST_ADDRESS_PREFIX = b'tx_list_by_address_'
 MAX_TX_LIST_SIZE_BY_ADDRESS = 100
 MAX_PRE_VALIDATE_TX_CACHE = 10000
+# Signature recoveries are fanned out to worker processes when a batch has more items than this.
+SIGNATURE_VERIFY_POOL_THRESHOLD = 256
+SIGNATURE_VERIFY_CHUNK_SIZE = 128
+SIGNATURE_VERIFY_WORKERS = int(os.cpu_count() * 0.5) or 1
+# The number of addresses recovered from (hash, signature) cached by SignVerifier. It is shared by the process.
+MAX_SIGNATURE_CACHE_SIZE = 100000
+VOTE_VERIFY_POOL_THRESHOLD = 32  # minimum number of votes to verify their signatures in worker processes
 TIMESTAMP_BOUNDARY_SECOND = 60 * 15
 # Some older clients have a process that treats tx, which is delayed by more than 30 minutes, as a failure.
 # The engine limits the timestamp of tx to a lower value.
@@ -227,10 +254,19 @@ INTERVAL_SECONDS_PROCESS_MONITORING = 30  # seconds
 PEER_NAME = "no_name"
 IS_BROADCAST_ASYNC = True
 SUBSCRIBE_LIMIT = 10
+# Limits of consecutive blocks announced at once to a lagging citizen.
+# max bytes must be less than max message size of the websocket of citizens (4 * MAX_TX_SIZE_IN_BLOCK).
+SUBSCRIBE_CATCH_UP_MAX_COUNT = 50
+SUBSCRIBE_CATCH_UP_MAX_BYTES = 3 * 1024 * 1024
 SUBSCRIBE_RETRY_TIMER = 14
 SHUTDOWN_TIMER = 60 * 120
 GET_LAST_BLOCK_TIMER = 30
 BLOCK_SYNC_RETRY_NUMBER = 5
+# The number of block requests in flight to peers during block height sync
+BLOCK_SYNC_WINDOW_SIZE = 16
+# Limits of blocks in a BlockSyncRange response. max bytes must be less than max message length of gRPC (4MB).
+BLOCK_SYNC_RANGE_MAX_COUNT = 50
+BLOCK_SYNC_RANGE_MAX_BYTES = 3 * 1024 * 1024
 TIMEOUT_FOR_LEADER_COMPLAIN = 60
 MAX_TIMEOUT_FOR_LEADER_COMPLAIN = 300
 
@@ -15,31 +15,125 @@
 
 import binascii
 import hashlib
+import itertools
 import logging
-from typing import Union, Type, TypeVar
+import multiprocessing as mp
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Union, Type, TypeVar, Sequence, Tuple, List, Optional, Dict
 
 import eth_keyfile
 from secp256k1 import Base, ALL_FLAGS
 from secp256k1 import PrivateKey, PublicKey
 
+from loopchain import configure as conf
 from loopchain.crypto.cert_serializers import DerSerializer, PemSerializer
 
 T = TypeVar('T', bound='SignVerifier')
 
 
+def _verify_hashes(items: Sequence[Tuple[str, bytes, bytes]]) -> List[Optional[str]]:
+    results = []
+    for address, hash_, signature in items:
+        try:
+            SignVerifier.from_address(address).verify_hash(hash_, signature)
+        except Exception as e:
+            results.append(str(e))
+        else:
+            results.append(None)
+    return results
+
+
+def _recover_addresses(items: Sequence[Tuple[bytes, bytes]]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Worker of `SignVerifier.verify_hash_many`. It must be a module function to be picklable.
+
+    :param items: sequence of (hash, signature)
+    :return: (recovered address, None) of each item, or (None, error message) if the address is not recovered.
+    """
+    verifier = SignVerifier()
+    results = []
+    for hash_, signature in items:
+        try:
+            results.append((verifier._recover_address(hash_, signature, True), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+class SignatureCache:
+    """Thread-safe LRU cache of addresses recovered from (hash, signature).
+
+    A recovered address never changes, so the address of a verified signature is cached
+    whether it is the expected address or not.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._addresses: Dict[Tuple[bytes, bytes], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def get(self, hash_: bytes, signature: bytes) -> Optional[str]:
+        key = (bytes(hash_), bytes(signature))
+        with self._lock:
+            address = self._addresses.get(key)
+            if address is None:
+                self.miss_count += 1
+            else:
+                self.hit_count += 1
+                self._addresses.move_to_end(key)
+            return address
+
+    def put(self, hash_: bytes, signature: bytes, address: str):
+        if self.max_size <= 0:
+            return
+
+        key = (bytes(hash_), bytes(signature))
+        with self._lock:
+            self._addresses[key] = address
+            self._addresses.move_to_end(key)
+            while len(self._addresses) > self.max_size:
+                self._addresses.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._addresses.clear()
+            self.hit_count = 0
+            self.miss_count = 0
+
+    def get_status(self) -> dict:
+        request_count = self.hit_count + self.miss_count
+        return {
+            "size": len(self._addresses),
+            "max_size": self.max_size,
+            "hit": self.hit_count,
+            "miss": self.miss_count,
+            "hit_rate": round(self.hit_count / request_count, 4) if request_count else 0
+        }
+
+
 class SignVerifier:
     _base = Base(None, ALL_FLAGS)
     _pri = PrivateKey(ctx=_base.ctx)
 
+    _pool: ProcessPoolExecutor = None
+    _pool_lock = threading.Lock()
+
+    _cache: SignatureCache = None
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         self.address: str = None
 
     def verify_address(self, pubkey: bytes):
-        new_address = self.address_from_pubkey(pubkey)
-        if new_address != self.address:
-            raise RuntimeError(f"Address is not valid."
-                               f"Address({new_address}), "
-                               f"Expected({self.address}")
+        self._verify_recovered_address(self.address_from_pubkey(pubkey))
 
     def verify_data(self, origin_data: bytes, signature: bytes):
         self.verify_signature(origin_data, signature, False)
@@ -48,19 +142,125 @@ class SignVerifier:
         self.verify_signature(origin_data, signature, True)
 
     def verify_signature(self, origin_data: bytes, signature: bytes, is_hash: bool):
+        """Verify the signature.
+
+        The address recovered from a hash is looked up in and put to the process-wide `SignatureCache`
+        so the same (hash, signature) is recovered only once.
+        """
         try:
-            origin_signature, recover_code = signature[:-1], signature[-1]
-            recoverable_sig = self._pri.ecdsa_recoverable_deserialize(origin_signature, recover_code)
-            pub = self._pri.ecdsa_recover(origin_data,
-                                          recover_sig=recoverable_sig,
-                                          raw=is_hash,
-                                          digest=hashlib.sha3_256)
-            extract_pub = PublicKey(pub, ctx=self._base.ctx).serialize(compressed=False)
-            return self.verify_address(extract_pub)
+            if is_hash:
+                cache = self.get_cache()
+                address = cache.get(origin_data, signature)
+                if address is None:
+                    address = self._recover_address(origin_data, signature, is_hash)
+                    cache.put(origin_data, signature, address)
+            else:
+                address = self._recover_address(origin_data, signature, is_hash)
+            self._verify_recovered_address(address)
         except Exception as e:
             raise RuntimeError(f"signature verification fail : {origin_data} {signature}\n"
                                f"{e}")
 
+    def _recover_address(self, origin_data: bytes, signature: bytes, is_hash: bool) -> str:
+        origin_signature, recover_code = signature[:-1], signature[-1]
+        recoverable_sig = self._pri.ecdsa_recoverable_deserialize(origin_signature, recover_code)
+        pub = self._pri.ecdsa_recover(origin_data,
+                                      recover_sig=recoverable_sig,
+                                      raw=is_hash,
+                                      digest=hashlib.sha3_256)
+        extract_pub = PublicKey(pub, ctx=self._base.ctx).serialize(compressed=False)
+        return self.address_from_pubkey(extract_pub)
+
+    def _verify_recovered_address(self, new_address: str):
+        if new_address != self.address:
+            raise RuntimeError(f"Address is not valid."
+                               f"Address({new_address}), "
+                               f"Expected({self.address}")
+
+    @classmethod
+    def verify_hash_many(cls, items: Sequence[Tuple[str, bytes, bytes]], pool_threshold: int = None) \
+            -> List[Optional[str]]:
+        """Verify hash signatures in bulk.
+
+        Public key recoveries are fanned out to worker processes
+        when there are enough items to pay for the IPC cost.
+        Only signatures which are not in `SignatureCache` are sent to the workers,
+        and every recovered address is put to the cache whether it is the expected address or not.
+
+        :param items: sequence of (address, hash, signature)
+        :param pool_threshold: minimum number of items to use worker processes.
+            `conf.SIGNATURE_VERIFY_POOL_THRESHOLD` if it is None.
+        :return: error message of each item. None if the item is verified.
+        """
+        if pool_threshold is None:
+            pool_threshold = conf.SIGNATURE_VERIFY_POOL_THRESHOLD
+        if len(items) < pool_threshold or conf.SIGNATURE_VERIFY_WORKERS < 2:
+            return _verify_hashes(items)
+
+        cache = cls.get_cache()
+        results: List[Optional[str]] = [None] * len(items)
+        misses = []
+        for index, (address, hash_, signature) in enumerate(items):
+            cached_address = cache.get(hash_, signature)
+            if cached_address is None:
+                misses.append(index)
+            else:
+                results[index] = cls._verify_address_error(address, hash_, signature, cached_address)
+
+        miss_items = [items[index][1:] for index in misses]
+        if len(miss_items) < pool_threshold:
+            recoveries = _recover_addresses(miss_items)
+        else:
+            recoveries = cls._recover_addresses_in_pool(miss_items)
+
+        for index, (recovered_address, error) in zip(misses, recoveries):
+            address, hash_, signature = items[index]
+            if recovered_address is None:
+                results[index] = f"signature verification fail : {hash_} {signature}\n{error}"
+            else:
+                cache.put(hash_, signature, recovered_address)
+                results[index] = cls._verify_address_error(address, hash_, signature, recovered_address)
+        return results
+
+    @classmethod
+    def _verify_address_error(cls, address: str, hash_: bytes, signature: bytes, recovered_address: str) \
+            -> Optional[str]:
+        try:
+            cls.from_address(address)._verify_recovered_address(recovered_address)
+        except Exception as e:
+            return f"signature verification fail : {hash_} {signature}\n{e}"
+        return None
+
+    @classmethod
+    def _recover_addresses_in_pool(cls, items: Sequence[Tuple[bytes, bytes]]) \
+            -> List[Tuple[Optional[str], Optional[str]]]:
+        chunk_size = conf.SIGNATURE_VERIFY_CHUNK_SIZE
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        try:
+            results = cls._get_pool().map(_recover_addresses, chunks)
+            return list(itertools.chain.from_iterable(results))
+        except BrokenProcessPool as e:
+            logging.warning(f"Signature verification pool is broken. Verify serially. : {e}")
+            with cls._pool_lock:
+                cls._pool = None
+            return _recover_addresses(items)
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ProcessPoolExecutor(conf.SIGNATURE_VERIFY_WORKERS, mp.get_context('spawn'))
+            return cls._pool
+
+    @classmethod
+    def get_cache(cls) -> SignatureCache:
+        """Return the verified signature cache shared by the process. Its size is `conf.MAX_SIGNATURE_CACHE_SIZE`."""
+        if cls._cache is None:
+            with cls._cache_lock:
+                if cls._cache is None:
+                    SignVerifier._cache = SignatureCache(conf.MAX_SIGNATURE_CACHE_SIZE)
+        return cls._cache
+
     @classmethod
     def address_from_pubkey(cls, pubkey: bytes):
         hash_pub = hashlib.sha3_256(pubkey[1:]).hexdigest()
@@ -2,16 +2,18 @@
 
 import json
 import threading
+import time
 import traceback
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, Future
 from typing import TYPE_CHECKING, Dict, DefaultDict, Optional, Tuple, List, cast
 
+import grpc
 from pkg_resources import parse_version
 
 import loopchain.utils as util
 from loopchain import configure as conf
-from loopchain.baseservice import TimerService, ObjectManager, Timer, RestMethod
+from loopchain.baseservice import TimerService, ObjectManager, Timer, RestMethod, PeerHealth
 from loopchain.baseservice.aging_cache import AgingCache
 from loopchain.blockchain import (BlockChain, CandidateBlocks, Epoch, BlockchainError, NID, exception,
                                   NoConfirmInfo,
@@ -24,13 +26,14 @@ from loopchain.blockchain.exception import (ConfirmInfoInvalid, ConfirmInfoInval
 from loopchain.blockchain.exception import ConfirmInfoInvalidNeedBlockSync, TransactionDuplicatedHashError
 from loopchain.blockchain.exception import InvalidUnconfirmedBlock, DuplicationUnconfirmedBlock, \
     ScoreInvokeError
-from loopchain.blockchain.transactions import Transaction, TransactionSerializer, v2, v3
+from loopchain.blockchain.transactions import Transaction, TransactionSerializer, TransactionVerifier, v2, v3
 from loopchain.blockchain.types import ExternalAddress
 from loopchain.blockchain.types import TransactionStatusInQueue, Hash32
 from loopchain.blockchain.votes import Vote, Votes
 from loopchain.blockchain.votes.v0_5 import LeaderVote
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.peer import status_code
+from loopchain.peer.block_sync_pipeline import BlockRequestPipeline
 from loopchain.peer.consensus_siever import ConsensusSiever
 from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc, message_code
 from loopchain.store.key_value_store import KeyValueStore
@@ -62,6 +65,7 @@ class BlockManager:
         self.__consensus_algorithm = None
         self.candidate_blocks = CandidateBlocks(self.blockchain)
         self.__block_height_sync_bad_targets = {}
+        self.__block_height_sync_targets = set()  # targets of which health is fed by block height sync
         self.__block_height_sync_lock = threading.Lock()
         self.__block_height_thread_pool = ThreadPoolExecutor(1, 'BlockHeightSyncThread')
         self.__block_height_future: Future = None
@@ -221,7 +225,7 @@ class BlockManager:
             return
 
         items = list(self.__tx_queue.d.values())
-        self.__tx_queue.d.clear()
+        self.__tx_queue.clear()
 
         for item in items:
             tx = item.value
@@ -425,15 +429,55 @@ class BlockManager:
                 raise exception.BlockError(f"Received block is invalid: original exception={e}")
 
             votes_dumped: bytes = response.confirm_info
-            try:
-                votes_serialized = json.loads(votes_dumped)
-                version = self.blockchain.block_versioner.get_version(block_height)
-                votes = Votes.get_block_votes_class(version).deserialize_votes(votes_serialized)
-            except json.JSONDecodeError:
-                votes = votes_dumped
+            votes = self.__votes_loads(block_height, votes_dumped)
 
         return block, response.max_block_height, response.unconfirmed_block_height, votes, response.response_code
 
+    def __block_range_request_by_voter(self, from_height, count, peer_stub):
+        """Request confirmed blocks from `from_height` at once.
+
+        :return: the same responses of `__block_request` for each block.
+        Empty if the peer has no confirmed block of `from_height` or does not support BlockSyncRange.
+        """
+        try:
+            response = peer_stub.BlockSyncRange(loopchain_pb2.BlockSyncRangeRequest(
+                from_height=from_height,
+                max_count=count,
+                max_bytes=conf.BLOCK_SYNC_RANGE_MAX_BYTES,
+                channel=self.__channel_name
+            ), conf.GRPC_TIMEOUT)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return []
+            raise
+
+        if response.response_code != message_code.Response.success:
+            return []
+
+        responses = []
+        for block_dumped, votes_dumped in zip(response.blocks, response.confirm_infos):
+            try:
+                block = self.blockchain.stored_block_loads(block_dumped, trusted=False)
+            except Exception as e:
+                traceback.print_exc()
+                raise exception.BlockError(f"Received block is invalid: original exception={e}")
+
+            if block.header.height != from_height + len(responses):
+                raise exception.BlockError(f"Received block is not in order. height({block.header.height})")
+
+            votes = self.__votes_loads(block.header.height, votes_dumped)
+            responses.append((block, response.max_block_height, response.unconfirmed_block_height, votes,
+                              response.response_code))
+        return responses
+
+    def __votes_loads(self, block_height, votes_dumped):
+        try:
+            votes_serialized = json.loads(votes_dumped)
+            version = self.blockchain.block_versioner.get_version(block_height)
+            return Votes.get_block_votes_class(version).deserialize_votes(votes_serialized)
+        except json.JSONDecodeError:
+            return votes_dumped
+
     def __block_request_by_citizen(self, block_height):
         rs_client = ObjectManager().channel_service.rs_client
         get_block_result = rs_client.call(
@@ -449,12 +493,7 @@ class BlockManager:
         block_serializer = BlockSerializer.new(block_version, self.blockchain.tx_versioner)
         block = block_serializer.deserialize(get_block_result['block'])
         votes_dumped: str = get_block_result.get('confirm_info', '')
-        try:
-            votes_serialized = json.loads(votes_dumped)
-            version = self.blockchain.block_versioner.get_version(block_height)
-            votes = Votes.get_block_votes_class(version).deserialize_votes(votes_serialized)
-        except json.JSONDecodeError:
-            votes = votes_dumped
+        votes = self.__votes_loads(block_height, votes_dumped)
         return block, max_height, -1, votes, message_code.Response.success
 
     def __start_block_height_sync_timer(self, is_run_at_start=False):
@@ -553,9 +592,25 @@ class BlockManager:
                                       reps_getter=reps_getter)
         return self.blockchain.add_block(prev_block, confirm_info)
 
+    def __block_request_in_pipeline(self, peer_stub, from_height, count):
+        """Request blocks and verify signatures of their txs in advance while previous blocks are being added.
+
+        :return: [(block, max_block_height, unconfirmed_block_height, confirm_info, response_code), ...]
+        """
+        responses = None
+        if count > 1:
+            responses = self.__block_range_request_by_voter(from_height, count, peer_stub)
+        if not responses:
+            responses = [self.__block_request(peer_stub, from_height)]
+
+        txs = (tx for response in responses for tx in response[0].body.transactions.values())
+        TransactionVerifier.verify_signatures(txs, self.blockchain.tx_versioner)
+        return responses
+
     def __block_request_to_peers_in_sync(self, peer_stubs, my_height, unconfirmed_block_height, max_height):
         """Extracted func from __block_height_sync.
         It has block request loop with peer_stubs for block height sync.
+        Blocks are requested to peers in a window of `conf.BLOCK_SYNC_WINDOW_SIZE` and added in height order.
 
         :param peer_stubs:
         :param my_height:
@@ -563,72 +618,80 @@ class BlockManager:
         :param max_height:
         :return: my_height, max_height
         """
-        peer_index = 0
-
-        while max_height > my_height:
-            if self.__channel_service.state_machine.state != 'BlockSync':
-                break
-
-            peer_target, peer_stub = peer_stubs[peer_index]
-            util.logger.info(f"Block Height Sync Target : {peer_target} / request height({my_height + 1})")
-            try:
-                block, max_block_height, current_unconfirmed_block_height, confirm_info, response_code = \
-                    self.__block_request(peer_stub, my_height + 1)
-            except NoConfirmInfo as e:
-                util.logger.warning(f"{e}")
-                response_code = message_code.Response.fail_no_confirm_info
-            except Exception as e:
-                util.logger.warning(f"There is a bad peer, I hate you: {type(e), e}")
-                traceback.print_exc()
-                response_code = message_code.Response.fail
-
-            if response_code == message_code.Response.success:
-                util.logger.debug(f"try add block height: {block.header.height}")
-
-                max_block_height = max(max_block_height, current_unconfirmed_block_height)
-                if max_block_height > max_height:
-                    util.logger.spam(f"set max_height :{max_height} -> {max_block_height}")
-                    max_height = max_block_height
-                    if current_unconfirmed_block_height == max_block_height:
-                        unconfirmed_block_height = current_unconfirmed_block_height
+        if ObjectManager().channel_service.is_support_node_function(conf.NodeFunction.Vote):
+            batch_size = conf.BLOCK_SYNC_RANGE_MAX_COUNT
+        else:
+            batch_size = 1
+
+        with BlockRequestPipeline(self.__block_request_in_pipeline,
+                                  peer_stubs,
+                                  conf.BLOCK_SYNC_WINDOW_SIZE,
+                                  batch_size) as pipeline:
+            while max_height > my_height:
+                if self.__channel_service.state_machine.state != 'BlockSync':
+                    break
 
+                pipeline.request(my_height + 1, max_height)
+                peer_target, future = pipeline.pop(my_height + 1)
+                util.logger.info(f"Block Height Sync Target : {peer_target} / request height({my_height + 1})")
                 try:
-                    if (max_height == unconfirmed_block_height == block.header.height and
-                            max_height > 0 and not confirm_info):
-                        self.candidate_blocks.add_block(
-                            block, self.blockchain.find_preps_addresses_by_header(block.header))
-                        self.blockchain.last_unconfirmed_block = block
-                    else:
-                        self.__add_block_by_sync(block, confirm_info)
-
-                    if block.header.height == 0:
-                        self.__rebuild_nid(block)
-                    elif self.blockchain.find_nid() is None:
-                        genesis_block = self.blockchain.find_block_by_height(0)
-                        self.__rebuild_nid(genesis_block)
-
-                except KeyError as e:
-                    util.logger.error(f"{type(e)} during block height sync: {e, e.__traceback__}")
-                    raise
-                except exception.BlockError:
-                    util.exit_and_msg("Block Error Clear all block and restart peer.")
-                    raise
+                    block, max_block_height, current_unconfirmed_block_height, confirm_info, response_code = \
+                        future.result()
+                except NoConfirmInfo as e:
+                    util.logger.warning(f"{e}")
+                    response_code = message_code.Response.fail_no_confirm_info
                 except Exception as e:
-                    util.logger.warning(f"fail block height sync: {type(e), e}")
-
-                    if self.blockchain.last_block.header.hash != block.header.prev_hash:
-                        raise exception.PreviousBlockMismatch
-                    else:
-                        self.__block_height_sync_bad_targets[peer_target] = max_block_height
+                    util.logger.warning(f"There is a bad peer, I hate you: {type(e), e}")
+                    traceback.print_exc()
+                    response_code = message_code.Response.fail
+
+                if response_code == message_code.Response.success:
+                    util.logger.debug(f"try add block height: {block.header.height}")
+
+                    max_block_height = max(max_block_height, current_unconfirmed_block_height)
+                    if max_block_height > max_height:
+                        util.logger.spam(f"set max_height :{max_height} -> {max_block_height}")
+                        max_height = max_block_height
+                        if current_unconfirmed_block_height == max_block_height:
+                            unconfirmed_block_height = current_unconfirmed_block_height
+
+                    try:
+                        if (max_height == unconfirmed_block_height == block.header.height and
+                                max_height > 0 and not confirm_info):
+                            self.candidate_blocks.add_block(
+                                block, self.blockchain.find_preps_addresses_by_header(block.header))
+                            self.blockchain.last_unconfirmed_block = block
+                        else:
+                            self.__add_block_by_sync(block, confirm_info)
+
+                        if block.header.height == 0:
+                            self.__rebuild_nid(block)
+                        elif self.blockchain.find_nid() is None:
+                            genesis_block = self.blockchain.find_block_by_height(0)
+                            self.__rebuild_nid(genesis_block)
+
+                    except KeyError as e:
+                        util.logger.error(f"{type(e)} during block height sync: {e, e.__traceback__}")
+                        raise
+                    except exception.BlockError:
+                        util.exit_and_msg("Block Error Clear all block and restart peer.")
                         raise
+                    except Exception as e:
+                        util.logger.warning(f"fail block height sync: {type(e), e}")
+
+                        if self.blockchain.last_block.header.hash != block.header.prev_hash:
+                            raise exception.PreviousBlockMismatch
+                        else:
+                            self.__block_height_sync_bad_targets[peer_target] = max_block_height
+                            raise
+                    else:
+                        my_height += 1
                 else:
-                    peer_index = (peer_index + 1) % len(peer_stubs)
-                    my_height += 1
-            else:
-                if len(peer_stubs) == 1:
-                    raise ConnectionError
+                    PeerHealth.of(peer_target).record_failure()
+                    if len(peer_stubs) == 1:
+                        raise ConnectionError
 
-                peer_index = (peer_index + 1) % len(peer_stubs)
+                    pipeline.retry(my_height + 1, peer_target)
 
         return my_height, max_height
 
@@ -754,6 +817,10 @@ class BlockManager:
             reps_hash = self.__channel_service.peer_manager.crep_root_hash
         rep_targets = self.blockchain.find_preps_targets_by_roothash(reps_hash)
         target_list = list(rep_targets.values())
+
+        # Health of peers which are no longer reps is removed.
+        PeerHealth.remove(self.__block_height_sync_targets.difference(target_list))
+        self.__block_height_sync_targets = set(target_list)
         for target in target_list:
             if target == peer_target:
                 continue
@@ -762,11 +829,14 @@ class BlockManager:
             util.logger.debug(f"try to target({target})")
             channel = GRPCHelper().create_client_channel(target)
             stub = loopchain_pb2_grpc.PeerServiceStub(channel)
+            peer_health = PeerHealth.of(target)
             try:
+                start_time = time.monotonic()
                 response = stub.GetStatus(loopchain_pb2.StatusRequest(
                     request='block_sync',
                     channel=self.__channel_name,
                 ), conf.GRPC_TIMEOUT_SHORT)
+                peer_health.record_success(time.monotonic() - start_time)
                 target_block_height = max(response.block_height, response.unconfirmed_block_height)
 
                 if target_block_height > my_height:
@@ -775,8 +845,11 @@ class BlockManager:
                     unconfirmed_block_height = max(unconfirmed_block_height, response.unconfirmed_block_height)
 
             except Exception as e:
+                peer_health.record_failure()
                 util.logger.warning(f"This peer has already been removed from the block height target node. {e}")
 
+        # Blocks are requested to the healthiest peer first.
+        peer_stubs.sort(key=lambda peer_stub: PeerHealth.of(peer_stub[0]).score)
         return max_height, unconfirmed_block_height, peer_stubs
 
     def new_epoch(self):
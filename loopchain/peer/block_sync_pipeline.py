@@ -0,0 +1,136 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pipelined block requests for block height sync"""
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ("BlockRequestPipeline", )
+
+
+class BlockRequestPipeline:
+    """Keep a window of block requests in flight across peers and hand over the responses in height order.
+
+    Requests are assigned to peers in round robin, so blocks are downloaded from several peers at the same time
+    while the caller adds them to the blockchain one by one.
+    A request may cover several heights. Heights which are not in its response are requested again.
+    """
+
+    def __init__(self,
+                 request_func: Callable[[Any, int, int], List[Any]],
+                 peer_stubs: List[Tuple[str, Any]],
+                 window_size: int,
+                 batch_size: int = 1):
+        """
+        :param request_func: func(peer_stub, from_height, count) which is called in worker threads.
+        It returns responses of at least one block in height order.
+        :param peer_stubs: [(peer_target, peer_stub), ...]
+        :param window_size: max count of requests in flight
+        :param batch_size: max count of blocks in a request
+        """
+        self._request_func = request_func
+        self._peer_stubs = peer_stubs
+        self._window_size = max(window_size, 1)
+        self._batch_size = max(batch_size, 1)
+
+        self._next_peer_index = 0
+        self._requests: Dict[int, Tuple[int, int, Future]] = {}  # {from_height: (peer_index, count, future)}
+        self._responses: Dict[int, Tuple[int, Future]] = {}  # {block_height: (peer_index, future of response)}
+        self._thread_pool = ThreadPoolExecutor(self._window_size, "BlockSyncRequestThread")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def request(self, next_height: int, max_height: int):
+        """Request blocks from `next_height` to the end of the window.
+
+        Blocks below `max_height` only are requested in advance.
+        The block of `max_height` may not be confirmed yet, so it is requested when it is the next block.
+        """
+        last_height = max(next_height, min(next_height + self._window_size * self._batch_size, max_height) - 1)
+
+        height = next_height
+        while height <= last_height:
+            if height in self._responses:
+                height += 1
+                continue
+
+            request = self._find_request(height)
+            if request:
+                from_height, (_, count, _) = request
+                height = from_height + count
+                continue
+
+            count = 1
+            while count < self._batch_size and height + count <= last_height and \
+                    height + count not in self._responses and self._find_request(height + count) is None:
+                count += 1
+            self._submit(height, count, self._pop_next_peer_index())
+            height += count
+
+    def pop(self, height: int) -> Tuple[str, Future]:
+        """Pop the response of the height. It must be requested by `request` before.
+
+        :return: peer_target, future of the response
+        """
+        if height not in self._responses:
+            peer_index, _, future = self._requests.pop(height)
+            try:
+                responses = future.result()
+            except Exception:
+                self._responses[height] = (peer_index, future)
+            else:
+                for index, response in enumerate(responses):
+                    self._responses[height + index] = (peer_index, self._done_future(response))
+
+        peer_index, future = self._responses.pop(height)
+        peer_target, _ = self._peer_stubs[peer_index]
+        return peer_target, future
+
+    def retry(self, height: int, failed_peer_target: str):
+        """Request the block again to the next peer of the failed one."""
+        failed_peer_index = next(index for index, (peer_target, _) in enumerate(self._peer_stubs)
+                                 if peer_target == failed_peer_target)
+        self._responses.pop(height, None)
+        self._submit(height, 1, (failed_peer_index + 1) % len(self._peer_stubs))
+
+    def close(self):
+        for _, _, future in self._requests.values():
+            future.cancel()
+        self._requests.clear()
+        self._responses.clear()
+        self._thread_pool.shutdown(wait=False)
+
+    def _find_request(self, height: int) -> Optional[Tuple[int, Tuple[int, int, Future]]]:
+        return next(((from_height, request) for from_height, request in self._requests.items()
+                     if from_height <= height < from_height + request[1]), None)
+
+    def _pop_next_peer_index(self) -> int:
+        peer_index = self._next_peer_index
+        self._next_peer_index = (peer_index + 1) % len(self._peer_stubs)
+        return peer_index
+
+    def _submit(self, from_height: int, count: int, peer_index: int):
+        _, peer_stub = self._peer_stubs[peer_index]
+        future = self._thread_pool.submit(self._request_func, peer_stub, from_height, count)
+        self._requests[from_height] = (peer_index, count, future)
+
+    @staticmethod
+    def _done_future(result) -> Future:
+        future = Future()
+        future.set_result(result)
+        return future
@@ -425,6 +425,27 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
             block=block_dumped,
             unconfirmed_block_height=unconfirmed_block_height)
 
+    def BlockSyncRange(self, request, context):
+        # Peer To Peer
+        channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
+        utils.logger.info(
+            f"BlockSyncRange request from height({request.from_height}) max count({request.max_count}) "
+            f"channel({channel_name})")
+
+        channel_stub = StubCollection().channel_stubs[channel_name]
+        future = asyncio.run_coroutine_threadsafe(
+            channel_stub.async_task().block_sync_range(request.from_height, request.max_count, request.max_bytes),
+            self.peer_service.inner_service.loop
+        )
+        response_code, max_block_height, unconfirmed_block_height, blocks_dumped, confirm_infos = future.result()
+
+        return loopchain_pb2.BlockSyncRangeReply(
+            response_code=response_code,
+            max_block_height=max_block_height,
+            unconfirmed_block_height=unconfirmed_block_height,
+            blocks=blocks_dumped,
+            confirm_infos=confirm_infos)
+
     def VoteUnconfirmedBlock(self, request, context):
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
 
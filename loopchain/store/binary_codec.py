@@ -0,0 +1,143 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Field indexed encoding of JSON compatible dicts for KeyValueStore.
+
+Values of the fields of a dict are dumped by `json` each and indexed by their keys,
+so a field can be read or skipped without decoding the others. e.g. a block header without its transactions.
+Full decodes run in `json` per field, so they are as fast as `json.loads` of the whole dict.
+Data which are not dicts are dumped by `json` as they are.
+
+Layout
+    data  := MAGIC VERSION count field*
+    field := key_len key value_len value  # value is dumped by json.
+
+Stored data made by `json.dumps` always starts with '{' or '[', so both formats can be told apart by the first byte.
+"""
+
+import json
+from typing import Any, Iterator, Tuple, Union
+
+MAGIC = b'\xb1'
+FORMAT_VERSION = 2
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class BinaryCodecError(Exception):
+    pass
+
+
+def is_binary(data: BytesLike) -> bool:
+    return data[:1] == MAGIC
+
+
+def dumps(obj) -> bytes:
+    if not isinstance(obj, dict):
+        return json.dumps(obj).encode()
+
+    buffer = bytearray(MAGIC)
+    buffer.append(FORMAT_VERSION)
+    _write_varint(len(obj), buffer)
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            raise BinaryCodecError(f"Key of dict must be str. key({key!r})")
+        _write_bytes(key.encode(), buffer)
+        _write_bytes(json.dumps(value).encode(), buffer)
+    return bytes(buffer)
+
+
+def loads(data: BytesLike):
+    """Decode data. Data dumped by `json` is also accepted for the data stored before the binary format."""
+    if not is_binary(data):
+        return json.loads(bytes(data))
+
+    return {str(key, "utf-8"): json.loads(bytes(value)) for key, value in _iter_fields(data)}
+
+
+def loads_field(data: BytesLike, *keys: str) -> Any:
+    """Decode a field of dict without decoding others.
+
+    :param data: dumped dict
+    :param keys: path of keys to the field, for nested dicts. Fields of nested dicts are decoded with their parent.
+    :raises KeyError: if there is no field
+    """
+    if not is_binary(data):
+        value = json.loads(bytes(data))
+    else:
+        key_encoded = keys[0].encode()
+        value_dumped = next((value for key, value in _iter_fields(data) if key == key_encoded), None)
+        if value_dumped is None:
+            raise KeyError(keys[0])
+        value = json.loads(bytes(value_dumped))
+        keys = keys[1:]
+
+    for key in keys:
+        value = value[key]
+    return value
+
+
+def loads_except(data: BytesLike, *keys: str) -> dict:
+    """Decode a dict without decoding the fields of keys. They are not in the result."""
+    if not is_binary(data):
+        value = json.loads(bytes(data))
+        for key in keys:
+            value.pop(key, None)
+        return value
+
+    keys_encoded = {key.encode() for key in keys}
+    return {str(key, "utf-8"): json.loads(bytes(value))
+            for key, value in _iter_fields(data) if key not in keys_encoded}
+
+
+def _iter_fields(data: BytesLike) -> Iterator[Tuple[bytes, memoryview]]:
+    view = memoryview(data)
+    if view[1] != FORMAT_VERSION:
+        raise BinaryCodecError(f"Not supported format version({view[1]})")
+
+    count, offset = _read_varint(view, 2)
+    for _ in range(count):
+        key, offset = _read_bytes(view, offset)
+        value, offset = _read_bytes(view, offset)
+        yield bytes(key), value
+    if offset != len(view):
+        raise BinaryCodecError(f"Unexpected trailing data. offset({offset}), size({len(view)})")
+
+
+def _write_varint(value: int, buffer: bytearray):
+    while value >= 0x80:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _write_bytes(value: BytesLike, buffer: bytearray):
+    _write_varint(len(value), buffer)
+    buffer += value
+
+
+def _read_bytes(view: memoryview, offset: int) -> Tuple[memoryview, int]:
+    length, offset = _read_varint(view, offset)
+    return view[offset:offset + length], offset + length
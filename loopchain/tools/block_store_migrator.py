@@ -0,0 +1,135 @@
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Migrate a blockchain store of a stopped node. Each step runs only if its flag is given.
+
+--tx-by-address: move tx lists by address stored as pickled pages to the index of BlockChain.TX_BY_ADDRESS_KEY.
+--binary: convert blocks and tx infos stored as json to the binary format.
+          It cannot be undone, and earlier releases cannot read the converted store.
+
+usage: python -m loopchain.tools.block_store_migrator <store_path> [--tx-by-address] [--binary]
+       [--store-type plyvel] [--batch-size 1000]
+"""
+
+import argparse
+import json
+import logging
+import pickle
+import re
+
+from loopchain import configure as conf
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.store import binary_codec
+from loopchain.store.key_value_store import KeyValueStore
+
+# Keys of blocks and tx infos are hex strings of their hashes.
+_hash_key_pattern = re.compile(rb"[0-9a-f]{64}")
+
+
+def is_migration_target(key: bytes, value: bytes) -> bool:
+    if not value.startswith(b'{'):
+        return False
+    return key == BlockChain.PRECOMMIT_BLOCK_KEY or _hash_key_pattern.fullmatch(key) is not None
+
+
+def migrate(store: KeyValueStore, batch_size: int = 1000) -> int:
+    """Convert json values to the binary format.
+
+    :return: count of converted values
+    """
+    converted_count = 0
+    batch = store.WriteBatch()
+    for key, value in store.Iterator():
+        key, value = bytes(key), bytes(value)
+        if not is_migration_target(key, value):
+            continue
+
+        value_loaded = json.loads(value)
+        value_converted = binary_codec.dumps(value_loaded)
+        if binary_codec.loads(value_converted) != value_loaded:
+            raise RuntimeError(f"Conversion is not lossless. key({key})")
+
+        batch.put(key, value_converted)
+        converted_count += 1
+        if converted_count % batch_size == 0:
+            batch.write()
+            batch = store.WriteBatch()
+            logging.info(f"converted {converted_count} values")
+
+    batch.write()
+    return converted_count
+
+
+def migrate_tx_list_by_address(store: KeyValueStore, batch_size: int = 1000) -> int:
+    """Move tx hashes in pickled pages of tx list by address to the index, and remove the pages.
+
+    :return: count of moved tx hashes
+    """
+    moved_count = 0
+    batch = store.WriteBatch()
+    for key, value in store.Iterator(start_key=conf.TX_LIST_ADDRESS_PREFIX):
+        key = bytes(key)
+        if not key.startswith(conf.TX_LIST_ADDRESS_PREFIX):
+            break
+
+        # the last item of a page is the index of the next page.
+        for tx_hash in pickle.loads(value)[:-1]:
+            try:
+                tx_info = binary_codec.loads(store.get(tx_hash.encode(encoding=conf.HASH_KEY_ENCODING)))
+            except KeyError:
+                logging.warning(f"There is no tx info of tx({tx_hash}) in the page({key})")
+                continue
+
+            index_key = BlockChain.get_tx_by_address_key(
+                tx_info["transaction"]["from"], tx_info["block_height"], int(tx_info["tx_index"], 16))
+            batch.put(index_key, bytes.fromhex(tx_hash))
+            moved_count += 1
+            if moved_count % batch_size == 0:
+                batch.write()
+                batch = store.WriteBatch()
+                logging.info(f"moved {moved_count} tx hashes")
+
+        batch.delete(key)
+
+    batch.write()
+    return moved_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate a blockchain store of a stopped node.")
+    parser.add_argument("store_path", help="path of the blockchain store. e.g. .storage/db_7100_icon_dex")
+    parser.add_argument("--tx-by-address", action="store_true",
+                        help="move tx lists by address in pickled pages to the index")
+    parser.add_argument("--binary", action="store_true",
+                        help="convert json blocks and tx infos to the binary format. It cannot be undone.")
+    parser.add_argument("--store-type", default=KeyValueStore.STORE_TYPE_PLYVEL,
+                        choices=(KeyValueStore.STORE_TYPE_PLYVEL, KeyValueStore.STORE_TYPE_LEVELDB))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    if not (args.tx_by_address or args.binary):
+        parser.error("Nothing to migrate. Give --tx-by-address and/or --binary.")
+
+    logging.basicConfig(level=logging.INFO)
+    with KeyValueStore.new(f"file://{args.store_path}", store_type=args.store_type) as store:
+        if args.tx_by_address:
+            moved_count = migrate_tx_list_by_address(store, args.batch_size)
+            logging.info(f"moved {moved_count} tx hashes")
+
+        if args.binary:
+            converted_count = migrate(store, args.batch_size)
+            logging.info(f"converted {converted_count} values")
+    logging.info(f"migration completed.")
+
+
+if __name__ == "__main__":
+    main()
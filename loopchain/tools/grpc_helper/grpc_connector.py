@@ -32,7 +32,8 @@ class GRPCConnector(abc.ABC):
 
     @classmethod
     @abc.abstractmethod
-    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType):
+    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType,
+                              options=None):
         pass
 
 
@@ -43,8 +44,9 @@ class GRPCConnectorInsecure(GRPCConnector):
         server.add_insecure_port(host)
 
     @classmethod
-    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType):
-        return grpc.insecure_channel(host)
+    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType,
+                              options=None):
+        return grpc.insecure_channel(host, options)
 
 
 class GRPCConnectorServerOnly(GRPCConnector):
@@ -58,10 +60,11 @@ class GRPCConnectorServerOnly(GRPCConnector):
         server.add_secure_port(host, credentials)
 
     @classmethod
-    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType):
+    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType,
+                              options=None):
         credentials = grpc.ssl_channel_credentials(
             root_certificates=keys.ssl_root_crt)
-        return grpc.secure_channel(host, credentials)
+        return grpc.secure_channel(host, credentials, options)
 
 
 class GRPCConnectorMutual(GRPCConnector):
@@ -75,9 +78,10 @@ class GRPCConnectorMutual(GRPCConnector):
         server.add_secure_port(host, credentials)
 
     @classmethod
-    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType):
+    def create_client_channel(cls, keys: GRPCSecureKeyCollection, host, ssl_auth_type: conf.SSLAuthType,
+                              options=None):
         credentials = grpc.ssl_channel_credentials(
             root_certificates=keys.ssl_root_crt,
             private_key=keys.ssl_pk,
             certificate_chain=keys.ssl_crt)
-        return grpc.secure_channel(host, credentials)
+        return grpc.secure_channel(host, credentials, options)
@@ -75,12 +75,14 @@ class GRPCHelper(metaclass=SingletonMetaClass):
 
         logging.info(f"Server now listen: {host}, secure level : {str(ssl_auth_type)}")
 
-    def create_client_channel(self, host, ssl_auth_type: conf.SSLAuthType=None, key_load_type: conf.KeyLoadType=None):
+    def create_client_channel(self, host, ssl_auth_type: conf.SSLAuthType=None, key_load_type: conf.KeyLoadType=None,
+                              options=None):
         """
 
         :param host: Target host you want to connect
         :param ssl_auth_type: It notices that which type of SSL auth is used. None : conf.GRPC_SSL_TYPE
         :param key_load_type: It determines where keys has to be loaded. None : conf.GRPC_SSL_KEY_LOAD_TYPE
+        :param options: gRPC channel arguments
         :return: grpc channel
         """
         if ssl_auth_type is None:
@@ -92,7 +94,7 @@ class GRPCHelper(metaclass=SingletonMetaClass):
         self.__keys.reset(ssl_auth_type, key_load_type)
 
         connector: GRPCConnector = self.__connectors[ssl_auth_type]
-        channel = connector.create_client_channel(self.__keys, host, ssl_auth_type)
+        channel = connector.create_client_channel(self.__keys, host, ssl_auth_type, options)
 
         logging.info(f"Client Channel : {host}, secure level : {str(ssl_auth_type)}")
 
@@ -127,9 +127,10 @@ def load_user_score(path):
     return _load_user_score_module(path, "UserScore")
 
 
-def get_stub_to_server(target, stub_class, ssl_auth_type: conf.SSLAuthType = conf.SSLAuthType.none):
+def get_stub_to_server(target, stub_class, ssl_auth_type: conf.SSLAuthType = conf.SSLAuthType.none, options=None):
     """gRPC connection to server
 
+    :param options: gRPC channel arguments
     :return: stub to server
     """
 
@@ -138,7 +139,7 @@ def get_stub_to_server(target, stub_class, ssl_auth_type: conf.SSLAuthType = con
 
     try:
         logging.debug(f"(util) get stub to server target: {target}")
-        channel = GRPCHelper().create_client_channel(target, ssl_auth_type, conf.GRPC_SSL_KEY_LOAD_TYPE)
+        channel = GRPCHelper().create_client_channel(target, ssl_auth_type, conf.GRPC_SSL_KEY_LOAD_TYPE, options)
         stub = stub_class(channel)
     except Exception as e:
         logging.warning(f"Connect to Server Error(get_stub_to_server): {e}")
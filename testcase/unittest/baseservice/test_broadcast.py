@@ -1,11 +1,15 @@
 import multiprocessing as mp
+import time
+from concurrent import futures
 from typing import List
 
 import pytest
 
+from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, BroadcastCommand
 from loopchain.baseservice.broadcast_scheduler import BroadcastScheduler, BroadcastSchedulerFactory
 from loopchain.baseservice.broadcast_scheduler import _Broadcaster, _BroadcastSchedulerMp, _BroadcastSchedulerThread
+from loopchain.baseservice.tx_item_helper import TxItem
 
 
 @pytest.fixture
@@ -120,6 +124,63 @@ class TestBroadcaster:
         for updated_audience in new_audience_targets:
             assert updated_audience in audience_list.keys()
 
+    def test_make_tx_list_message_packs_txs_by_encoded_size_in_order(self, bc, mocker):
+        tx_items = [TxItem(f'{{"tx": "{i:04}"}}', "chann") for i in range(7)]
+        for tx_item in tx_items:
+            bc.stored_tx.put(tx_item)
+
+        tx_list_overhead = 2 + len("chann")
+        mocker.patch.object(conf, "MAX_TX_SIZE_IN_BLOCK", tx_list_overhead + len(tx_items[0]) * 3)
+        mocker.patch.object(conf, "MAX_TX_COUNT_IN_ADDTX_LIST", 4)
+
+        tx_lists = []
+        remains = True
+        while remains:
+            remains, message = bc._Broadcaster__make_tx_list_message()
+            assert message.ByteSize() <= conf.MAX_TX_SIZE_IN_BLOCK
+            tx_lists.append([tx.tx_json for tx in message.tx_list])
+
+        expected_tx_jsons = [tx_item.get_tx_message().tx_json for tx_item in tx_items]
+        assert tx_lists == [expected_tx_jsons[0:3], expected_tx_jsons[3:6], expected_tx_jsons[6:7]]
+
+    def test_broadcast_async_in_flight_window_by_priority(self, bc, mocker):
+        mocker.patch.object(conf, "MAX_BROADCAST_IN_FLIGHT_PER_TARGET", 3)
+        calls = []
+        stub_manager = mocker.MagicMock()
+        stub_manager.call_async.side_effect = lambda **kwargs: calls.append(kwargs) or mocker.MagicMock()
+        bc._Broadcaster__audience["endpoint:0"] = stub_manager
+
+        for i in range(4):
+            bc._Broadcaster__broadcast_run_async("AddTxList", f"tx_list{i}")
+        bc._Broadcaster__broadcast_run_async("BroadcastVote", "vote")
+
+        # Tx relays leave a slot for votes.
+        assert [call["message"] for call in calls] == ["tx_list0", "tx_list1", "vote"]
+
+        succeeded = mocker.MagicMock(spec=futures.Future)
+        succeeded.exception.return_value = None
+        calls[2]["call_back"](succeeded)
+        assert len(calls) == 3
+
+        calls[0]["call_back"](succeeded)
+        assert [call["message"] for call in calls[3:]] == ["tx_list2"]
+
+    def test_broadcast_async_drops_expired_requests(self, bc, mocker):
+        mocker.patch.object(conf, "MAX_BROADCAST_IN_FLIGHT_PER_TARGET", 2)
+        calls = []
+        stub_manager = mocker.MagicMock()
+        stub_manager.call_async.side_effect = lambda **kwargs: calls.append(kwargs) or mocker.MagicMock()
+        bc._Broadcaster__audience["endpoint:0"] = stub_manager
+
+        bc._Broadcaster__broadcast_run_async("AddTxList", "tx_list0", retry_times=0, timeout=10)
+        bc._Broadcaster__broadcast_run_async("AddTxList", "tx_list1", retry_times=0, timeout=0.01)
+        time.sleep(0.02)
+
+        failed = mocker.MagicMock(spec=futures.Future)
+        failed.exception.return_value = RuntimeError("test")
+        calls[0]["call_back"](failed)
+        assert [call["message"] for call in calls] == ["tx_list0"]
+
 
 class TestBroadcastScheduler:
     @pytest.mark.parametrize("is_multiprocessing", [True, False])
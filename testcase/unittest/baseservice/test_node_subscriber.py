@@ -7,7 +7,8 @@ import websockets
 
 from loopchain.baseservice import ObjectManager
 from loopchain.baseservice.node_subscriber import (NodeSubscriber, _check_error_in_response,
-                                                   CONNECTION_FAIL_CONDITIONS, UnregisteredException)
+                                                   CONNECTION_FAIL_CONDITIONS, UnregisteredException,
+                                                   SubscribeRejectedException)
 from loopchain.protos import message_code
 
 from loopchain.blockchain import AnnounceNewBlockError
@@ -54,7 +55,7 @@ def mock_ws(mocker):
                 return True
 
         async def send(self, request):
-            self.mock_send()
+            self.mock_send(request)
 
             return True
 
@@ -177,6 +178,38 @@ class TestNodeSubscriberHandShake:
 
         assert mock_ws.closed
 
+    async def test_subscribe_again_without_catch_up_if_rejected(self, node_subscriber, mock_ws, monkeypatch):
+        async def mock_connect(*args, **kwargs):
+            return mock_ws
+
+        async def mock_run():
+            pass
+
+        error_response = {"jsonrpc": "2.0", "error": {"code": -32602, "message": "Invalid params"}, "id": 1}
+        mock_ws.mock_recv.side_effect = [json.dumps(error_response), json.dumps({"test": "success"})]
+        node_subscriber._run = mock_run
+
+        with monkeypatch.context() as m:
+            m.setattr(websockets, "connect", mock_connect)
+            await node_subscriber.start(asyncio.Event(), block_height=1)
+
+        requests = [json.loads(call[0][0]) for call in mock_ws.mock_send.call_args_list]
+        assert requests[0]["params"]["catchUp"] is True
+        assert "catchUp" not in requests[1]["params"]
+        assert node_subscriber._subscribe_event.is_set()
+
+    async def test_subscribe_rejected_without_catch_up_raises(self, node_subscriber, mock_ws):
+        error_response = {"jsonrpc": "2.0", "error": {"code": -32602, "message": "Invalid params"}, "id": 1}
+        mock_ws.mock_recv.return_value = json.dumps(error_response)
+        node_subscriber._websocket = mock_ws
+        node_subscriber._subscribe_event = asyncio.Event()
+        node_subscriber._catch_up = False
+
+        with pytest.raises(SubscribeRejectedException):
+            await node_subscriber._handshake(block_height=1)
+
+        assert mock_ws.closed
+
 
 @pytest.mark.asyncio
 class TestNodeSubscriberFunctional:
@@ -204,6 +237,30 @@ class TestNodeSubscriberFunctional:
     async def test_node_ws_PublishNewBlock(self):
         pass
 
+    async def test_node_ws_PublishNewBlocks_adds_blocks_in_order_until_invalid_block(self, node_subscriber, mocker):
+        ObjectManager().channel_service = mocker.MagicMock()
+        added_blocks = []
+
+        def mock_prepare_new_block(block_dict, votes_dumped):
+            return block_dict["height"], None, votes_dumped
+
+        def mock_add_new_block(confirmed_block, vote, votes_dumped):
+            added_blocks.append(confirmed_block)
+            return confirmed_block != 3
+
+        node_subscriber._prepare_new_block = mock_prepare_new_block
+        node_subscriber._add_new_block = mock_add_new_block
+        blocks = [{"block": {"height": height}, "confirm_info": ""} for height in range(1, 6)]
+
+        try:
+            await node_subscriber.node_ws_PublishNewBlocks(blocks=blocks)
+        finally:
+            channel_service = ObjectManager().channel_service
+            ObjectManager().channel_service = None
+
+        assert added_blocks == [1, 2, 3]
+        assert channel_service.reset_block_monitoring_timer.called
+
     @pytest.mark.skip(reason="Tested in TimerService")
     async def test_node_ws_PublishHeartbeat(self):
         pass
@@ -0,0 +1,50 @@
+import pytest
+
+from loopchain import configure as conf
+from loopchain.baseservice import PeerHealth
+
+
+@pytest.fixture(autouse=True)
+def clear_peers(mocker):
+    mocker.patch.object(PeerHealth, "_peers", {})
+    mocker.patch.object(conf, "PEER_HEALTH_EWMA_WEIGHT", 0.5)
+
+
+def test_peer_health_is_shared_by_target():
+    assert PeerHealth.of("target:0") is PeerHealth.of("target:0")
+    assert PeerHealth.of("target:0") is not PeerHealth.of("target:1")
+
+
+def test_record_calls():
+    health = PeerHealth.of("target:0")
+    assert health.latency is None
+    assert health.score == 0
+
+    health.record_success(1.0)
+    health.record_success(2.0)
+    assert health.latency == 1.5
+
+    health.record_failure()
+    assert health.failure_rate == 0.5
+    assert health.score == 1.5 + 0.5 * conf.GRPC_TIMEOUT
+
+    health.record_success(1.5)
+    assert health.failure_rate == 0.25
+
+
+def test_sort_targets_from_the_healthiest():
+    PeerHealth.of("slow").record_success(3.0)
+    PeerHealth.of("fast").record_success(0.1)
+    PeerHealth.of("failed").record_success(0.1)
+    PeerHealth.of("failed").record_failure()
+
+    assert PeerHealth.sort_targets(["failed", "slow", "new", "fast"]) == ["new", "fast", "slow", "failed"]
+
+
+def test_remove_health_of_old_targets():
+    PeerHealth.of("old").record_failure()
+    PeerHealth.of("current").record_success(0.1)
+
+    PeerHealth.remove(["old", "unknown"])
+    assert set(PeerHealth._peers) == {"current"}
+    assert PeerHealth.of("old").failure_rate == 0
@@ -204,6 +204,17 @@ class TestTransactionSerializer_v3:
 
         assert tx == tx_restored
 
+    def test_trusted_tx_equals_deserialized_tx(self, tx_factory: TxFactory):
+        tx: Transaction = tx_factory(self.tx_version)
+        ts = TransactionSerializer.new(version=tx.version, type_=tx.type(), versioner=tx_versioner)
+
+        full_data = ts.to_full_data(tx)
+        db_data = ts.to_db_data(tx)
+
+        assert ts.from_trusted(full_data) == ts.from_(full_data)
+        assert ts.from_trusted(db_data, tx.hash.hex()) == tx
+        assert ts.from_trusted(db_data) == tx
+
     def test_get_hash(self, tx_factory: TxFactory):
         tx: Transaction = tx_factory(self.tx_version)
         ts = TransactionSerializer.new(version=tx.version, type_=tx.type(), versioner=tx_versioner)
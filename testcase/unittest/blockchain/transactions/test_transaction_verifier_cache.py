@@ -100,6 +100,28 @@ class TestTxCache:
             verify_func(tx)
             assert not tv.exceptions
 
+    def test_verify_signatures_caches_results(self, tx_version, tx_factory: TxFactory):
+        """Check that bulk signature verification caches its result to each tx"""
+        txs = [tx_factory(tx_version) for _ in range(3)]
+        object.__setattr__(txs[1], "signature", Signature.new())
+
+        TransactionVerifier.verify_signatures(txs, tx_versioner)
+
+        assert getattr(txs[0], "_cache_verify_signature") is True
+        assert isinstance(getattr(txs[1], "_cache_verify_signature"), TransactionInvalidSignatureError)
+        assert getattr(txs[2], "_cache_verify_signature") is True
+
+    def test_verify_many_returns_result_of_each_tx(self, tx_version, tx_factory: TxFactory):
+        """Check that bulk verification reports exceptions tx by tx"""
+        txs = [tx_factory(tx_version) for _ in range(3)]
+        object.__setattr__(txs[2], "signature", Signature.new())
+
+        results = TransactionVerifier.verify_many(txs, tx_versioner)
+
+        assert results[0] is None
+        assert results[1] is None
+        assert isinstance(results[2], TransactionInvalidSignatureError)
+
     @pytest.mark.parametrize("tag", ["before_cache", "after_cache"])
     @pytest.mark.parametrize("target_attr", ["hash", "signature"])
     def test_benchmark_verify(self, benchmark, tx_version, tx_factory: TxFactory, target_attr, tag):
@@ -201,6 +201,69 @@ class TestAgingCache(unittest.TestCase):
         self.assertEqual(len(cache), 10)
         self.assertEqual(item_count, 0)
 
+    def test_aging_cache_status_index(self):
+        # GIVEN
+        cache = AgingCache(max_age_seconds=5)
+        for i in range(10):
+            cache[i] = f"value_{i}"
+
+        # WHEN
+        cache.set_item_status(0, "Some Status")
+        del cache[1]
+        cache.pop(2)
+        cache[3] = "value_3_updated"
+
+        # THEN
+        self.assertEqual(cache.count_in_status(AgingCache.DEFAULT_ITEM_STATUS), 7)
+        self.assertEqual(cache.count_in_status("Some Status"), 1)
+        self.assertEqual(cache.get_item_in_status(AgingCache.DEFAULT_ITEM_STATUS, "Some Status"), "value_4")
+        self.assertEqual(cache.pop_item_in_status("Some Status").value, "value_0")
+        self.assertEqual(cache.pop_item_in_status("Some Status").value, "value_4")
+        self.assertTrue(cache.is_empty_in_status("Some Status"))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(cache.is_empty_in_status(AgingCache.DEFAULT_ITEM_STATUS))
+
+    def test_aging_cache_expire_in_bulk(self):
+        # GIVEN
+        cache = AgingCache(max_age_seconds=3)
+        for i in range(10):
+            cache[i] = f"value_{i}"
+        time.sleep(2)
+        cache[5] = "value_5_updated"
+
+        # WHEN
+        time.sleep(1.5)
+        cache["aaa"] = "AAA"
+
+        # THEN
+        self.assertEqual(list(cache), [5, "aaa"])
+        self.assertEqual(cache.count_in_status(AgingCache.DEFAULT_ITEM_STATUS), 2)
+
+        memory_status = cache.get_memory_status()
+        self.assertEqual(memory_status["items"], 2)
+        self.assertGreater(memory_status["status_index_bytes"], 0)
+        self.assertEqual(memory_status["overhead_bytes"],
+                         memory_status["items_bytes"] + memory_status["status_index_bytes"])
+
+    def test_aging_cache_expire_after_access(self):
+        # GIVEN
+        cache = AgingCache(max_age_seconds=3)
+        for i in range(3):
+            cache[i] = f"value_{i}"
+        time.sleep(2)
+        cache[3] = "value_3"
+
+        # WHEN
+        self.assertEqual(cache[0], "value_0")
+        time.sleep(1.5)
+        cache["aaa"] = "AAA"
+
+        # THEN
+        self.assertEqual(list(cache), [3, "aaa"])
+        self.assertEqual(cache.count_in_status(AgingCache.DEFAULT_ITEM_STATUS), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
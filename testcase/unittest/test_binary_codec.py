@@ -0,0 +1,66 @@
+import base64
+import json
+import os
+
+import pytest
+
+from loopchain.store import binary_codec
+
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, -1, 255, -256, 10 ** 30, 1.5,
+    "", "text", "0x", "0x1", "0x01", "0xAB", "ab", "ab==", "aQ==", "한글",
+    "0x" + os.urandom(32).hex(), os.urandom(32).hex(),
+    "hx" + os.urandom(20).hex(), "cx" + os.urandom(20).hex(),
+    base64.b64encode(os.urandom(65)).decode(),
+    [1, [2, {}]], {"a": {"b": [1, "0x1234"]}}
+])
+def test_dumps_and_loads(value):
+    assert binary_codec.loads(binary_codec.dumps(value)) == value
+
+
+@pytest.fixture
+def tx_info():
+    return {
+        "block_hash": os.urandom(32).hex(),
+        "block_height": 10,
+        "tx_index": "0x0",
+        "transaction": {
+            "version": "0x3",
+            "from": "hx" + os.urandom(20).hex(),
+            "signature": base64.b64encode(os.urandom(65)).decode(),
+            "txHash": "0x" + os.urandom(32).hex(),
+        },
+        "result": {"status": "0x1", "failure": None}
+    }
+
+
+def test_only_dict_is_field_indexed(tx_info):
+    assert binary_codec.is_binary(binary_codec.dumps(tx_info))
+    assert binary_codec.dumps([tx_info]) == json.dumps([tx_info]).encode()
+
+
+def test_not_supported_format_version(tx_info):
+    dumped = bytearray(binary_codec.dumps(tx_info))
+    dumped[1] = binary_codec.FORMAT_VERSION + 1
+    with pytest.raises(binary_codec.BinaryCodecError):
+        binary_codec.loads(dumped)
+
+
+@pytest.mark.parametrize("dumps", [binary_codec.dumps, lambda value: json.dumps(value).encode()])
+def test_loads_field(tx_info, dumps):
+    dumped = dumps(tx_info)
+
+    assert binary_codec.loads(dumped) == tx_info
+    assert binary_codec.loads_field(dumped, "result") == tx_info["result"]
+    assert binary_codec.loads_field(dumped, "transaction", "from") == tx_info["transaction"]["from"]
+    with pytest.raises(KeyError):
+        binary_codec.loads_field(dumped, "not_exist")
+
+
+@pytest.mark.parametrize("dumps", [binary_codec.dumps, lambda value: json.dumps(value).encode()])
+def test_loads_except(tx_info, dumps):
+    dumped = dumps(tx_info)
+
+    loaded = binary_codec.loads_except(dumped, "transaction", "result", "not_exist")
+    assert loaded == {"block_hash": tx_info["block_hash"], "block_height": 10, "tx_index": "0x0"}
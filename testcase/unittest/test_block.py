@@ -31,11 +31,12 @@ from loopchain import utils
 from loopchain.baseservice import ObjectManager
 from loopchain.blockchain import InvalidBlock
 from loopchain.crypto.signature import Signer
+from loopchain.store import binary_codec
 from testcase.unittest.mock_peer import set_mock
 
 sys.path.append('../')
 from loopchain.blockchain.types import Hash32, ExternalAddress
-from loopchain.blockchain.blocks import Block, BlockBuilder, BlockVerifier, BlockSerializer, BlockProver, BlockProverType
+from loopchain.blockchain.blocks import Block, LazyBlock, BlockBuilder, BlockVerifier, BlockSerializer, BlockProver, BlockProverType
 from loopchain.blockchain.transactions import TransactionBuilder, TransactionSerializer, TransactionVersioner
 from loopchain.blockchain.votes.v0_3 import BlockVotes, BlockVote
 
@@ -281,6 +282,22 @@ class TestBlock(unittest.TestCase):
         assert block.header == block_deserialized.header
         assert block.body == block_deserialized.body
 
+        block_serialized_modified = block_serializer.serialize(block)
+        block_serialized_modified["transactions"][0]["from"] = "hx" + "0" * 40
+        assert block_serializer.serialize(block) == block_serialized
+        assert block_serializer.dumps(block) is block_serializer.dumps(block)
+        assert json.loads(block_serializer.dumps(block)) == block_serialized
+        assert len(BlockSerializer._dumped_blocks) <= conf.MAX_DUMPED_BLOCK_CACHE_SIZE
+
+        block_dumped = binary_codec.dumps(block_serialized)
+        header_dumped = binary_codec.loads_except(block_dumped, *block_serializer.body_keys)
+        lazy_block = LazyBlock(block_serializer.deserialize_header(header_dumped),
+                               lambda: block_serializer.deserialize_body(binary_codec.loads(block_dumped)))
+        assert lazy_block.header == block.header
+        assert not lazy_block.is_body_loaded
+        assert block == lazy_block
+        assert lazy_block.is_body_loaded
+
         tx_hashes = list(block.body.transactions)
         tx_index = random.randrange(0, len(tx_hashes))
 
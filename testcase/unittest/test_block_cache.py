@@ -0,0 +1,72 @@
+import os
+from collections import namedtuple
+
+import pytest
+
+from loopchain.blockchain.block_cache import BlockCache
+from loopchain.blockchain.types import Hash32
+
+Header = namedtuple("Header", "hash height")
+Block = namedtuple("Block", "header")
+
+
+def make_block(height):
+    return Block(Header(Hash32(os.urandom(32)), height))
+
+
+@pytest.fixture
+def blocks():
+    return [make_block(height) for height in range(5)]
+
+
+def test_get_by_hash_and_height(blocks):
+    cache = BlockCache(max_size=10)
+    for block in blocks:
+        cache.put(block)
+
+    for block in blocks:
+        assert cache.get_by_hash(block.header.hash.hex()) is block
+        assert cache.get_by_height(block.header.height) is block
+    assert cache.get_by_height(len(blocks)) is None
+
+    status = cache.get_status()
+    assert status["hit"] == len(blocks) * 2
+    assert status["miss"] == 1
+
+
+def test_evict_least_recently_used(blocks):
+    cache = BlockCache(max_size=3)
+    for block in blocks[:3]:
+        cache.put(block)
+
+    assert cache.get_by_height(0) is blocks[0]
+    cache.put(blocks[3])
+
+    assert len(cache) == 3
+    assert cache.get_by_height(1) is None
+    assert cache.get_by_hash(blocks[1].header.hash.hex()) is None
+    assert cache.get_by_height(0) is blocks[0]
+
+
+def test_remove_from_height(blocks):
+    cache = BlockCache(max_size=10)
+    for block in blocks:
+        cache.put(block)
+
+    cache.remove_from_height(3)
+
+    assert len(cache) == 3
+    assert cache.get_by_height(2) is blocks[2]
+    assert cache.get_by_height(3) is None
+    assert cache.get_by_hash(blocks[4].header.hash.hex()) is None
+
+
+def test_replace_block_of_same_height(blocks):
+    cache = BlockCache(max_size=10)
+    cache.put(blocks[0])
+    other_block = make_block(0)
+    cache.put(other_block)
+
+    assert len(cache) == 1
+    assert cache.get_by_height(0) is other_block
+    assert cache.get_by_hash(blocks[0].header.hash.hex()) is None
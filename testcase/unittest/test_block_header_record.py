@@ -0,0 +1,33 @@
+import os
+from collections import namedtuple
+
+import pytest
+
+from loopchain.blockchain.block_header_record import BlockHeaderRecord
+from loopchain.blockchain.types import Hash32, ExternalAddress
+
+Header = namedtuple("Header", "hash prev_hash height timestamp peer_id")
+Body = namedtuple("Body", "transactions")
+Block = namedtuple("Block", "header body")
+
+
+@pytest.mark.parametrize("height", [0, 1, 10 ** 9])
+def test_dumps_and_loads(height):
+    header = Header(Hash32(os.urandom(32)), Hash32(os.urandom(32)), height, 1560000000000000, ExternalAddress.new())
+    block = Block(header, Body({Hash32(os.urandom(32)): None for _ in range(3)}))
+
+    record = BlockHeaderRecord.from_block(block)
+    record_dumped = record.dumps()
+
+    assert len(record_dumped) == BlockHeaderRecord.size
+    assert BlockHeaderRecord.loads(height, record_dumped) == record
+    assert record.tx_count == 3
+
+
+def test_genesis_block_without_prev_hash_and_peer_id():
+    header = Header(Hash32(os.urandom(32)), None, 0, 1560000000000000, None)
+    record = BlockHeaderRecord.from_block(Block(header, Body({})))
+
+    record_loaded = BlockHeaderRecord.loads(0, record.dumps())
+    assert record_loaded.prev_hash == Hash32.empty()
+    assert record_loaded.peer_id == ExternalAddress.empty()
@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+
+from loopchain.peer.block_sync_pipeline import BlockRequestPipeline
+
+
+def make_peer_stubs(count):
+    return [(f"peer{index}", f"stub{index}") for index in range(count)]
+
+
+class RequestRecorder:
+    def __init__(self, max_response_count=None):
+        self.requests = []
+        self.max_response_count = max_response_count
+        self._lock = threading.Lock()
+
+    def __call__(self, peer_stub, from_height, count):
+        with self._lock:
+            self.requests.append((peer_stub, from_height, count))
+        count = min(count, self.max_response_count or count)
+        return [(peer_stub, height) for height in range(from_height, from_height + count)]
+
+
+def test_request_window_in_round_robin():
+    recorder = RequestRecorder()
+
+    with BlockRequestPipeline(recorder, make_peer_stubs(3), window_size=4) as pipeline:
+        pipeline.request(1, 100)
+        for height in range(1, 5):
+            peer_target, future = pipeline.pop(height)
+            assert peer_target == f"peer{(height - 1) % 3}"
+            assert future.result() == (f"stub{(height - 1) % 3}", height)
+
+    assert sorted(recorder.requests, key=lambda request: request[1]) == [
+        (f"stub{(height - 1) % 3}", height, 1) for height in range(1, 5)
+    ]
+
+
+def test_max_height_is_requested_only_as_next_block():
+    with BlockRequestPipeline(RequestRecorder(), make_peer_stubs(2), window_size=10) as pipeline:
+        pipeline.request(1, 3)
+        assert sorted(pipeline._requests) == [1, 2]
+
+        pipeline.pop(1)
+        pipeline.pop(2)
+        pipeline.request(3, 3)
+        assert sorted(pipeline._requests) == [3]
+
+
+def test_retry_to_next_peer():
+    with BlockRequestPipeline(RequestRecorder(), make_peer_stubs(3), window_size=1) as pipeline:
+        pipeline.request(1, 10)
+        peer_target, _ = pipeline.pop(1)
+        assert peer_target == "peer0"
+
+        pipeline.retry(1, peer_target)
+        peer_target, future = pipeline.pop(1)
+        assert peer_target == "peer1"
+        assert future.result() == ("stub1", 1)
+
+
+def test_batch_request():
+    with BlockRequestPipeline(RequestRecorder(max_response_count=3), make_peer_stubs(2), window_size=2, batch_size=5) as pipeline:
+        pipeline.request(1, 100)
+        assert sorted((from_height, count) for from_height, (_, count, _) in pipeline._requests.items()) == [
+            (1, 5), (6, 5)
+        ]
+
+        for height in range(1, 4):
+            _, future = pipeline.pop(height)
+            assert future.result() == ("stub0", height)
+
+        # heights 4 and 5 are not in the response, so they are requested again.
+        pipeline.request(4, 100)
+        assert pipeline._requests[4][1] == 2
+        _, future = pipeline.pop(4)
+        assert future.result()[1] == 4
+
+
+def test_failed_request():
+    def request_func(peer_stub, from_height, count):
+        raise ConnectionError
+
+    with BlockRequestPipeline(request_func, make_peer_stubs(2), window_size=2, batch_size=2) as pipeline:
+        pipeline.request(1, 100)
+        _, future = pipeline.pop(1)
+        with pytest.raises(ConnectionError):
+            future.result()
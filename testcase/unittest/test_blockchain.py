@@ -118,22 +118,30 @@ class TestBlockChain(unittest.TestCase):
         :return:
         """
         # GIVEN
-        for i in range(201):
-            self.chain.add_tx_to_list_by_address("ABC", "112233_" + str(i))
+        address = "hx" + os.urandom(20).hex()
+        tx_hashes = [os.urandom(32).hex() for _ in range(201)]
+        for i, tx_hash in enumerate(tx_hashes):
+            self.chain.add_tx_to_list_by_address(address, tx_hash, block_height=i // 10 + 1, tx_index=i % 10)
 
         # WHEN
-        current_tx_list, last_list_index = self.chain.get_tx_list_by_address("ABC")
+        current_tx_list, next_index = self.chain.get_tx_list_by_address(address)
         util.logger.spam(f"test_get_current_tx_list_by_address "
-                         f"length of tx_list({len(current_tx_list)}) next_index({last_list_index})")
+                         f"length of tx_list({len(current_tx_list)}) next_index({next_index})")
 
-        oldest_tx_list, first_index = self.chain.get_tx_list_by_address("ABC", 1)
+        # a new tx does not shift the next pages.
+        self.chain.add_tx_to_list_by_address(address, os.urandom(32).hex(), block_height=22, tx_index=0)
+        second_tx_list, second_index = self.chain.get_tx_list_by_address(address, next_index)
+        oldest_tx_list, last_index = self.chain.get_tx_list_by_address(address, second_index)
         util.logger.spam(f"test_get_oldest_tx_list_by_address "
-                         f"length of tx_list({len(oldest_tx_list)}) next_index({first_index})")
+                         f"length of tx_list({len(oldest_tx_list)}) next_index({last_index})")
 
         # THEN
-        self.assertEqual(first_index, 0)
-        self.assertEqual(last_list_index, 2)
-        self.assertEqual(len(oldest_tx_list), conf.MAX_TX_LIST_SIZE_BY_ADDRESS + 1)
+        page_size = conf.MAX_TX_LIST_SIZE_BY_ADDRESS
+        self.assertNotEqual(next_index, 0)
+        self.assertEqual(current_tx_list[:-1], tx_hashes[::-1][:page_size])
+        self.assertEqual(second_tx_list[:-1], tx_hashes[::-1][page_size:page_size * 2])
+        self.assertEqual(last_index, 0)
+        self.assertEqual(oldest_tx_list, [tx_hashes[0], 0])
 
     def test_find_block_by_height(self):
         # GIVEN
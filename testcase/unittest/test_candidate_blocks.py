@@ -16,12 +16,16 @@
 # limitations under the License.
 """Test Candidate Blocks"""
 
+import os
 import unittest
+from types import SimpleNamespace
 
 import loopchain.utils as util
 import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
 from loopchain.blockchain import CandidateBlock, CandidateBlocks, BlockChain, ExternalAddress
 from loopchain.blockchain.blocks import BlockBuilder
+from loopchain.blockchain.types import Hash32
 from loopchain.blockchain.transactions import TransactionVersioner
 from loopchain.utils import loggers
 
@@ -37,10 +41,11 @@ class TestCandidateBlocks(unittest.TestCase):
         pass
 
     @staticmethod
-    def __get_test_block():
+    def __get_test_block(timestamp: int = None):
         block_builder = BlockBuilder.new("0.1a", TransactionVersioner())
         block_builder.height = 0
         block_builder.prev_hash = None
+        block_builder.fixed_timestamp = timestamp
         block = block_builder.build()  # It does not have commit state. It will be rebuilt.
         return block
 
@@ -96,6 +101,31 @@ class TestCandidateBlocks(unittest.TestCase):
         # THEN
         self.assertFalse(block.header.hash in candidate_blocks.blocks)
 
+    def test_remove_siblings_and_expired_blocks(self):
+        # GIVEN
+        blocks = [self.__get_test_block(timestamp) for timestamp in range(1, 4)]
+        candidate_blocks = CandidateBlocks(SimpleNamespace(block_height=-1))
+        for block in blocks[:2]:
+            candidate_blocks.add_block(block, [ExternalAddress.empty()])
+        hash_only_block_hash = Hash32(os.urandom(Hash32.size))
+        candidate_blocks.add_vote(SimpleNamespace(block_hash=hash_only_block_hash, block_height=5, round=0))
+
+        # WHEN the hash only candidate is expired and a block is removed
+        expired_time = util.get_time_stamp() - (conf.CANDIDATE_BLOCK_TIMEOUT + 1) * 1_000_000
+        candidate_blocks.blocks[hash_only_block_hash].start_time = expired_time
+        candidate_blocks.remove_block(blocks[0].header.hash)
+
+        # THEN the siblings which have the same prev_hash and the expired candidate are removed
+        self.assertEqual(candidate_blocks.blocks, {})
+        self.assertEqual(candidate_blocks._hashes_by_height, {})
+        self.assertEqual(candidate_blocks._hashes_by_prev_hash, {})
+
+        # WHEN add a block after removal
+        candidate_blocks.add_block(blocks[2], [ExternalAddress.empty()])
+
+        # THEN
+        self.assertEqual(list(candidate_blocks.blocks), [blocks[2].header.hash])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,88 @@
+import os
+import threading
+from collections import namedtuple
+
+import pytest
+
+from loopchain import configure as conf
+from loopchain.blockchain.types import Hash32
+from loopchain.channel import channel_inner_service
+from loopchain.channel.channel_inner_service import ChannelInnerTask
+
+Header = namedtuple("Header", "hash height version")
+Block = namedtuple("Block", "header")
+
+BLOCK_JSON_SIZE = 100
+CONFIRM_INFO = b"0123456789"
+
+
+class _Blockchain:
+    def __init__(self, block_height):
+        self.block_height = block_height
+        self.tx_versioner = None
+        self.blocks = [Block(Header(Hash32(os.urandom(32)), height, "0.3")) for height in range(block_height + 1)]
+        self.read_threads = set()
+        self.cache_blocks = []
+
+    def find_block_by_height(self, block_height, cache_block=True):
+        self.read_threads.add(threading.get_ident())
+        self.cache_blocks.append(cache_block)
+        return self.blocks[block_height]
+
+    def find_confirm_info_by_hash(self, block_hash):
+        self.read_threads.add(threading.get_ident())
+        return CONFIRM_INFO
+
+
+@pytest.fixture
+def inner_task(mocker):
+    task = ChannelInnerTask(mocker.MagicMock())
+    task._blockchain = _Blockchain(block_height=10)
+    return task
+
+
+@pytest.fixture
+def serialize_threads(mocker):
+    threads = set()
+
+    def dumps(block):
+        threads.add(threading.get_ident())
+        return b"0" * BLOCK_JSON_SIZE
+
+    block_serializer = mocker.patch.object(channel_inner_service, "BlockSerializer")
+    block_serializer.new.return_value.dumps.side_effect = dumps
+    return threads
+
+
+@pytest.mark.asyncio
+class TestAnnounceBlocks:
+    async def test_batch_is_read_on_loop_and_serialized_in_executor(self, inner_task, serialize_threads):
+        # GIVEN
+        max_bytes = 3 * (BLOCK_JSON_SIZE + len(CONFIRM_INFO))
+
+        # WHEN
+        new_blocks = await inner_task._ChannelInnerTask__find_blocks_to_announce(2, "citizen", 5, max_bytes)
+
+        # THEN
+        assert new_blocks == [("0" * BLOCK_JSON_SIZE, CONFIRM_INFO)] * 3
+        assert inner_task._blockchain.read_threads == {threading.get_ident()}
+        assert threading.get_ident() not in serialize_threads
+        assert not any(inner_task._blockchain.cache_blocks)
+
+    async def test_batch_stops_at_last_block(self, inner_task, serialize_threads):
+        new_blocks = await inner_task._ChannelInnerTask__find_blocks_to_announce(
+            8, "citizen", conf.SUBSCRIBE_CATCH_UP_MAX_COUNT, conf.SUBSCRIBE_CATCH_UP_MAX_BYTES)
+
+        assert len(new_blocks) == 2
+
+    async def test_batch_has_a_block_larger_than_max_bytes(self, inner_task, serialize_threads):
+        new_blocks = await inner_task._ChannelInnerTask__find_blocks_to_announce(2, "citizen", 5, 1)
+
+        assert len(new_blocks) == 1
+
+    async def test_single_block_is_serialized_on_loop(self, inner_task, serialize_threads):
+        new_blocks = await inner_task._ChannelInnerTask__find_blocks_to_announce(2, "citizen", 1, 0)
+
+        assert len(new_blocks) == 1
+        assert serialize_threads == {threading.get_ident()}
+        assert inner_task._blockchain.cache_blocks == [True]
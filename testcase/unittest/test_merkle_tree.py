@@ -0,0 +1,64 @@
+import hashlib
+import os
+
+import pytest
+
+from loopchain.blockchain.merkle import MerkleTree
+
+
+def make_root_from_scratch(leaves):
+    level = list(leaves)
+    while len(level) > 1:
+        next_level = [hashlib.sha3_256(l + r).digest() for l, r in zip(level[0::2], level[1::2])]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0]
+
+
+@pytest.mark.parametrize("leaf_count", [1, 2, 3, 4, 5, 7, 8, 9, 33])
+class TestMerkleTree:
+    def test_append_leaf_updates_root(self, leaf_count):
+        leaves = [os.urandom(32) for _ in range(leaf_count)]
+        tree = MerkleTree()
+
+        for index, leaf in enumerate(leaves):
+            tree.add_leaf(leaf)
+            assert tree.get_merkle_root() == make_root_from_scratch(leaves[:index + 1])
+
+    def test_proof(self, leaf_count):
+        leaves = [os.urandom(32) for _ in range(leaf_count)]
+        tree = MerkleTree()
+        tree.add_leaf(leaves)
+        tree.make_tree()
+
+        for index, leaf in enumerate(leaves):
+            proof = tree.get_proof(index)
+            assert MerkleTree.validate_proof(proof, leaf, tree.get_merkle_root())
+
+    def test_dumps_and_loads(self, leaf_count):
+        leaves = [os.urandom(32) for _ in range(leaf_count)]
+        tree = MerkleTree()
+        tree.add_leaf(leaves)
+
+        loaded_tree = MerkleTree.loads(tree.dumps())
+        assert loaded_tree.get_merkle_root() == tree.get_merkle_root()
+        assert loaded_tree.leaves == leaves
+        for index in range(leaf_count):
+            assert loaded_tree.get_proof(index) == tree.get_proof(index)
+
+
+def test_empty_tree():
+    tree = MerkleTree()
+    tree.make_tree()
+
+    assert tree.get_merkle_root() is None
+    assert tree.get_proof(0) is None
+    assert MerkleTree.loads(tree.dumps()).get_leaf_count() == 0
+
+
+def test_invalid_leaf_size():
+    tree = MerkleTree()
+
+    with pytest.raises(ValueError):
+        tree.add_leaf(b"not a hash")
@@ -0,0 +1,38 @@
+import os
+
+from loopchain.blockchain.preps_cache import PrepsCache
+from loopchain.blockchain.types import Hash32, ExternalAddress
+
+
+def make_preps(count):
+    return [{"id": ExternalAddress(os.urandom(ExternalAddress.size)).hex_hx(), "p2pEndpoint": f"127.0.0.1:{7100 + i}"}
+            for i in range(count)]
+
+
+def test_put_and_get():
+    cache = PrepsCache(max_size=2)
+    roothash = Hash32(os.urandom(32))
+    preps = make_preps(3)
+
+    cache.put(roothash, preps)
+    cached = cache.get(roothash)
+
+    assert cached.ids == tuple(prep["id"] for prep in preps)
+    assert [address.hex_hx() for address in cached.addresses] == list(cached.ids)
+    assert cached.addresses.index(ExternalAddress.fromhex(preps[2]["id"])) == 2
+    assert cached.targets[preps[1]["id"]] == preps[1]["p2pEndpoint"]
+    assert [dict(prep) for prep in cached.preps] == preps
+
+
+def test_evict_and_remove():
+    cache = PrepsCache(max_size=2)
+    roothashes = [Hash32(os.urandom(32)) for _ in range(3)]
+    for roothash in roothashes:
+        cache.put(roothash, make_preps(1))
+
+    assert len(cache) == 2
+    assert cache.get(roothashes[0]) is None
+
+    cache.remove(roothashes[1])
+    assert cache.get(roothashes[1]) is None
+    assert cache.get(roothashes[2]) is not None
@@ -2,13 +2,15 @@ import unittest
 import os
 import random
 import tempfile
+from unittest import mock
 from asn1crypto import keys
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from loopchain import configure as conf
 from loopchain.utils import loggers
 from loopchain.crypto.cert_serializers import DerSerializer, PemSerializer
-from loopchain.crypto.signature import Signer, SignVerifier, long_to_bytes
+from loopchain.crypto.signature import Signer, SignVerifier, SignatureCache, long_to_bytes
 from testcase.unittest import test_util
 
 loggers.set_preset_type(loggers.PresetType.develop)
@@ -264,6 +266,48 @@ class TestSignature(unittest.TestCase):
         self.assertEquals(self.sign_verifier_public_key_bytes.address, self.sign_verifier_public_key_der.address)
         self.assertEquals(self.sign_verifier_public_key_bytes.address, self.sign_verifier_public_key_pem.address)
 
+    def test_verified_signature_cache(self):
+        hash_data = os.urandom(32)
+        signature = self.signer_private_key_bytes.sign_hash(hash_data)
+
+        cache = SignVerifier.get_cache()
+        cache.clear()
+        self.sign_verifier_public_key_bytes.verify_hash(hash_data, signature)
+        self.sign_verifier_public_key_der.verify_hash(hash_data, signature)
+        self.assertEqual(cache.get_status()["miss"], 1)
+        self.assertEqual(cache.get_status()["hit"], 1)
+
+        other_verifier = SignVerifier.from_address(Signer.new().address)
+        self.assertRaises(RuntimeError, lambda: other_verifier.verify_hash(hash_data, signature))
+        self.assertEqual(cache.get_status()["hit"], 2)
+
+    def test_verify_hash_many_caches_mismatched_address(self):
+        hashes = [os.urandom(32) for _ in range(2)]
+        signatures = [self.signer_private_key_bytes.sign_hash(hash_data) for hash_data in hashes]
+        other_address = Signer.new().address
+
+        cache = SignVerifier.get_cache()
+        cache.clear()
+        self.sign_verifier_public_key_bytes.verify_hash(hashes[0], signatures[0])
+
+        items = [(other_address, hash_data, signature) for hash_data, signature in zip(hashes, signatures)]
+        with mock.patch.object(conf, "SIGNATURE_VERIFY_WORKERS", 2):
+            errors = SignVerifier.verify_hash_many(items, pool_threshold=2)
+
+        self.assertTrue(all(errors))
+        self.assertEqual(cache.get(hashes[1], signatures[1]), self.signer_private_key_bytes.address)
+
+    def test_signature_cache_size(self):
+        cache = SignatureCache(max_size=2)
+        keys = [(os.urandom(32), os.urandom(65)) for _ in range(3)]
+        for hash_data, signature in keys:
+            cache.put(hash_data, signature, "hx" + os.urandom(20).hex())
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(*keys[0]))
+        self.assertIsNotNone(cache.get(*keys[2]))
+        self.assertEqual(cache.get_status()["hit_rate"], 0.5)
+
     def test_signer_from_pubkey(self):
         self.assertRaises(TypeError, lambda: Signer.from_pubkey(self.public_key_bytes))
         self.assertRaises(TypeError, lambda: Signer.from_pubkey_file(self.public_der_path))
@@ -0,0 +1,80 @@
+import os
+import pickle
+
+import pytest
+
+from loopchain.blockchain import types
+from loopchain.blockchain.types import Hash32, ExternalAddress, ContractAddress, Address, Signature, Reps
+
+
+def test_memoized_hex_equals_bytes_hex():
+    hash_ = Hash32(os.urandom(32))
+
+    assert hash_.hex() == bytes(hash_).hex()
+    assert hash_.hex_0x() == "0x" + bytes(hash_).hex()
+    assert hash_.hex_xx() is hash_.hex_0x()
+    assert hash_.hex(":") == bytes(hash_).hex(":")
+    assert hash_.hex(sep=":", bytes_per_sep=2) == bytes(hash_).hex(sep=":", bytes_per_sep=2)
+    assert hash_.hex() == bytes(hash_).hex()
+
+    hash_unpickled = pickle.loads(pickle.dumps(hash_))
+    assert hash_unpickled == hash_
+    assert type(hash_unpickled) is Hash32
+    assert hash_unpickled.hex_0x() == hash_.hex_0x()
+    assert len(pickle.dumps(hash_)) == len(pickle.dumps(Hash32(bytes(hash_))))
+
+
+def test_memoized_base64str():
+    signature = Signature(os.urandom(Signature.size))
+
+    assert signature.to_base64str() == signature.to_base64().decode()
+    assert Signature.from_base64str(signature.to_base64str()) == signature
+
+
+def test_interned_address():
+    address = ExternalAddress(os.urandom(ExternalAddress.size))
+    address_hex = address.hex_hx()
+    assert ExternalAddress.fromhex(address_hex) is not address
+
+    interned = Address.intern(address)
+    assert interned is address
+    assert Address.intern(ExternalAddress.fromhex(address_hex)) is address
+    assert ExternalAddress.fromhex(address_hex) is address
+    assert Address.fromhex_address(address_hex) is address
+    assert ExternalAddress.fromhex(address_hex[2:], ignore_prefix=True) is not address
+
+    contract_address = ContractAddress.fromhex("cx" + address_hex[2:])
+    assert contract_address == address
+    assert contract_address is not address
+
+
+def test_interned_addresses_are_evicted_in_lru_order(monkeypatch):
+    monkeypatch.setattr(types, "MAX_INTERNED_ADDRESSES", 3)
+    addresses = [ExternalAddress(os.urandom(ExternalAddress.size)) for _ in range(4)]
+    for address in addresses[:3]:
+        Address.intern(address)
+
+    Address.intern(ExternalAddress(bytes(addresses[0])))
+    Address.intern(addresses[3])
+
+    assert ExternalAddress.fromhex(addresses[0].hex_hx()) is addresses[0]
+    assert ExternalAddress.fromhex(addresses[1].hex_hx()) is not addresses[1]
+    assert ExternalAddress.fromhex(addresses[3].hex_hx()) is addresses[3]
+    assert len(types._interned_addresses) <= types.MAX_INTERNED_ADDRESSES
+
+
+def test_reps_index():
+    addresses = [ExternalAddress(os.urandom(ExternalAddress.size)) for _ in range(5)]
+    reps = Reps(addresses)
+
+    assert reps == tuple(addresses)
+    for index, address in enumerate(addresses):
+        assert reps.index(address) == index
+        assert address in reps
+
+    not_rep = ExternalAddress(os.urandom(ExternalAddress.size))
+    assert not_rep not in reps
+    with pytest.raises(ValueError):
+        reps.index(not_rep)
+
+    assert pickle.loads(pickle.dumps(reps)).index(addresses[3]) == 3
@@ -19,6 +19,7 @@ import hashlib
 import logging
 import os
 import unittest
+from unittest import mock
 
 import testcase.unittest.test_util as test_util
 from loopchain.blockchain.types import ExternalAddress, Hash32, Signature
@@ -45,6 +46,8 @@ class TestVote(unittest.TestCase):
         block_hash = Hash32(os.urandom(Hash32.size))
         block_vote = BlockVote.new(signer, 0, 0, 0, block_hash)
         block_vote.verify()
+        block_vote.serialize()
+        self.assertEqual({"rep", "timestamp", "block_height", "round_", "block_hash"}, set(block_vote.origin_args()))
 
         origin = f"icx_vote.blockHash.{block_vote.block_hash.hex_0x()}.blockHeight.{hex(block_vote.block_height)}."
         origin += f"rep.{block_vote.rep.hex_hx()}.round_.{block_vote.round_}.timestamp.{hex(block_vote.timestamp)}"
@@ -181,6 +184,23 @@ class TestVote(unittest.TestCase):
         duplicate_block_vote = BlockVote.new(self.signers[0], 0, 0, 0, Hash32.empty())
         self.assertRaises(votes.VoteDuplicateError, block_votes.add_vote, duplicate_block_vote)
 
+    def test_block_votes_verify_many(self):
+        block_hash = Hash32(os.urandom(Hash32.size))
+        block_votes = [BlockVote.new(signer, 0, 0, 0, block_hash) for signer in self.signers[:10]]
+        invalid_block_vote = BlockVote(rep=self.reps[10], timestamp=0, signature=Signature(os.urandom(65)),
+                                       block_height=0, round_=0, block_hash=block_hash)
+
+        BlockVote.verify_many(block_votes + [invalid_block_vote, None])
+
+        with mock.patch.object(vote.SignVerifier, "verify_hash", side_effect=AssertionError("Verified again")):
+            for block_vote in block_votes:
+                block_vote.verify()
+            self.assertRaises(RuntimeError, invalid_block_vote.verify)
+
+        block_vote = block_votes[0]
+        self.assertEqual(block_vote, BlockVote.deserialize(block_vote.serialize()))
+        self.assertEqual(block_vote.hash(), BlockVote.deserialize(block_vote.serialize()).hash())
+
     def test_leader_vote(self):
         signer = self.signers[0]
         leader_vote = LeaderVote.new(signer, 0, 0, 0, self.reps[0], self.reps[1])
@@ -318,6 +338,23 @@ class TestVote(unittest.TestCase):
         duplicate_leader_vote = LeaderVote.new(self.signers[0], 0, 0, 0, old_leader, self.reps[2])
         self.assertRaises(votes.VoteDuplicateError, leader_votes.add_vote, duplicate_leader_vote)
 
+    def test_leader_votes_tallies_after_deserialize(self):
+        ratio = 0.67
+        old_leader = self.reps[0]
+        leader_votes = LeaderVotes(self.reps, ratio, 0, 0, old_leader)
+        for i, signer in enumerate(self.signers[:80]):
+            new_leader = self.reps[1] if i % 4 else ExternalAddress.empty()
+            leader_votes.add_vote(LeaderVote.new(signer, 0, 0, 0, old_leader, new_leader))
+
+        votes_data = LeaderVotes.serialize_votes([vote for vote in leader_votes.votes if vote])
+        leader_votes_deserialized = LeaderVotes.deserialize(votes_data, ratio)
+
+        self.assertEqual(leader_votes_deserialized.get_majority(), [(self.reps[1], 60)])
+        self.assertEqual(leader_votes_deserialized.get_out_of_round(), 20)
+        self.assertEqual(leader_votes_deserialized.get_empty_count(), 0)
+        self.assertEqual(leader_votes_deserialized.get_result(), leader_votes.get_result())
+        self.assertEqual(leader_votes.get_empty_count(), len(self.reps) - 80)
+
 
 if __name__ == '__main__':
     unittest.main()